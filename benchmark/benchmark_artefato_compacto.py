@@ -0,0 +1,63 @@
+# compara o par joblib (sklearn) com o artefato compacto (numpy): inicialização a frio, velocidade e previsões.
+# executar a partir da raiz do projeto:  python -m benchmark.benchmark_artefato_compacto
+
+import subprocess
+import sys
+
+import joblib
+import pandas as pd
+
+import compact_model
+from benchmark.medicao import cronometrar
+from text_normalizer import normalize_many
+
+# cada código roda em um processo novo, medindo import + carregamento + primeira previsão
+CODIGO_JOBLIB = """
+import joblib
+from text_normalizer import normalize_many
+modelo = joblib.load('./to_predict/modelo_sentimento.joblib')
+vectorizer = joblib.load('./to_predict/vetorizador_tfidf.joblib')
+modelo.predict(vectorizer.transform(normalize_many(['produto chegou antes do prazo'])))
+"""
+
+CODIGO_COMPACTO = """
+import compact_model
+artefato = compact_model.carregar_artefato_compacto('{caminho}')
+compact_model.prever(artefato, ['produto chegou antes do prazo'])
+"""
+
+def inicializacao_a_frio(codigo):
+    _, tempo = cronometrar(subprocess.run, [sys.executable, '-W', 'ignore', '-c', codigo], check=True)
+    return tempo
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+    caminho_compacto = compact_model.CAMINHO_ARTEFATO_COMPACTO
+
+    try:
+        modelo = joblib.load('./to_predict/modelo_sentimento.joblib')
+        vectorizer = joblib.load('./to_predict/vetorizador_tfidf.joblib')
+        compact_model.exportar_artefato_compacto(modelo, vectorizer, caminho_compacto)
+        artefato = compact_model.carregar_artefato_compacto(caminho_compacto)
+
+        comentarios = pd.read_csv(caminho_arquivo, usecols=['review_comment_message'])['review_comment_message'].fillna('')
+
+        previsoes_sklearn, tempo_sklearn = cronometrar(
+            lambda: modelo.predict(vectorizer.transform(normalize_many(comentarios))), repeticoes=1)
+        previsoes_compacto, tempo_compacto = cronometrar(compact_model.prever, artefato, comentarios.tolist(),
+                                                         repeticoes=1)
+
+        divergencias = int((previsoes_sklearn != previsoes_compacto).sum())
+        print(f"\n{len(comentarios)} reviews | previsões divergentes: {divergencias}")
+        print(f"Classificação sklearn:   {tempo_sklearn:.3f}s")
+        print(f"Classificação compacta:  {tempo_compacto:.3f}s")
+
+        print("\nInicialização a frio (import + carregamento + 1 previsão):")
+        print(f"Par joblib (sklearn):    {inicializacao_a_frio(CODIGO_JOBLIB):.3f}s")
+        print(f"Artefato compacto:       {inicializacao_a_frio(CODIGO_COMPACTO.format(caminho=caminho_compacto)):.3f}s")
+        if divergencias:
+            sys.exit(1)
+
+    except FileNotFoundError as erro:
+        print(f"ERRO: Arquivo não encontrado: {erro.filename}")
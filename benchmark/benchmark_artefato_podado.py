@@ -0,0 +1,99 @@
+# compara o par joblib atual com o artefato compacto exportado com pesos em float16/int8 e com poda dos termos
+# de coeficiente pequeno: acurácia e recall da classe negativa (e a diferença para o par joblib), previsões
+# que mudaram, tamanho em disco e tempo de carregamento (+ 1 previsão).
+# o conjunto de teste é o mesmo do comparison.py (reviews sem nota 3, divisão 80/20 estratificada).
+# executar a partir da raiz do projeto:  python -m benchmark.benchmark_artefato_podado [csv]
+
+import contextlib
+import io
+import os
+import sys
+
+import joblib
+import pandas as pd
+from sklearn.metrics import accuracy_score, recall_score
+from sklearn.model_selection import train_test_split
+
+import compact_model
+from benchmark.medicao import cronometrar
+from text_normalizer import normalize_many
+
+DIRETORIO_ARTEFATOS = './.cache/benchmark'
+CAMINHO_MODELO = './to_predict/modelo_sentimento.joblib'
+CAMINHO_VETORIZADOR = './to_predict/vetorizador_tfidf.joblib'
+# (pesos, limiar de |coeficiente| para a poda)
+VARIANTES = [('float64', 0.0), ('float16', 0.0), ('int8', 0.0), ('int8', 0.05), ('int8', 0.1), ('int8', 0.25)]
+
+def tempo_carregamento(funcao):
+    _, tempo = cronometrar(funcao, repeticoes=5)
+    return tempo
+
+def carregar_par():
+    modelo, vectorizer = joblib.load(CAMINHO_MODELO), joblib.load(CAMINHO_VETORIZADOR)
+    modelo.predict(vectorizer.transform(normalize_many(['produto chegou antes do prazo'])))
+
+def carregar_compacto(caminho):
+    compact_model.prever(compact_model.carregar_artefato_compacto(caminho), ['produto chegou antes do prazo'])
+
+def textos_de_teste(caminho_arquivo):
+    # mesma divisão do comparison.py: as linhas e os rótulos na mesma ordem, com os mesmos parâmetros
+    from comparison import carregar_e_preparar_dados, PARAMETROS_DIVISAO
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = carregar_e_preparar_dados(caminho_arquivo)
+    y = (df['sentimento'] == 'positivo').astype(int)
+    _, textos, _, y_test = train_test_split(df['review_comment_message'].fillna(''), y, stratify=y, **PARAMETROS_DIVISAO)
+    return textos.tolist(), y_test.to_numpy()
+
+def linha_resultado(nome, termos, tamanho, tempo, previsoes, y_test, referencia=None):
+    resultado = {
+        'Artefato': nome,
+        'Termos': termos,
+        'Tamanho (KB)': tamanho / 1024,
+        'Carregamento (ms)': tempo * 1000,
+        'Acurácia': accuracy_score(y_test, previsoes),
+        'Recall (Negativo)': recall_score(y_test, previsoes, pos_label=0),
+    }
+    if referencia is not None:
+        resultado['Δ Acurácia'] = resultado['Acurácia'] - referencia['Acurácia']
+        resultado['Δ Recall (Negativo)'] = resultado['Recall (Negativo)'] - referencia['Recall (Negativo)']
+    return resultado
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+
+    try:
+        modelo, vectorizer = joblib.load(CAMINHO_MODELO), joblib.load(CAMINHO_VETORIZADOR)
+        textos, y_test = textos_de_teste(caminho_arquivo)
+        print(f"Avaliando {len(VARIANTES)} exportações em {len(textos)} reviews de teste...")
+
+        previsoes_par = modelo.predict(vectorizer.transform(normalize_many(textos)))
+        referencia = linha_resultado('par joblib (atual)', len(vectorizer.vocabulary_),
+                                     os.path.getsize(CAMINHO_MODELO) + os.path.getsize(CAMINHO_VETORIZADOR),
+                                     tempo_carregamento(carregar_par), previsoes_par, y_test)
+        resultados = [referencia]
+
+        os.makedirs(DIRETORIO_ARTEFATOS, exist_ok=True)
+        for pesos, limiar_poda in VARIANTES:
+            caminho = os.path.join(DIRETORIO_ARTEFATOS, f"modelo_compacto_{pesos}_poda{limiar_poda}.bin")
+            with contextlib.redirect_stdout(io.StringIO()):
+                compact_model.exportar_artefato_compacto(modelo, vectorizer, caminho, pesos=pesos, limiar_poda=limiar_poda)
+            artefato = compact_model.carregar_artefato_compacto(caminho)
+            previsoes = compact_model.prever(artefato, textos)
+            resultados.append({
+                **linha_resultado(f"compacto {pesos}" + (f" poda<{limiar_poda}" if limiar_poda else ''),
+                                  len(artefato['vocabulario']), os.path.getsize(caminho),
+                                  tempo_carregamento(lambda: carregar_compacto(caminho)), previsoes, y_test, referencia),
+                'Previsões alteradas': int((previsoes != previsoes_par).sum()),
+            })
+
+        with pd.option_context('display.max_columns', None, 'display.width', 200, 'display.float_format', '{:.4f}'.format):
+            print(pd.DataFrame(resultados).astype({'Previsões alteradas': 'Int64'}).set_index('Artefato'))
+        print("\nfloat64 sem poda deve reproduzir o par joblib exatamente "
+              f"(previsões alteradas: {resultados[1]['Previsões alteradas']}).")
+        if resultados[1]['Previsões alteradas']:
+            sys.exit(1)
+
+    except FileNotFoundError as erro:
+        print(f"ERRO: Arquivo não encontrado: {erro.filename}")
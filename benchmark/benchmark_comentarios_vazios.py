@@ -0,0 +1,50 @@
+# mede quanto trabalho o atalho para comentários vazios economiza na classificação:
+# pipeline.predict em todas as reviews x prever_com_atalho (só os textos não vazios são vetorizados).
+# executar a partir da raiz do projeto:  python -m benchmark.benchmark_comentarios_vazios
+
+import sys
+import time
+
+import numpy as np
+
+from data_access import ler_tabela, COLUNAS_REVIEWS_ML
+from review_classification import carregar_modelo
+from sentiment_pipeline import prever_com_atalho
+
+def cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+
+    try:
+        pipeline, _ = carregar_modelo()
+        df = ler_tabela(caminho_arquivo, colunas=COLUNAS_REVIEWS_ML)
+        comentarios = df['review_comment_message'].fillna('')
+        print(f"Classificando {len(comentarios)} reviews pelos dois caminhos...")
+
+        completo, tempo_completo = cronometrar(pipeline.predict, comentarios)
+        (atalho, vazios), tempo_atalho = cronometrar(prever_com_atalho, pipeline, comentarios)
+
+        # só a etapa que o atalho evita: vetorização + modelo, sobre os textos já limpos
+        classificador = pipeline[1:]
+        limpos = pipeline.named_steps['limpeza'].transform(comentarios).to_numpy()
+        _, tempo_etapa_completa = cronometrar(classificador.predict, limpos)
+        _, tempo_etapa_atalho = cronometrar(classificador.predict, limpos[~vazios])
+
+        sem_comentario = int((comentarios.str.strip() == '').sum())
+        identicos = np.array_equal(completo, atalho)
+        print(f"Sem comentário: {sem_comentario} ({sem_comentario / len(comentarios):.0%})")
+        print(f"Vazios após a limpeza: {int(vazios.sum())} ({vazios.mean():.0%}) -> não vetorizados nem classificados")
+        print(f"Vetorização + modelo:  {tempo_etapa_completa:.3f}s -> {tempo_etapa_atalho:.3f}s "
+              f"({1 - tempo_etapa_atalho / tempo_etapa_completa:.0%} a menos)")
+        print(f"Ponta a ponta (com limpeza):  {tempo_completo:.3f}s -> {tempo_atalho:.3f}s")
+        print(f"Previsões idênticas: {identicos}")
+        if not identicos:
+            sys.exit(1)
+
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo não encontrado em '{caminho_arquivo}'")
@@ -0,0 +1,69 @@
+# compara a limpeza antiga (closure por linha + .apply) com o normalizador compartilhado e, se os dados do
+# RSLP estiverem instalados (nltk.download('rslp')), mede também a limpeza com radicais e o acerto do cache.
+# executar a partir da raiz do projeto:  python -m benchmark.benchmark_limpeza
+
+import re
+import string
+import sys
+import time
+import unicodedata
+
+import pandas as pd
+from nltk.corpus import stopwords
+
+from text_normalizer import normalize_many, estatisticas_radicais
+
+# -------- IMPLEMENTAÇÃO ANTIGA (referência) ----------
+def limpar_texto_antigo(texto):
+    # cópia fiel do limpar_texto que existia em comparison.py
+    texto = str(texto).lower()
+    texto = re.sub(r'\d+', '', texto)
+    texto = texto.translate(str.maketrans('', '', string.punctuation))
+    texto = texto.strip()
+    palavras_de_parada = set(stopwords.words('portuguese'))
+    lista_palavras = texto.split()
+    texto_sem_stopwords = [palavra for palavra in lista_palavras if palavra not in palavras_de_parada]
+    texto = ' '.join(texto_sem_stopwords)
+    return ''.join(c for c in unicodedata.normalize('NFD', texto) if unicodedata.category(c) != 'Mn')
+
+def cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+
+    try:
+        comentarios = pd.read_csv(caminho_arquivo, usecols=['review_comment_message'])['review_comment_message'].fillna('')
+        print(f"Comparando as duas limpezas em {len(comentarios)} comentários...")
+
+        antigo, tempo_antigo = cronometrar(comentarios.apply, limpar_texto_antigo)
+        novo, tempo_novo = cronometrar(normalize_many, comentarios)
+
+        identicos = antigo.tolist() == novo.tolist()
+        print(f"Limpeza antiga (.apply):   {tempo_antigo:.3f}s")
+        print(f"normalize_many:            {tempo_novo:.3f}s")
+        print(f"Ganho: {tempo_antigo / tempo_novo:.1f}x | Saídas idênticas: {identicos}")
+
+        try:
+            radicais, tempo_radicais = cronometrar(lambda textos: normalize_many(textos, stemizar=True), comentarios)
+        except LookupError:
+            print("Dados do RSLP não encontrados; rode nltk.download('rslp') para medir a limpeza com radicais.")
+        else:
+            cache = estatisticas_radicais()
+            print(f"\n{'':<27}{'tempo (s)':>10}{'comentários/s':>15}{'palavras distintas':>20}")
+            print(f"{'normalize_many':<27}{tempo_novo:>10.3f}{len(comentarios) / tempo_novo:>15,.0f}"
+                  f"{len({p for texto in novo for p in texto.split()}):>20}")
+            print(f"{'normalize_many + radicais':<27}{tempo_radicais:>10.3f}{len(comentarios) / tempo_radicais:>15,.0f}"
+                  f"{len({p for texto in radicais for p in texto.split()}):>20}")
+            print(f"Cache de radicais: {cache['acertos']} acertos, {cache['faltas']} palavras passaram pelo RSLP "
+                  f"({cache['taxa_acerto']:.1%} de acerto) | "
+                  f"custo dos radicais: {tempo_radicais / tempo_novo - 1:+.0%}")
+
+        if not identicos:
+            sys.exit(1)
+
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo não encontrado em '{caminho_arquivo}'")
@@ -0,0 +1,43 @@
+# latência da classificação só com a cabeça binária x binária + multiclasse na mesma passada
+# (limpeza e TF-IDF uma única vez, as duas cabeças sobre a mesma matriz).
+# executar a partir da raiz do projeto:  python -m benchmark.benchmark_multiclasse
+
+import sys
+
+from benchmark.medicao import cronometrar
+from data_access import ler_tabela, COLUNAS_REVIEWS_ML
+from multiclass_head import carregar_cabeca_multiclasse
+from review_classification import carregar_modelo, classificar_reviews
+
+def classificar_copias(df, repeticoes=3, **kwargs):
+    # classificar_reviews altera o DataFrame recebido: cada repetição usa uma cópia nova, feita fora da medição
+    copias = iter([df.copy() for _ in range(repeticoes)])
+    return cronometrar(lambda: classificar_reviews(next(copias), **kwargs), repeticoes=repeticoes)
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+
+    try:
+        pipeline, _ = carregar_modelo()
+        modelo_multiclasse = carregar_cabeca_multiclasse(pipeline)
+        df = ler_tabela(caminho_arquivo, colunas=COLUNAS_REVIEWS_ML)
+        print(f"Classificando {len(df)} reviews...")
+
+        binario, tempo_binario = classificar_copias(df, pipeline=pipeline, verbose=False)
+        completo, tempo_completo = classificar_copias(df, pipeline=pipeline, verbose=False,
+                                                      modelo_multiclasse=modelo_multiclasse)
+
+        identicos = binario['sentimento_previsto'].equals(completo['sentimento_previsto'])
+        print(f"Só binária:             {tempo_binario:.3f}s ({tempo_binario / len(df) * 1e6:.1f} µs/review)")
+        print(f"Binária + multiclasse:  {tempo_completo:.3f}s ({tempo_completo / len(df) * 1e6:.1f} µs/review, "
+              f"{tempo_completo / tempo_binario - 1:+.0%})")
+        print(f"Distribuição das classes: {completo['classe_prevista'].value_counts().to_dict()}")
+        print(f"Coluna binária idêntica nas duas execuções: {identicos}")
+        if not identicos:
+            sys.exit(1)
+
+    except ValueError as erro:
+        print(f"ERRO: {erro}")
+    except FileNotFoundError:
+        print("ERRO: gere o pipeline (comparison.py) e a cabeça multiclasse (multiclass_head.py) antes.")
@@ -0,0 +1,231 @@
+# suíte de benchmark ponta a ponta: mede cada etapa do pipeline (carregar, limpar, vetorizar, treinar cada
+# modelo da comparação, classificar, a limpeza, a vetorização e a previsão da classificação em separado, e
+# gravar) em cópias ampliadas do CSV de reviews (1x, 10x, 50x...).
+# as cópias repetem os textos, e o normalize_many limpa cada texto distinto uma única vez: a limpeza escala
+# melhor que com textos novos de verdade; as demais etapas processam todas as linhas.
+# cada escala roda em um processo novo, para que o pico de memória de uma não contamine a outra. dentro da
+# escala, a memória de cada etapa é o maior RSS amostrado durante a etapa menos o RSS do início dela (o
+# ru_maxrss é o pico do processo inteiro e não mostraria uma etapa que pesa menos que uma anterior).
+# os resultados vão para benchmark/resultados/ em JSON e são comparados com a baseline salva:
+# etapas mais lentas (ou que usam mais memória) que a baseline além da tolerância são marcadas como regressão.
+#
+# executar a partir da raiz do projeto:
+#   python -m benchmark.benchmark_pipeline [escalas, ex.: 1,10,50] [--baseline]
+# --baseline grava esta execução como a nova baseline.
+
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+from data_access import CAMINHO_REVIEWS, COLUNAS_REVIEWS_ML, garantir_parquet, ler_tabela
+from instrumentation import memoria_residente_mb, pico_memoria_mb
+
+ESCALAS_PADRAO = [1, 10, 50]
+DIRETORIO_DADOS = './.cache/benchmark'
+DIRETORIO_RESULTADOS = './benchmark/resultados'
+CAMINHO_BASELINE = './benchmark/resultados/baseline.json'
+TOLERANCIA_TEMPO = 0.20 # 20% mais lento que a baseline é regressão...
+MINIMO_TEMPO_S = 0.05 # ...desde que a diferença passe de 50 ms (etapas curtas oscilam muito)
+TOLERANCIA_MEMORIA = 0.20
+MINIMO_MEMORIA_MB = 20
+INTERVALO_AMOSTRAGEM_MEMORIA = 0.005 # segundos entre leituras do RSS durante uma etapa
+
+# -------- DADOS SINTÉTICOS ----------
+def ampliar_csv(caminho_csv, escala, diretorio=DIRETORIO_DADOS):
+    """
+    Gera (uma vez) o CSV com 'escala' cópias das reviews; cada cópia ganha review_id e order_id próprios
+    (sufixo _<cópia>), como se fossem reviews novas com os mesmos textos e notas.
+    """
+    if escala == 1:
+        return caminho_csv
+    os.makedirs(diretorio, exist_ok=True)
+    nome = os.path.splitext(os.path.basename(caminho_csv))[0]
+    destino = os.path.join(diretorio, f"{nome}_x{escala}.csv")
+    if os.path.exists(destino) and os.path.getmtime(destino) >= os.path.getmtime(caminho_csv):
+        return destino
+
+    print(f"Gerando '{destino}' ({escala}x)...")
+    original = pd.read_csv(caminho_csv)
+    for copia in range(escala):
+        df = original.copy()
+        df['review_id'] = df['review_id'] + f'_{copia}'
+        df['order_id'] = df['order_id'] + f'_{copia}'
+        df.to_csv(destino, index=False, mode='w' if copia == 0 else 'a', header=copia == 0)
+    return destino
+
+# -------- MEDIÇÃO DAS ETAPAS ----------
+@contextlib.contextmanager
+def amostrar_memoria():
+    """
+    Lê o RSS atual em uma thread a cada INTERVALO_AMOSTRAGEM_MEMORIA segundos enquanto o bloco roda e guarda
+    o maior valor em 'maximo'. Picos mais curtos que o intervalo podem escapar; fora do Linux o RSS atual
+    não está disponível e a leitura volta a ser o pico do processo (ver memoria_residente_mb).
+    """
+    amostras = {'maximo': memoria_residente_mb()}
+    parar = threading.Event()
+
+    def amostrar():
+        while not parar.wait(INTERVALO_AMOSTRAGEM_MEMORIA):
+            amostras['maximo'] = max(amostras['maximo'], memoria_residente_mb())
+    thread = threading.Thread(target=amostrar, daemon=True)
+    thread.start()
+    try:
+        yield amostras
+    finally:
+        parar.set()
+        thread.join()
+        amostras['maximo'] = max(amostras['maximo'], memoria_residente_mb())
+
+def medir(etapas, etapa, funcao, *args, linhas=None):
+    """
+    Executa funcao(*args) sem as mensagens de progresso e registra tempo, vazão e memória da etapa.
+    'linhas' padrão = len() do retorno.
+    """
+    memoria_antes = memoria_residente_mb()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), amostrar_memoria() as memoria:
+        retorno = funcao(*args)
+    duracao = time.perf_counter() - inicio
+    linhas = len(retorno) if linhas is None else linhas
+
+    etapas.append({
+        'etapa': etapa,
+        'linhas': linhas,
+        'tempo_s': duracao,
+        'linhas_por_s': linhas / duracao if duracao > 0 else None,
+        'pico_memoria_mb': pico_memoria_mb(),
+        'pico_etapa_mb': memoria['maximo'] - memoria_antes, # acima do RSS do início da etapa
+    })
+    print(f"  {etapa:<32} {linhas:>10} linhas  {duracao:8.2f}s  {etapas[-1]['linhas_por_s'] or 0:>12,.0f} linhas/s  "
+          f"etapa +{etapas[-1]['pico_etapa_mb']:6.0f} MB  pico {etapas[-1]['pico_memoria_mb']:8.0f} MB")
+    return retorno
+
+def medir_escala(caminho_csv, escala):
+    """
+    Roda todas as etapas sobre o CSV de uma escala e retorna a lista de medições.
+    """
+    from comparison import (carregar_e_preparar_dados, aplicar_limpeza_de_texto, vetorizar_e_dividir_dados,
+                            criar_modelos_comparacao)
+    from review_classification import classificar_reviews
+    from sentiment_pipeline import criar_pipeline
+
+    print(f"\n--- ESCALA {escala}x ('{caminho_csv}') ---")
+    garantir_parquet(caminho_csv) # a conversão para Parquet acontece uma vez e não entra na medição
+    etapas = []
+
+    df = medir(etapas, 'carregar', carregar_e_preparar_dados, caminho_csv)
+    df = medir(etapas, 'limpar', aplicar_limpeza_de_texto, df)
+    X_train, X_test, y_train, y_test, vectorizer = medir(etapas, 'vetorizar', vetorizar_e_dividir_dados, df, linhas=len(df))
+
+    modelos = criar_modelos_comparacao()
+    for nome, modelo in modelos.items():
+        medir(etapas, f'treinar: {nome}', modelo.fit, X_train, y_train, linhas=X_train.shape[0])
+
+    # classificação de todas as reviews (inclusive nota 3) com a Regressão Logística, como no review_classification.py
+    pipeline = criar_pipeline(modelos["Regressão Logística"], vectorizer)
+    df_completo = ler_tabela(caminho_csv, colunas=COLUNAS_REVIEWS_ML)
+    df_resultado = medir(etapas, 'classificar', classificar_reviews, df_completo, pipeline, False)
+    # as mesmas reviews de novo, uma parte da classificação por vez, para saber qual delas mudou: limpeza dos
+    # comentários com conteúdo, TF-IDF dos que continuam com texto e previsão do modelo (como em vetorizar_com_atalho)
+    textos = df_completo['review_comment_message'].fillna('').to_numpy(dtype=object)
+    textos = textos[[bool(texto.strip()) for texto in textos]]
+    limpos = medir(etapas, 'classificar: limpar', pipeline.named_steps['limpeza'].transform, textos).to_numpy()
+    limpos = limpos[limpos != '']
+    X = medir(etapas, 'classificar: vetorizar', pipeline.named_steps['tfidf'].transform, limpos, linhas=len(limpos))
+    medir(etapas, 'classificar: prever', pipeline.named_steps['modelo'].predict, X, linhas=X.shape[0])
+
+    caminho_saida = os.path.join(DIRETORIO_DADOS, f'final_reviews_x{escala}.csv')
+    os.makedirs(DIRETORIO_DADOS, exist_ok=True)
+    medir(etapas, 'gravar', df_resultado.to_csv, caminho_saida, linhas=len(df_resultado))
+    os.remove(caminho_saida)
+    return etapas
+
+# -------- RESULTADOS E REGRESSÕES ----------
+def commit_atual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def comparar_com_baseline(resultado, baseline):
+    """
+    Lista as etapas (por escala) que ficaram mais lentas ou usaram mais memória que a baseline além da tolerância.
+    """
+    regressoes = []
+    for escala, etapas in resultado['escalas'].items():
+        referencia = {etapa['etapa']: etapa for etapa in baseline['escalas'].get(escala, [])}
+        for etapa in etapas:
+            base = referencia.get(etapa['etapa'])
+            if base is None:
+                continue
+            if (etapa['tempo_s'] > base['tempo_s'] * (1 + TOLERANCIA_TEMPO)
+                    and etapa['tempo_s'] - base['tempo_s'] > MINIMO_TEMPO_S):
+                regressoes.append(f"{escala}x {etapa['etapa']}: tempo {base['tempo_s']:.2f}s -> {etapa['tempo_s']:.2f}s "
+                                  f"({etapa['tempo_s'] / base['tempo_s'] - 1:+.0%})")
+            if 'pico_etapa_mb' not in base: # baseline gravada antes da medição por etapa; grave outra com --baseline
+                continue
+            if (etapa['pico_etapa_mb'] > base['pico_etapa_mb'] * (1 + TOLERANCIA_MEMORIA)
+                    and etapa['pico_etapa_mb'] - base['pico_etapa_mb'] > MINIMO_MEMORIA_MB):
+                regressoes.append(f"{escala}x {etapa['etapa']}: memória +{base['pico_etapa_mb']:.0f} MB -> "
+                                  f"+{etapa['pico_etapa_mb']:.0f} MB")
+    return regressoes
+
+def salvar_json(conteudo, caminho):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(conteudo, arquivo, ensure_ascii=False, indent=2)
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    argumentos = [argumento for argumento in sys.argv[1:] if not argumento.startswith('--')]
+    escalas = [int(escala) for escala in argumentos[0].split(',')] if argumentos else ESCALAS_PADRAO
+    salvar_baseline = '--baseline' in sys.argv
+
+    try:
+        resultado = {
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'commit': commit_atual(),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'nucleos': os.cpu_count(),
+            'escalas': {},
+        }
+        for escala in escalas:
+            caminho_csv = ampliar_csv(CAMINHO_REVIEWS, escala)
+            # um processo novo por escala: o pico de memória começa do zero
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                resultado['escalas'][str(escala)] = executor.submit(medir_escala, caminho_csv, escala).result()
+
+        caminho_resultado = os.path.join(DIRETORIO_RESULTADOS, f"benchmark_{datetime.now():%Y%m%d-%H%M%S}.json")
+        salvar_json(resultado, caminho_resultado)
+        print(f"\nResultados salvos em '{caminho_resultado}'")
+
+        if salvar_baseline:
+            salvar_json(resultado, CAMINHO_BASELINE)
+            print(f"Baseline atualizada em '{CAMINHO_BASELINE}'")
+        elif os.path.exists(CAMINHO_BASELINE):
+            with open(CAMINHO_BASELINE, encoding='utf-8') as arquivo:
+                baseline = json.load(arquivo)
+            regressoes = comparar_com_baseline(resultado, baseline)
+            print(f"\n--- COMPARAÇÃO COM A BASELINE ({baseline['data']}, commit {baseline['commit']}) ---")
+            for regressao in regressoes:
+                print(f"REGRESSÃO: {regressao}")
+            if not regressoes:
+                print("Nenhuma regressão encontrada.")
+            else:
+                sys.exit(1)
+        else:
+            print("Sem baseline para comparar; rode com --baseline para gravar esta execução como referência.")
+
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo não encontrado em '{CAMINHO_REVIEWS}'")
@@ -0,0 +1,72 @@
+# custo da etapa de saída da classificação: mapeamento dos rótulos (np.vectorize x categórico a partir dos
+# códigos) e gravação (to_csv de uma vez x escritor em blocos em CSV, gzip, zstd e Parquet): tempo e tamanho.
+# executar a partir da raiz do projeto:  python -m benchmark.benchmark_saida [csv] [copias]
+
+import contextlib
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmark.medicao import cronometrar
+from data_access import ler_tabela, COLUNAS_REVIEWS_ML
+from output_writer import FORMATOS_SAIDA, abrir_escritor, caminho_saida
+from review_classification import ROTULOS_SENTIMENTO, carregar_modelo, classificar_reviews
+
+DIRETORIO_SAIDAS = './.cache/benchmark'
+TAMANHO_BLOCO = 50000
+
+def gravar_em_blocos(df, caminho):
+    with abrir_escritor(caminho) as escrever:
+        for inicio in range(0, len(df), TAMANHO_BLOCO):
+            escrever(df.iloc[inicio:inicio + TAMANHO_BLOCO])
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+    copias = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline, _ = carregar_modelo()
+        df = ler_tabela(caminho_arquivo, colunas=COLUNAS_REVIEWS_ML)
+        df = pd.concat([df] * copias, ignore_index=True) if copias > 1 else df
+        resultado = classificar_reviews(df, pipeline, verbose=False, incluir_probabilidades=True)
+        print(f"Saída de {len(resultado)} reviews classificadas")
+
+        # 1) rótulos: mesma previsão (0/1) mapeada linha a linha e como categórico montado dos códigos
+        previsoes = resultado['sentimento_previsto'].cat.codes.to_numpy()
+        mapa_sentimento = {0: 'negativo', 1: 'positivo'}
+        antigo, tempo_antigo = cronometrar(np.vectorize(mapa_sentimento.get), previsoes)
+        novo, tempo_novo = cronometrar(pd.Categorical.from_codes, previsoes, ROTULOS_SENTIMENTO)
+        print(f"\nRótulos com np.vectorize:          {tempo_antigo * 1000:8.1f} ms")
+        print(f"Rótulos categóricos (from_codes):  {tempo_novo * 1000:8.1f} ms "
+              f"({tempo_antigo / tempo_novo:.0f}x) | iguais: {bool((np.asarray(novo) == antigo).all())}")
+
+        # 2) gravação: sem as colunas de probabilidade (saída padrão) e com elas
+        os.makedirs(DIRETORIO_SAIDAS, exist_ok=True)
+        linhas = []
+        for com_probabilidades in (False, True):
+            df_saida = resultado if com_probabilidades else resultado.drop(columns=['prob_negativo', 'prob_positivo'])
+            destino = os.path.join(DIRETORIO_SAIDAS, 'saida_uma_vez.csv')
+            _, tempo = cronometrar(lambda: df_saida.to_csv(destino, index=False))
+            linhas.append({'Probabilidades': com_probabilidades, 'Gravação': 'to_csv de uma vez (antiga)',
+                           'Tempo (s)': tempo, 'Tamanho (MB)': os.path.getsize(destino) / (1024 * 1024)})
+            for formato in FORMATOS_SAIDA:
+                destino = caminho_saida(os.path.join(DIRETORIO_SAIDAS, 'saida'), formato)
+                try:
+                    _, tempo = cronometrar(gravar_em_blocos, df_saida, destino)
+                except ValueError as erro: # formato com dependência opcional ausente
+                    print(f"{formato}: {erro}")
+                    continue
+                linhas.append({'Probabilidades': com_probabilidades, 'Gravação': f"em blocos, {formato}",
+                               'Tempo (s)': tempo, 'Tamanho (MB)': os.path.getsize(destino) / (1024 * 1024)})
+
+        with pd.option_context('display.width', 200, 'display.float_format', '{:.3f}'.format):
+            print()
+            print(pd.DataFrame(linhas).set_index(['Probabilidades', 'Gravação']))
+
+    except FileNotFoundError as erro:
+        print(f"ERRO: Arquivo não encontrado: {erro.filename}")
@@ -0,0 +1,75 @@
+# gerador de carga para o scoring_service.py: abre várias conexões keep-alive e envia reviews ao mesmo tempo.
+# executar a partir da raiz do projeto, com o serviço já no ar:
+#   python scoring_service.py
+#   python -m benchmark.load_generator [conexoes] [requisicoes_por_conexao] [porta]
+
+import asyncio
+import json
+import random
+import sys
+import time
+
+import numpy as np
+
+REVIEWS_EXEMPLO = [
+    'Produto chegou antes do prazo, recomendo!',
+    'Péssimo, não recebi o produto até agora.',
+    'ótimo',
+    'Veio com defeito e o vendedor não responde.',
+    'Entrega rápida, produto de ótima qualidade.',
+    'Comprei dois e só veio um.',
+    '',
+]
+
+async def enviar(reader, writer, corpo):
+    writer.write((f"POST /classificar HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                  f"Content-Length: {len(corpo)}\r\n\r\n").encode('latin-1') + corpo)
+    await writer.drain()
+    await reader.readline() # linha de status
+    tamanho = 0
+    while True:
+        linha = await reader.readline()
+        if linha in (b'\r\n', b''):
+            break
+        if linha.lower().startswith(b'content-length:'):
+            tamanho = int(linha.split(b':', 1)[1])
+    return json.loads(await reader.readexactly(tamanho))
+
+async def cliente(porta, n_requisicoes, latencias):
+    reader, writer = await asyncio.open_connection('127.0.0.1', porta)
+    for _ in range(n_requisicoes):
+        corpo = json.dumps({'texto': random.choice(REVIEWS_EXEMPLO)}).encode('utf-8')
+        inicio = time.perf_counter()
+        await enviar(reader, writer, corpo)
+        latencias.append(time.perf_counter() - inicio)
+    writer.close()
+
+async def buscar_metricas(porta):
+    reader, writer = await asyncio.open_connection('127.0.0.1', porta)
+    writer.write(b"GET /metricas HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+    await writer.drain()
+    resposta = await reader.read()
+    writer.close()
+    return json.loads(resposta.split(b'\r\n\r\n', 1)[1])
+
+async def gerar_carga(conexoes=50, requisicoes_por_conexao=200, porta=8000):
+    """
+    Dispara 'conexoes' clientes simultâneos e imprime latência p50/p99 e vazão vistas pelo cliente e pelo serviço.
+    """
+    latencias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(porta, requisicoes_por_conexao, latencias) for _ in range(conexoes)))
+    duracao = time.perf_counter() - inicio
+
+    latencias_ms = np.array(latencias) * 1000
+    print(f"{len(latencias)} requisições em {duracao:.2f}s ({len(latencias) / duracao:,.0f} req/s) com {conexoes} conexões")
+    print(f"Cliente: p50 = {np.percentile(latencias_ms, 50):.2f} ms | p99 = {np.percentile(latencias_ms, 99):.2f} ms")
+    print("Serviço:", json.dumps(await buscar_metricas(porta), indent=2))
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    argumentos = [int(valor) for valor in sys.argv[1:4]]
+    try:
+        asyncio.run(gerar_carga(*argumentos))
+    except ConnectionRefusedError:
+        print("ERRO: o serviço não está no ar. Inicie com 'python scoring_service.py'.")
@@ -0,0 +1,15 @@
+# medição de tempo compartilhada pelos benchmarks.
+
+import time
+
+def cronometrar(funcao, *args, repeticoes=3, **kwargs):
+    """
+    Executa funcao(*args, **kwargs) `repeticoes` vezes e devolve (resultado da última execução, melhor tempo em
+    segundos). O melhor tempo entre as repetições reduz o ruído do sistema.
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(*args, **kwargs)
+        tempos.append(time.perf_counter() - inicio)
+    return resultado, min(tempos)
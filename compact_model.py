@@ -0,0 +1,227 @@
+# artefato compacto de inferência: um único arquivo com vocabulário, IDF, coeficientes e a configuração
+# da limpeza, e um classificador que depende só de numpy (sem sklearn, pandas ou NLTK na inicialização).
+#
+# formato do arquivo: 8 bytes com o tamanho do cabeçalho, o cabeçalho em JSON e os arrays numpy em
+# sequência (alinhados em 64 bytes), lidos com np.memmap sem copiar nada para a memória.
+# opcionalmente os pesos são gravados em float16 ou int8 (com fator de escala) e os termos com coeficiente
+# perto de zero saem do vocabulário (poda), o que encolhe o arquivo ao custo de uma pequena diferença nas previsões.
+
+import json
+import math
+import re
+import sys
+from collections import Counter
+
+import numpy as np
+
+from text_normalizer import limpar_texto, configuracao_limpeza
+
+CAMINHO_ARTEFATO_COMPACTO = './to_predict/modelo_compacto.bin'
+ALINHAMENTO = 64
+TIPOS_PESOS = ('float64', 'float16', 'int8')
+
+# -------- EXPORTAÇÃO ----------
+def _alinhar(posicao):
+    return (posicao + ALINHAMENTO - 1) // ALINHAMENTO * ALINHAMENTO
+
+def escrever_arquivo_compacto(caminho, arrays, configuracao):
+    """
+    Grava os arrays e a configuração no formato de arquivo único descrito no topo do módulo.
+    """
+    descricao_arrays = {}
+    posicao = 0
+    for nome, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[nome] = array
+        descricao_arrays[nome] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'posicao': posicao}
+        posicao = _alinhar(posicao + array.nbytes)
+
+    cabecalho = json.dumps({'configuracao': configuracao, 'arrays': descricao_arrays}).encode('utf-8')
+    inicio_dados = _alinhar(8 + len(cabecalho))
+
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(len(cabecalho).to_bytes(8, 'little'))
+        arquivo.write(cabecalho)
+        for nome, array in arrays.items():
+            arquivo.seek(inicio_dados + descricao_arrays[nome]['posicao'])
+            arquivo.write(array.tobytes())
+
+def exportar_artefato_compacto(modelo, vectorizer, caminho=CAMINHO_ARTEFATO_COMPACTO, remover_acento=True, stemizar=False,
+                               pesos='float64', limiar_poda=0.0):
+    """
+    Exporta um modelo linear binário e o TfidfVectorizer usado no treino para o artefato compacto.
+    O vocabulário é gravado em ordem alfabética (UTF-8), que é a mesma ordem das colunas do TF-IDF.
+
+    'pesos' define como coeficientes e IDF são gravados: 'float64' (padrão, previsões idênticas às do sklearn),
+    'float16', ou 'int8' (coeficientes em int8 com um fator de escala e IDF em float16).
+    Com limiar_poda > 0, os termos com |coeficiente| abaixo do limiar saem do vocabulário; como eles também
+    deixam de entrar na norma do TF-IDF, as previsões podem mudar (medir com benchmark_artefato_podado).
+    """
+    if vectorizer.analyzer != 'word' or vectorizer.strip_accents or vectorizer.preprocessor or vectorizer.tokenizer:
+        raise ValueError("O artefato compacto só suporta o TfidfVectorizer com analyzer='word' e sem pré-processamento extra.")
+    if pesos not in TIPOS_PESOS:
+        raise ValueError(f"pesos deve ser um de {TIPOS_PESOS}, não '{pesos}'")
+
+    termos = vectorizer.get_feature_names_out()
+    coeficientes = modelo.coef_[0].astype(np.float64)
+    idf = vectorizer.idf_.astype(np.float64) if vectorizer.use_idf else np.ones(len(termos))
+    mantidos = np.abs(coeficientes) >= limiar_poda
+    if not mantidos.any():
+        raise ValueError(f"limiar_poda={limiar_poda} remove todos os termos do vocabulário.")
+    termos, coeficientes, idf = termos[mantidos], coeficientes[mantidos], idf[mantidos]
+    # UTF-8 em largura fixa ocupa 1/4 do espaço de um array unicode e mantém a mesma ordenação
+    vocabulario = np.array([termo.encode('utf-8') for termo in termos], dtype=bytes)
+    if not np.all(vocabulario[:-1] < vocabulario[1:]):
+        raise ValueError("Vocabulário fora de ordem alfabética; não é possível exportar.")
+
+    configuracao = {
+        'limpeza': configuracao_limpeza(remover_acento, stemizar),
+        'vetorizador': {
+            'lowercase': vectorizer.lowercase,
+            'token_pattern': vectorizer.token_pattern,
+            'ngram_range': list(vectorizer.ngram_range),
+            'norm': vectorizer.norm,
+            'use_idf': vectorizer.use_idf,
+            'sublinear_tf': vectorizer.sublinear_tf,
+        },
+        'classes': [int(classe) for classe in modelo.classes_],
+        'intercepto': float(modelo.intercept_[0]),
+        'pesos': pesos,
+        'termos_podados': int((~mantidos).sum()),
+    }
+    if pesos == 'int8':
+        # coeficiente = inteiro * escala, com o maior |coeficiente| em 127
+        configuracao['escala_coeficientes'] = float(np.abs(coeficientes).max()) / 127 or 1.0
+        coeficientes = np.round(coeficientes / configuracao['escala_coeficientes']).astype(np.int8)
+        idf = idf.astype(np.float16)
+    elif pesos == 'float16':
+        coeficientes, idf = coeficientes.astype(np.float16), idf.astype(np.float16)
+    arrays = {
+        'vocabulario': vocabulario,
+        'idf': idf,
+        'coeficientes': coeficientes,
+    }
+    escrever_arquivo_compacto(caminho, arrays, configuracao)
+    print(f"Artefato compacto salvo em '{caminho}' ({len(termos)} termos, {configuracao['termos_podados']} podados, pesos em {pesos})")
+
+# -------- CARREGAMENTO E CLASSIFICAÇÃO ----------
+def carregar_artefato_compacto(caminho=CAMINHO_ARTEFATO_COMPACTO):
+    """
+    Abre o artefato compacto com os arrays mapeados em memória (np.memmap).
+    """
+    with open(caminho, 'rb') as arquivo:
+        tamanho_cabecalho = int.from_bytes(arquivo.read(8), 'little')
+        cabecalho = json.loads(arquivo.read(tamanho_cabecalho).decode('utf-8'))
+    inicio_dados = _alinhar(8 + tamanho_cabecalho)
+
+    artefato = dict(cabecalho['configuracao'])
+    for nome, descricao in cabecalho['arrays'].items():
+        artefato[nome] = np.memmap(caminho, dtype=np.dtype(descricao['dtype']), mode='r',
+                                   offset=inicio_dados + descricao['posicao'], shape=tuple(descricao['shape']))
+    artefato['padrao_token'] = re.compile(artefato['vetorizador']['token_pattern'])
+    artefato['palavras_de_parada'] = frozenset(artefato['limpeza']['stopwords'])
+    return artefato
+
+def _tokens(artefato, texto):
+    # mesma análise do TfidfVectorizer: minúsculas, token_pattern e n-gramas
+    configuracao = artefato['vetorizador']
+    if configuracao['lowercase']:
+        texto = texto.lower()
+    tokens = artefato['padrao_token'].findall(texto)
+    minimo, maximo = configuracao['ngram_range']
+    if maximo == 1:
+        return tokens
+    ngramas = tokens if minimo == 1 else []
+    for n in range(max(minimo, 2), maximo + 1):
+        ngramas.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return ngramas
+
+def pontuar(artefato, textos):
+    """
+    Calcula a função de decisão do modelo linear para textos brutos (strings; a limpeza do treino é aplicada aqui).
+    As contas seguem a mesma ordem das operações esparsas do sklearn, para que os resultados sejam idênticos.
+    """
+    vocabulario = artefato['vocabulario']
+    idf, coeficientes = artefato['idf'].tolist(), artefato['coeficientes'].tolist() # floats Python, mais rápidos no laço
+    if 'escala_coeficientes' in artefato: # pesos em int8
+        coeficientes = (artefato['coeficientes'] * artefato['escala_coeficientes']).tolist()
+    configuracao = artefato['vetorizador']
+    remover_acento = artefato['limpeza']['remover_acento']
+    stemizar = 'stemizar' in artefato['limpeza'] # com radicais, a NLTK é importada na primeira limpeza
+    palavras_de_parada = artefato['palavras_de_parada']
+
+    textos_limpos = [limpar_texto(texto, remover_acento, palavras_de_parada, stemizar) for texto in textos]
+    tokens_por_texto = [_tokens(artefato, texto) for texto in textos_limpos]
+
+    # busca de todos os tokens do lote no vocabulário ordenado de uma só vez
+    # (o array de tokens mantém a própria largura, para que tokens longos não sejam truncados)
+    todos_tokens = np.array([token.encode('utf-8') for tokens in tokens_por_texto for token in tokens] or [b''], dtype=bytes)
+    posicoes = np.minimum(np.searchsorted(vocabulario, todos_tokens), len(vocabulario) - 1)
+    no_vocabulario = vocabulario[posicoes] == todos_tokens
+
+    pontuacoes = np.empty(len(textos), dtype=np.float64)
+    inicio = 0
+    for linha, tokens in enumerate(tokens_por_texto):
+        fim = inicio + len(tokens)
+        contagem = Counter(posicoes[inicio:fim][no_vocabulario[inicio:fim]].tolist())
+        inicio = fim
+
+        indices = sorted(contagem)
+        valores = []
+        for indice in indices:
+            tf = float(contagem[indice])
+            if configuracao['sublinear_tf']:
+                tf = math.log(tf) + 1.0
+            valores.append(tf * idf[indice])
+
+        if configuracao['norm'] == 'l2':
+            norma = 0.0
+            for valor in valores:
+                norma += valor * valor
+            norma = math.sqrt(norma)
+        elif configuracao['norm'] == 'l1':
+            norma = 0.0
+            for valor in valores:
+                norma += abs(valor)
+        else:
+            norma = 1.0
+        if norma == 0.0:
+            norma = 1.0
+
+        soma = 0.0
+        for indice, valor in zip(indices, valores):
+            soma += (valor / norma) * coeficientes[indice]
+        pontuacoes[linha] = soma + artefato['intercepto']
+    return pontuacoes
+
+def prever(artefato, textos):
+    """
+    Retorna a classe prevista (0 = negativo, 1 = positivo) para cada texto bruto.
+    """
+    classes = np.array(artefato['classes'])
+    return classes[(pontuar(artefato, textos) > 0).astype(int)]
+
+def prever_proba(artefato, textos):
+    """
+    Retorna as probabilidades [negativo, positivo] de cada texto (função logística da decisão).
+    """
+    positivo = 1.0 / (1.0 + np.exp(-pontuar(artefato, textos)))
+    return np.column_stack([1.0 - positivo, positivo])
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    # converte o par joblib atual (modelo + vetorizador) para o artefato compacto
+    # uso:   python compact_model.py [saida] [float64|float16|int8] [limiar_poda]
+    import joblib
+
+    caminho_saida = sys.argv[1] if len(sys.argv) > 1 else CAMINHO_ARTEFATO_COMPACTO
+    pesos = sys.argv[2] if len(sys.argv) > 2 else 'float64'
+    limiar_poda = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    try:
+        modelo = joblib.load('./to_predict/modelo_sentimento.joblib')
+        vectorizer = joblib.load('./to_predict/vetorizador_tfidf.joblib')
+        exportar_artefato_compacto(modelo, vectorizer, caminho_saida, pesos=pesos, limiar_poda=limiar_poda)
+    except ValueError as erro:
+        print(f"ERRO: {erro}")
+    except FileNotFoundError:
+        print("ERRO: Certifique-se que 'modelo_sentimento.joblib' e 'vetorizador_tfidf.joblib' estão em ./to_predict/")
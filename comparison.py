@@ -1,16 +1,27 @@
 
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+
 import pandas as pd
 import numpy as np
-import re
-import string
-from nltk.corpus import stopwords
 
 # ferramenta para dividir os dados em treino e teste
 from sklearn.model_selection import train_test_split
 # ferramenta para vetorizar o texto com TF-IDF
 from sklearn.feature_extraction.text import TfidfVectorizer
 
-import unicodedata
+# normalizador compartilhado (regex, pontuação e stopwords pré-carregados)
+from text_normalizer import normalize_many, configuracao_limpeza, estatisticas_radicais
+
+# cache em disco do texto limpo e das matrizes TF-IDF
+import feature_cache
+# leitura colunar (Parquet) dos CSVs da Olist
+from data_access import ler_tabela, COLUNAS_REVIEWS_ML
+# eventos por etapa (tempo, CPU, linhas, memória) e resumo no fim da execução
+from instrumentation import etapa, ligar_instrumentacao, pico_memoria_mb
 
 # para o modelo ML
 from sklearn.linear_model import LogisticRegression
@@ -23,12 +34,19 @@ import matplotlib.pyplot as plt
 
 # para comparar com outros modelos
 from sklearn.naive_bayes import MultinomialNB
-from sklearn.svm import SVC
+from sklearn.svm import SVC, LinearSVC
+from sklearn.linear_model import SGDClassifier
+from sklearn.kernel_approximation import Nystroem
+from sklearn.pipeline import make_pipeline
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import precision_score, recall_score, f1_score
 
 # para script final resposta
 import joblib
+from compact_model import exportar_artefato_compacto
+from sentiment_pipeline import criar_pipeline, salvar_pipeline
+from multiclass_head import treinar_cabeca_multiclasse, salvar_cabeca_multiclasse, vetorizar_neutras
+from drift_monitor import novo_monitor, acumular, probabilidade_positiva, salvar_estatisticas_treino
 
 # -------- CARREGAR E PREPARAR DADOS ----------
 def carregar_e_preparar_dados(caminho_arquivo):
@@ -36,41 +54,55 @@ def carregar_e_preparar_dados(caminho_arquivo):
     Carrega o dataset, filtra as reviews de nota 3 e cria a coluna de sentimento.
     """
     print("1. Carregando e preparando os dados iniciais...")
-    df = pd.read_csv(caminho_arquivo)
-    df_filtrado = df[df['review_score'] != 3].copy()
+    # só as colunas usadas pelo modelo, com o filtro de nota 3 aplicado já na leitura
+    df_filtrado = ler_tabela(caminho_arquivo, colunas=COLUNAS_REVIEWS_ML, filtros=[('review_score', '!=', 3)])
     condicao = df_filtrado['review_score'] > 3
     df_filtrado['sentimento'] = np.where(condicao, 'positivo', 'negativo')
     return df_filtrado
 
 # --------  LIMPEZA DE TEXTO --------------------
-def remover_acentos(texto):
-    # 'rápida' em 'rapida'
-    return ''.join(c for c in unicodedata.normalize('NFD', texto) if unicodedata.category(c) != 'Mn')
+# reduzir as palavras aos radicais (RSLP) antes do TF-IDF; muda a chave do cache de features e vai junto
+# para o pipeline e o artefato compacto salvos. Requer nltk.download('rslp') (ver download_stopwords.py).
+STEMIZAR = False
 
-def aplicar_limpeza_de_texto(df):
+def aplicar_limpeza_de_texto(df, n_workers=1, tamanho_chunk=20000, limiar_paralelo=100000, stemizar=STEMIZAR):
     """
     Aplica a função de limpeza de texto na coluna de comentários.
+    Com n_workers > 1 (ou None para todos os núcleos) a limpeza é feita em paralelo, em chunks de 'tamanho_chunk';
+    abaixo de 'limiar_paralelo' linhas continua serial.
     """
     print("2. Aplicando a limpeza de texto...")
-    
-    def limpar_texto(texto):
-        texto = str(texto).lower() # Garante que o input é string
-        texto = re.sub(r'\d+', '', texto)
-        texto = texto.translate(str.maketrans('', '', string.punctuation))
-        texto = texto.strip()
-        palavras_de_parada = set(stopwords.words('portuguese'))
-        lista_palavras = texto.split()
-        texto_sem_stopwords = [palavra for palavra in lista_palavras if palavra not in palavras_de_parada]
-        texto = ' '.join(texto_sem_stopwords)
-        texto = remover_acentos(texto)
-        
-        return texto
-
     df['review_comment_message'] = df['review_comment_message'].fillna('')
-    df['texto_limpo'] = df['review_comment_message'].apply(limpar_texto)
+
+    # comentários vazios (ou só com espaços) já ficam com texto limpo vazio, sem passar pelo normalizador
+    com_conteudo = df['review_comment_message'].str.strip() != ''
+    radicais_antes = estatisticas_radicais()
+    inicio = time.perf_counter()
+    df['texto_limpo'] = ''
+    df.loc[com_conteudo, 'texto_limpo'] = normalize_many(df.loc[com_conteudo, 'review_comment_message'], n_workers=n_workers,
+                                                         tamanho_chunk=tamanho_chunk, limiar_paralelo=limiar_paralelo,
+                                                         stemizar=stemizar)
+    tempo_limpeza = time.perf_counter() - inicio
+    vazios = (df['texto_limpo'] == '').sum()
+    print(f"{len(df) - com_conteudo.sum()} comentários vazios pulados na limpeza; "
+          f"{vazios} de {len(df)} ({vazios / len(df):.0%}) ficam vazios e viram linhas TF-IDF zeradas.")
+
+    print(f"Limpeza: {com_conteudo.sum()} comentários em {tempo_limpeza:.2f}s "
+          f"({com_conteudo.sum() / tempo_limpeza:,.0f} comentários/s).")
+
+    radicais = estatisticas_radicais()
+    acertos, faltas = radicais['acertos'] - radicais_antes['acertos'], radicais['faltas'] - radicais_antes['faltas']
+    if acertos + faltas:
+        print(f"Radicais: {acertos + faltas} palavras, {faltas} distintas passaram pelo RSLP "
+              f"({acertos / (acertos + faltas):.1%} de acerto no cache).")
+    elif stemizar: # limpeza em paralelo: cada processo do pool tem o próprio cache, fora do alcance deste
+        print("Radicais: acertos e faltas do cache indisponíveis na limpeza em paralelo.")
     return df
 
 # --------  VETORIZACAO E DIVISAO ----------------
+PARAMETROS_VETORIZADOR = {'max_features': 5000}
+PARAMETROS_DIVISAO = {'test_size': 0.2, 'random_state': 42}
+
 def vetorizar_e_dividir_dados(df):
     """
     Converte o texto em vetores TF-IDF e divide os dados em treino e teste.
@@ -80,9 +112,9 @@ def vetorizar_e_dividir_dados(df):
     X = df['texto_limpo']
     y = df['sentimento_numerico']
 
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, stratify=y, **PARAMETROS_DIVISAO)
     
-    vectorizer = TfidfVectorizer(max_features=5000)
+    vectorizer = TfidfVectorizer(**PARAMETROS_VETORIZADOR)
     X_train_tfidf = vectorizer.fit_transform(X_train)
     X_test_tfidf = vectorizer.transform(X_test)
     
@@ -91,6 +123,41 @@ def vetorizar_e_dividir_dados(df):
     print(f"Formato dos dados de teste: {X_test_tfidf.shape}")
     
     return X_train_tfidf, X_test_tfidf, y_train, y_test, vectorizer
+
+def preparar_features(caminho_arquivo, usar_cache=True, retornar_texto_teste=False):
+    """
+    Executa as etapas 1 a 3 (carregar, limpar, vetorizar e dividir), reaproveitando o cache em disco
+    quando o arquivo, a limpeza e os parâmetros do vetorizador não mudaram.
+    Com retornar_texto_teste=True, retorna também os textos limpos do teste (na ordem das linhas de X_test).
+    """
+    if usar_cache:
+        parametros_vetorizador = TfidfVectorizer(**PARAMETROS_VETORIZADOR).get_params()
+        chave = feature_cache.chave_cache(caminho_arquivo, configuracao_limpeza(stemizar=STEMIZAR), parametros_vetorizador,
+                                          PARAMETROS_DIVISAO)
+        with etapa('1-3. cache de features') as registro:
+            entrada = feature_cache.carregar_cache(chave)
+            registro['acerto'] = entrada is not None
+        if entrada is not None:
+            print(f"1-3. Features carregadas do cache ({chave}), pulando limpeza e vetorização.")
+            features = entrada['X_train_tfidf'], entrada['X_test_tfidf'], entrada['y_train'], entrada['y_test'], entrada['vectorizer']
+            return (*features, entrada['texto_limpo'].loc[entrada['y_test'].index]) if retornar_texto_teste else features
+
+    with etapa('1. carregar') as registro:
+        df_inicial = carregar_e_preparar_dados(caminho_arquivo)
+        registro['linhas_saida'] = len(df_inicial)
+    with etapa('2. limpar', len(df_inicial)) as registro:
+        df_limpo = aplicar_limpeza_de_texto(df_inicial)
+        registro['linhas_saida'] = int((df_limpo['texto_limpo'] != '').sum()) # textos que sobram não vazios
+    with etapa('3. vetorizar e dividir', len(df_limpo)) as registro:
+        X_train, X_test, y_train, y_test, vectorizer = vetorizar_e_dividir_dados(df_limpo)
+        registro['linhas_saida'] = X_train.shape[0] + X_test.shape[0]
+
+    if usar_cache:
+        with etapa('salvar cache de features'):
+            feature_cache.salvar_cache(chave, df_limpo['texto_limpo'], X_train, X_test, y_train, y_test, vectorizer)
+        print(f"Features salvas no cache ({chave}).")
+    features = X_train, X_test, y_train, y_test, vectorizer
+    return (*features, df_limpo['texto_limpo'].loc[y_test.index]) if retornar_texto_teste else features
 # --------------------------------------------------------------------
 
 # --------  TREINAR E AVALIAR MODELOS -----------
@@ -160,88 +227,191 @@ def comparar_modelos_visualmente(y_test, previsoes_padrao, previsoes_balanceado)
     print("Gráfico de comparação salvo em './img/comparacao_logisticRegression.png'")
 
 # --------  COMPARAÇÃO COM OUTROS MODELOS ------------------
-def comparar_varios_modelos(X_train, y_train, X_test, y_test):
+def criar_modelo_svm(modo_svm='linear'):
     """
-    Treina, avalia e compara múltiplos modelos de classificação.
-    Gera uma tabela e um gráfico com os resultados.
+    Cria o SVM usado na comparação.
+    'rbf' é o SVC original (kernel RBF, escala mal com o número de reviews);
+    'linear' (LinearSVC) e 'sgd' (SGDClassifier com perda hinge) são lineares e rápidos em matrizes esparsas;
+    'nystroem' aproxima o kernel RBF com features aleatórias de Nyström e um SVM linear por cima.
     """
-    # definição dos modelos que vamos comparar
-    modelos = {
+    if modo_svm == 'rbf':
+        return SVC(random_state=42, class_weight='balanced')
+    if modo_svm == 'linear':
+        return LinearSVC(random_state=42, class_weight='balanced')
+    if modo_svm == 'sgd':
+        return SGDClassifier(loss='hinge', random_state=42, class_weight='balanced')
+    if modo_svm == 'nystroem':
+        return make_pipeline(Nystroem(kernel='rbf', n_components=500, random_state=42),
+                             LinearSVC(random_state=42, class_weight='balanced'))
+    raise ValueError(f"modo_svm desconhecido: '{modo_svm}' (use 'linear', 'sgd', 'nystroem' ou 'rbf')")
+
+# dados de treino/teste herdados pelos processos da comparação (somente leitura)
+_dados_comparacao = {}
+
+def _inicializar_worker_comparacao(X_train, y_train, X_test, y_test):
+    # no Linux (fork) as matrizes são herdadas sem cópia; nos demais sistemas são enviadas uma vez por processo
+    _dados_comparacao.update(X_train=X_train, y_train=y_train, X_test=X_test, y_test=y_test)
+
+def _avaliar_modelo(nome, modelo):
+    """
+    Treina e avalia um modelo dentro de um processo do pool, medindo tempo, memória e tamanho serializado.
+    """
+    X_train, y_train = _dados_comparacao['X_train'], _dados_comparacao['y_train']
+    X_test, y_test = _dados_comparacao['X_test'], _dados_comparacao['y_test']
+    memoria_inicial = pico_memoria_mb()
+
+    inicio = time.perf_counter()
+    modelo.fit(X_train, y_train)
+    tempo_treino = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    previsoes = modelo.predict(X_test)
+    tempo_previsao = time.perf_counter() - inicio
+
+    # Calcular métricas para a classe negativa (pos_label=0)
+    return {
+        "Modelo": nome,
+        "Precisão (Negativo)": precision_score(y_test, previsoes, pos_label=0),
+        "Recall (Negativo)": recall_score(y_test, previsoes, pos_label=0),
+        "F1-Score (Negativo)": f1_score(y_test, previsoes, pos_label=0),
+        "Tempo de Treino (s)": tempo_treino,
+        "Tempo de Previsão (s)": tempo_previsao,
+        "Latência por 1k reviews (ms)": tempo_previsao / X_test.shape[0] * 1000 * 1000,
+        "Pico de Memória (MB)": pico_memoria_mb() - memoria_inicial,
+        "Tamanho do Modelo (MB)": len(pickle.dumps(modelo, protocol=pickle.HIGHEST_PROTOCOL)) / (1024 * 1024)
+    }
+
+def criar_modelos_comparacao(modo_svm='linear', n_jobs_random_forest=1):
+    """
+    Modelos (ainda não treinados) que participam da comparação, pelo nome exibido na tabela.
+    """
+    return {
         "Regressão Logística": LogisticRegression(random_state=42, class_weight='balanced'),
         "Naive Bayes": MultinomialNB(),
-        "Random Forest": RandomForestClassifier(random_state=42, class_weight='balanced'),
-        "SVM": SVC(random_state=42, class_weight='balanced')
+        "Random Forest": RandomForestClassifier(random_state=42, class_weight='balanced', n_jobs=n_jobs_random_forest),
+        f"SVM ({modo_svm})": criar_modelo_svm(modo_svm)
     }
 
-    resultados = []
-    print("\n--- INICIANDO COMPARAÇÃO DE VÁRIOS MODELOS ---")
-    for nome, modelo in modelos.items():
-        print(f"\nTreinando o modelo: {nome}...")
-        modelo.fit(X_train, y_train)
-        previsoes = modelo.predict(X_test)
-        
-        # Calcular métricas para a classe negativa (pos_label=0)
-        precisao = precision_score(y_test, previsoes, pos_label=0)
-        recall = recall_score(y_test, previsoes, pos_label=0)
-        f1 = f1_score(y_test, previsoes, pos_label=0)
-        
-        resultados.append({
-            "Modelo": nome,
-            "Precisão (Negativo)": precisao,
-            "Recall (Negativo)": recall,
-            "F1-Score (Negativo)": f1
-        })
-        print(f"Resultados para {nome} calculados.")
+def comparar_varios_modelos(X_train, y_train, X_test, y_test, modo_svm='linear', n_processos=None, n_jobs_random_forest=1):
+    """
+    Treina, avalia e compara múltiplos modelos de classificação.
+    Gera uma tabela (métricas da classe negativa, tempos, memória e tamanho do modelo) e um gráfico com os resultados.
+
+    Os modelos são treinados ao mesmo tempo, um processo por modelo (n_processos=None usa um por modelo,
+    limitado ao número de núcleos; 1 treina em sequência). Cada processo atende um único modelo, então o
+    'Pico de Memória' é o acréscimo de memória daquele treino. 'n_jobs_random_forest' é repassado ao Random Forest.
+    """
+    # definição dos modelos que vamos comparar
+    modelos = criar_modelos_comparacao(modo_svm, n_jobs_random_forest)
+
+    n_processos = n_processos or min(len(modelos), os.cpu_count() or 1)
+    print(f"\n--- INICIANDO COMPARAÇÃO DE VÁRIOS MODELOS ({n_processos} processo(s)) ---")
+    with multiprocessing.Pool(n_processos, initializer=_inicializar_worker_comparacao,
+                              initargs=(X_train, y_train, X_test, y_test), maxtasksperchild=1) as pool:
+        tarefas = [pool.apply_async(_avaliar_modelo, (nome, modelo)) for nome, modelo in modelos.items()]
+        resultados = []
+        for tarefa in tarefas:
+            resultados.append(tarefa.get())
+            print(f"Resultados para {resultados[-1]['Modelo']} calculados.")
 
     df_resultados = pd.DataFrame(resultados)
     print("\n--- TABELA DE COMPARAÇÃO DE PERFORMANCE (CLASSE NEGATIVA) ---")
-    print(df_resultados)
+    with pd.option_context('display.max_columns', None, 'display.width', 200):
+        print(df_resultados)
 
     print("\n--- Gerando gráfico de comparação geral ---")
-    df_resultados.set_index('Modelo').plot(kind='bar', figsize=(14, 8))
-    plt.title('Comparação de Modelos - Performance na Classe Negativa')
-    plt.ylabel('Pontuação da Métrica (0.0 a 1.0)')
-    plt.xticks(rotation=25, ha='right') # Melhoramos a rotação para não sobrepor
-    plt.grid(axis='y', linestyle='--')
+    df_grafico = df_resultados.set_index('Modelo')
+    colunas_metricas = ["Precisão (Negativo)", "Recall (Negativo)", "F1-Score (Negativo)"]
+    colunas_custo = ["Tempo de Treino (s)", "Latência por 1k reviews (ms)", "Pico de Memória (MB)", "Tamanho do Modelo (MB)"]
+
+    fig = plt.figure(figsize=(18, 12))
+    grade = fig.add_gridspec(2, len(colunas_custo), height_ratios=[3, 2])
+    ax_metricas = fig.add_subplot(grade[0, :])
+    df_grafico[colunas_metricas].plot(kind='bar', ax=ax_metricas)
+    ax_metricas.set_title('Comparação de Modelos - Performance na Classe Negativa')
+    ax_metricas.set_ylabel('Pontuação da Métrica (0.0 a 1.0)')
+    ax_metricas.set_xlabel('')
+    ax_metricas.tick_params(axis='x', rotation=25) # Melhoramos a rotação para não sobrepor
+    ax_metricas.grid(axis='y', linestyle='--')
+
+    # custo de cada modelo: um gráfico por coluna, pois as escalas são diferentes
+    for posicao, coluna in enumerate(colunas_custo):
+        ax = fig.add_subplot(grade[1, posicao])
+        df_grafico[coluna].plot(kind='bar', ax=ax, color='gray')
+        ax.set_title(coluna, fontsize=10)
+        ax.set_xlabel('')
+        ax.tick_params(axis='x', rotation=45, labelsize=8)
+        ax.grid(axis='y', linestyle='--')
+
     plt.tight_layout()
     plt.savefig('./img/comparacao_modelos.png')
     print("Gráfico salvo em './img/comparacao_modelos.png'")
+    return df_resultados
 
 # -------- EXECUÇÃO PRINCIPAL ------------------
 if __name__ == "__main__":
+    ligar_instrumentacao()
     caminho_arquivo = 'csv/olist_order_reviews_dataset.csv'
     
     try:
-        # Etapa 1: Carregar os dados
-        df_inicial = carregar_e_preparar_dados(caminho_arquivo)
-        
-        # Etapa 2: Limpar o texto
-        df_limpo = aplicar_limpeza_de_texto(df_inicial)
-        
-        # Etapa 3: Vetorizar e dividir
-        X_train, X_test, y_train, y_test, vectorizer = vetorizar_e_dividir_dados(df_limpo)
+        # Etapas 1 a 3: Carregar os dados, limpar o texto, vetorizar e dividir (com cache em disco)
+        X_train, X_test, y_train, y_test, vectorizer, texto_teste = preparar_features(caminho_arquivo,
+                                                                                    retornar_texto_teste=True)
         
         # Etapa 4: Treinar e avaliar os dois modelos
-        modelo_padrao, previsoes_padrao = treinar_e_avaliar_modelo(X_train, y_train, X_test, y_test)
-        modelo_balanceado, previsoes_balanceado = treinar_e_avaliar_modelo(X_train, y_train, X_test, y_test, class_weight='balanced')
+        with etapa('4. treinar e avaliar', X_train.shape[0]):
+            modelo_padrao, previsoes_padrao = treinar_e_avaliar_modelo(X_train, y_train, X_test, y_test)
+            modelo_balanceado, previsoes_balanceado = treinar_e_avaliar_modelo(X_train, y_train, X_test, y_test, class_weight='balanced')
         
         # Etapa 5: Analisar o modelo final (balanceado)
-        analisar_razoes_modelo(modelo_balanceado, vectorizer)
+        with etapa('5. analisar razões'):
+            analisar_razoes_modelo(modelo_balanceado, vectorizer)
 
         # Etapa 6: Gerar a comparação visual
-        comparar_modelos_visualmente(y_test, previsoes_padrao, previsoes_balanceado)
+        with etapa('6. comparação visual'):
+            comparar_modelos_visualmente(y_test, previsoes_padrao, previsoes_balanceado)
 
         # Etapa 7: Comparar com outros modelos
-        comparar_varios_modelos(X_train, y_train, X_test, y_test)
+        # modo_svm: 'linear' (padrão, rápido), 'sgd', 'nystroem' (aproximação do kernel RBF) ou 'rbf' (SVC original, lento)
+        with etapa('7. comparar modelos', X_train.shape[0]):
+            comparar_varios_modelos(X_train, y_train, X_test, y_test, modo_svm='linear')
 
         # Etapa 8: Salvar os artefatos do melhor modelo para uso futuro
         # Escolhemos o modelo_balanceado e o vectorizer que foram treinados com todos os dados.
         print("\n--- Salvando o modelo final e o vetorizador ---")
 
-        joblib.dump(modelo_balanceado, './to_predict/modelo_sentimento.joblib')
-        joblib.dump(vectorizer, './to_predict/vetorizador_tfidf.joblib')
+        with etapa('8. salvar artefatos'):
+            # versões antigas do sklearn guardam em 'stop_words_' todos os termos cortados pelo max_features;
+            # o atributo só serve para inspeção e pode ser removido antes de salvar
+            if hasattr(vectorizer, 'stop_words_'):
+                del vectorizer.stop_words_
+            joblib.dump(modelo_balanceado, './to_predict/modelo_sentimento.joblib')
+            joblib.dump(vectorizer, './to_predict/vetorizador_tfidf.joblib')
+
+            print("Modelo e vetorizador salvos como 'modelo_sentimento.joblib' e 'vetorizador_tfidf.joblib' em ./to_predict/")
+
+            # Pipeline único (limpeza + vetorizador + modelo) com fingerprint da configuração
+            pipeline = criar_pipeline(modelo_balanceado, vectorizer, stemizar=STEMIZAR)
+            salvar_pipeline(pipeline)
+
+            # Artefato compacto (um único arquivo, classificado só com numpy) para a inferência
+            exportar_artefato_compacto(modelo_balanceado, vectorizer, stemizar=STEMIZAR)
+
+            # Estatísticas de referência (OOV, cobertura do vocabulário, previsões) para o monitoramento de drift,
+            # no conjunto de teste: fora do ajuste do vetorizador e do modelo, como as reviews classificadas depois
+            monitor = novo_monitor(vectorizer)
+            com_texto = (texto_teste != '').to_numpy()
+            acumular(monitor, texto_teste.to_numpy(), X_test, modelo_balanceado.predict(X_test),
+                     probabilidade_positiva(modelo_balanceado, X_test[com_texto]))
+            salvar_estatisticas_treino(monitor)
 
-        print("Modelo e vetorizador salvos como 'modelo_sentimento.joblib' e 'vetorizador_tfidf.joblib' em ./to_predict/")
+        # Etapa 9: Cabeça multiclasse (negativo/neutro/positivo, inclui as notas 3) sobre o mesmo vetorizador
+        with etapa('9. cabeça multiclasse'):
+            # reaproveita as matrizes do treino binário; só as reviews de nota 3 são limpas e vetorizadas aqui
+            modelo_multiclasse = treinar_cabeca_multiclasse(X_train, y_train, X_test, y_test,
+                                                            vetorizar_neutras(caminho_arquivo, pipeline),
+                                                            modelo_balanceado, PARAMETROS_DIVISAO)
+            salvar_cabeca_multiclasse(modelo_multiclasse, vectorizer)
 
     except FileNotFoundError:
         print(f"ERRO: Arquivo não encontrado em '{caminho_arquivo}'")
@@ -0,0 +1,148 @@
+# validação cruzada estratificada (k folds) dos modelos da comparação, no lugar de uma única divisão 80/20.
+# em cada fold o TF-IDF é ajustado só com as reviews de treino do fold (sem vazar o vocabulário/IDF do teste),
+# e as matrizes do fold ficam no cache de features (.cache/features), então execuções seguintes pulam
+# leitura, limpeza e vetorização.
+# duas fases em paralelo: (1) um processo por fold monta as matrizes; (2) cada par (fold, modelo) é treinado
+# e avaliado em um processo, lendo as matrizes do cache.
+#
+# uso:   python cross_validation.py [csv] [n_folds]
+
+import multiprocessing
+import os
+import sys
+import time
+
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics import precision_score, recall_score, f1_score
+from sklearn.model_selection import StratifiedKFold
+
+import feature_cache
+from instrumentation import etapa, ligar_instrumentacao
+from text_normalizer import configuracao_limpeza
+
+N_FOLDS = 5
+METRICAS = ["Precisão (Negativo)", "Recall (Negativo)", "F1-Score (Negativo)"]
+
+def parametros_fold(n_folds, fold):
+    # entra na chave do cache no lugar dos parâmetros do train_test_split
+    return {'validacao_cruzada': 'StratifiedKFold', 'n_folds': n_folds, 'fold': fold, 'shuffle': True, 'random_state': 42}
+
+# -------- FASE 1: MATRIZES DE CADA FOLD ----------
+# textos limpos e rótulos herdados pelos processos (somente leitura)
+_dados_folds = {}
+
+def _inicializar_worker_folds(texto_limpo, y):
+    _dados_folds.update(texto_limpo=texto_limpo, y=y)
+
+def _preparar_fold(chave, indices_treino, indices_teste):
+    """
+    Ajusta o TF-IDF no treino do fold, transforma treino e teste e salva tudo no cache de features.
+    A remoção de entradas antigas fica para o processo principal: os folds são salvos ao mesmo tempo.
+    """
+    from comparison import PARAMETROS_VETORIZADOR
+
+    inicio = time.perf_counter()
+    texto_limpo, y = _dados_folds['texto_limpo'], _dados_folds['y']
+    vectorizer = TfidfVectorizer(**PARAMETROS_VETORIZADOR)
+    X_train = vectorizer.fit_transform(texto_limpo.iloc[indices_treino])
+    X_test = vectorizer.transform(texto_limpo.iloc[indices_teste])
+    feature_cache.salvar_cache(chave, None, X_train, X_test, y.iloc[indices_treino], y.iloc[indices_teste], vectorizer,
+                               remover_antigas=False)
+    return time.perf_counter() - inicio
+
+# -------- FASE 2: TREINO E AVALIAÇÃO ----------
+def _avaliar_fold(chave, fold, nome):
+    """
+    Treina e avalia um modelo da comparação em um fold, com as matrizes lidas do cache.
+    """
+    from comparison import criar_modelos_comparacao
+
+    entrada = feature_cache.carregar_cache(chave)
+    if entrada is None:
+        raise ValueError(f"as matrizes do fold {fold + 1} ({chave}) não estão mais no cache de features "
+                         f"(removidas depois de montadas); rode a validação de novo para remontá-las.")
+    modelo = criar_modelos_comparacao()[nome]
+
+    inicio = time.perf_counter()
+    modelo.fit(entrada['X_train_tfidf'], entrada['y_train'])
+    tempo_treino = time.perf_counter() - inicio
+    previsoes = modelo.predict(entrada['X_test_tfidf'])
+    y_test = entrada['y_test']
+    return {
+        "Modelo": nome,
+        "Fold": fold + 1,
+        "Precisão (Negativo)": precision_score(y_test, previsoes, pos_label=0),
+        "Recall (Negativo)": recall_score(y_test, previsoes, pos_label=0),
+        "F1-Score (Negativo)": f1_score(y_test, previsoes, pos_label=0),
+        "Tempo de Treino (s)": tempo_treino,
+        "Tempo Total do Fold (s)": time.perf_counter() - inicio,
+    }
+
+def validar_modelos(caminho_arquivo, n_folds=N_FOLDS, n_processos=None):
+    """
+    Avalia os modelos da comparação com k folds estratificados.
+    Retorna (df_folds, df_resumo): uma linha por (modelo, fold) e a média/desvio padrão por modelo.
+    """
+    from comparison import (carregar_e_preparar_dados, aplicar_limpeza_de_texto, criar_modelos_comparacao,
+                            PARAMETROS_VETORIZADOR, STEMIZAR)
+
+    parametros_vetorizador = TfidfVectorizer(**PARAMETROS_VETORIZADOR).get_params()
+    hash_csv = feature_cache.hash_arquivo(caminho_arquivo)
+    chaves = [feature_cache.chave_cache(caminho_arquivo, configuracao_limpeza(stemizar=STEMIZAR), parametros_vetorizador,
+                                        parametros_fold(n_folds, fold), hash_csv=hash_csv) for fold in range(n_folds)]
+    pendentes = [fold for fold, chave in enumerate(chaves)
+                 if not os.path.isdir(os.path.join(feature_cache.DIRETORIO_CACHE, chave))]
+    n_processos = n_processos or os.cpu_count() or 1
+    inicio = time.perf_counter()
+
+    if pendentes:
+        print(f"Montando as matrizes de {len(pendentes)} fold(s) ({n_processos} processo(s))...")
+        df = aplicar_limpeza_de_texto(carregar_e_preparar_dados(caminho_arquivo))
+        y = (df['sentimento'] == 'positivo').astype(int).rename('sentimento_numerico')
+        divisao = list(StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=42).split(df['texto_limpo'], y))
+        with etapa('montar folds', len(df)), multiprocessing.Pool(min(n_processos, len(pendentes)),
+                                                                   initializer=_inicializar_worker_folds,
+                                                                   initargs=(df['texto_limpo'], y)) as pool:
+            tempos = pool.starmap(_preparar_fold, [(chaves[fold], *divisao[fold]) for fold in pendentes])
+        # uma única remoção por tamanho, depois de todos os folds salvos e sem tocar nos folds desta execução
+        feature_cache.remover_entradas_antigas(preservar=set(chaves))
+        for fold, tempo in zip(pendentes, tempos):
+            print(f"Fold {fold + 1}: TF-IDF ajustado e salvo no cache em {tempo:.2f}s")
+    else:
+        print(f"Matrizes dos {n_folds} folds carregadas do cache de features.")
+
+    print(f"Treinando {len(criar_modelos_comparacao())} modelos x {n_folds} folds ({n_processos} processo(s))...")
+    tarefas = [(chaves[fold], fold, nome) for nome in criar_modelos_comparacao() for fold in range(n_folds)]
+    with etapa('treinar e avaliar folds', len(tarefas)), multiprocessing.Pool(n_processos) as pool:
+        df_folds = pd.DataFrame(pool.starmap(_avaliar_fold, tarefas))
+
+    df_resumo = df_folds.groupby('Modelo', sort=False).agg(
+        **{f"{metrica} média": (metrica, 'mean') for metrica in METRICAS},
+        **{f"{metrica} desvio": (metrica, 'std') for metrica in METRICAS},
+        **{"Tempo por Fold (s) média": ("Tempo Total do Fold (s)", 'mean')},
+    )
+    print(f"Validação cruzada concluída em {time.perf_counter() - inicio:.1f}s")
+    return df_folds, df_resumo
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    ligar_instrumentacao()
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+    n_folds = int(sys.argv[2]) if len(sys.argv) > 2 else N_FOLDS
+
+    try:
+        df_folds, df_resumo = validar_modelos(caminho_arquivo, n_folds)
+        with pd.option_context('display.max_columns', None, 'display.width', 200, 'display.precision', 4):
+            print("\n--- RESULTADO POR FOLD (CLASSE NEGATIVA) ---")
+            print(df_folds)
+            print(f"\n--- MÉDIA ± DESVIO PADRÃO EM {n_folds} FOLDS (CLASSE NEGATIVA) ---")
+            for nome, linha in df_resumo.iterrows():
+                metricas = ' | '.join(f"{metrica.split(' (')[0]}: {linha[f'{metrica} média']:.4f} ± {linha[f'{metrica} desvio']:.4f}"
+                                      for metrica in METRICAS)
+                print(f"{nome:<22} {metricas} | {linha['Tempo por Fold (s) média']:.2f}s por fold")
+
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo não encontrado em '{caminho_arquivo}'")
+    except ValueError as e:
+        print(f"ERRO: {e}")
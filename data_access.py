@@ -0,0 +1,159 @@
+# acesso aos dados da Olist: na primeira leitura cada csv/*.csv é convertido para Parquet tipado
+# (ids como category, notas como int8, datas como datetime) em csv/parquet/. As leituras seguintes
+# trazem só as colunas pedidas e aplicam filtros direto no Parquet (ex.: review_score != 3).
+# o Parquet guarda nos metadados o tamanho, a data de modificação e o sha256 do CSV de origem e é refeito
+# quando o CSV muda (mesmo que o CSV novo tenha data mais antiga, como ao extrair um zip ou copiar com cp -p).
+# se o pyarrow não estiver instalado, tudo continua funcionando a partir do CSV (com usecols).
+
+import json
+import os
+
+import pandas as pd
+
+from feature_cache import hash_arquivo
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+DIRETORIO_CSV = './csv'
+CAMINHO_REVIEWS = './csv/olist_order_reviews_dataset.csv'
+COLUNAS_REVIEWS_ML = ['review_id', 'order_id', 'review_score', 'review_comment_message']
+
+# tipos conhecidos; nas demais colunas, '*_id' vira category e o resto é inferido pelo pandas
+TIPOS_COLUNAS = {
+    'review_score': 'int8',
+    'order_item_id': 'int16',
+    'product_name_lenght': 'float32',
+    'product_description_lenght': 'float32',
+    'product_photos_qty': 'float32',
+}
+COLUNAS_DATA = ['review_creation_date', 'review_answer_timestamp', 'shipping_limit_date',
+                'order_purchase_timestamp', 'order_approved_at', 'order_delivered_carrier_date',
+                'order_delivered_customer_date', 'order_estimated_delivery_date']
+
+OPERADORES = {
+    '==': lambda coluna, valor: coluna == valor,
+    '!=': lambda coluna, valor: coluna != valor,
+    '<': lambda coluna, valor: coluna < valor,
+    '<=': lambda coluna, valor: coluna <= valor,
+    '>': lambda coluna, valor: coluna > valor,
+    '>=': lambda coluna, valor: coluna >= valor,
+    'in': lambda coluna, valor: coluna.isin(valor),
+    'not in': lambda coluna, valor: ~coluna.isin(valor),
+}
+
+# -------- CONVERSÃO CSV -> PARQUET ----------
+CHAVE_ORIGEM = b'origem_csv' # metadados do Parquet com a identificação do CSV de origem
+def caminho_parquet(caminho_csv):
+    # csv/arquivo.csv -> csv/parquet/arquivo.parquet
+    diretorio, arquivo = os.path.split(caminho_csv)
+    return os.path.join(diretorio, 'parquet', os.path.splitext(arquivo)[0] + '.parquet')
+
+def listar_tabelas(diretorio=DIRETORIO_CSV):
+    """
+    Caminhos dos arquivos .csv disponíveis no diretório.
+    """
+    return [os.path.join(diretorio, arquivo) for arquivo in sorted(os.listdir(diretorio)) if arquivo.endswith('.csv')]
+
+def tipar_colunas(df):
+    # aplica os tipos compactos: category para ids, inteiros pequenos para notas e datetime para datas
+    for coluna in df.columns:
+        if coluna in TIPOS_COLUNAS:
+            df[coluna] = df[coluna].astype(TIPOS_COLUNAS[coluna])
+        elif coluna in COLUNAS_DATA:
+            df[coluna] = pd.to_datetime(df[coluna])
+        elif coluna.endswith('_id') or coluna.endswith('_prefix'):
+            df[coluna] = df[coluna].astype('category')
+    return df
+
+def origem_csv(caminho_csv, com_hash=True):
+    # tamanho, data de modificação (ns) e sha256 do CSV
+    estado = os.stat(caminho_csv)
+    origem = {'tamanho': estado.st_size, 'mtime_ns': estado.st_mtime_ns}
+    if com_hash:
+        origem['sha256'] = hash_arquivo(caminho_csv)
+    return origem
+
+def converter_para_parquet(caminho_csv):
+    """
+    Lê o CSV uma vez, aplica os tipos e grava o Parquet correspondente, com a origem (origem_csv) nos metadados.
+    A escrita é feita em um arquivo temporário e renomeada no final, para nunca deixar um Parquet pela metade.
+    """
+    destino = caminho_parquet(caminho_csv)
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    origem = origem_csv(caminho_csv)
+    tabela = pa.Table.from_pandas(tipar_colunas(pd.read_csv(caminho_csv)), preserve_index=False)
+    tabela = tabela.replace_schema_metadata({**tabela.schema.metadata, CHAVE_ORIGEM: json.dumps(origem).encode('utf-8')})
+    temporario = f"{destino}.tmp{os.getpid()}"
+    try:
+        pq.write_table(tabela, temporario)
+        os.replace(temporario, destino)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    print(f"'{caminho_csv}' convertido para Parquet em '{destino}'")
+
+def parquet_atualizado(caminho_csv, destino):
+    """
+    True se o Parquet foi gerado a partir do conteúdo atual do CSV. Tamanho diferente = desatualizado; mesmo
+    tamanho e mesma data de modificação = atualizado; mesmo tamanho com outra data = compara o sha256.
+    """
+    if not os.path.exists(destino):
+        return False
+    metadados = pq.read_schema(destino).metadata or {}
+    if CHAVE_ORIGEM not in metadados:
+        return False # Parquet gerado antes de a origem ser registrada
+    registrada = json.loads(metadados[CHAVE_ORIGEM])
+    atual = origem_csv(caminho_csv, com_hash=False)
+    if atual['tamanho'] != registrada['tamanho']:
+        return False
+    return atual['mtime_ns'] == registrada['mtime_ns'] or hash_arquivo(caminho_csv) == registrada['sha256']
+
+def garantir_parquet(caminho_csv):
+    """
+    Retorna True se o Parquet do CSV está disponível e atualizado (convertendo o CSV se preciso).
+    Sem pyarrow, retorna False e as leituras usam o próprio CSV.
+    """
+    if pq is None:
+        return False
+    if not parquet_atualizado(caminho_csv, caminho_parquet(caminho_csv)):
+        converter_para_parquet(caminho_csv)
+    return True
+
+# -------- LEITURA ----------
+def aplicar_filtros(df, filtros):
+    # mesma semântica dos filtros do pyarrow, usada quando a leitura vem do CSV
+    for coluna, operador, valor in filtros or []:
+        df = df[OPERADORES[operador](df[coluna], valor)]
+    return df
+
+def ler_tabela(caminho_csv, colunas=None, filtros=None):
+    """
+    Lê uma tabela da Olist trazendo apenas 'colunas' (None = todas) e as linhas que passam em 'filtros',
+    no formato do pyarrow: [('review_score', '!=', 3)]. Os filtros são aplicados dentro do Parquet.
+    """
+    if garantir_parquet(caminho_csv):
+        return pd.read_parquet(caminho_parquet(caminho_csv), columns=colunas, filters=filtros or None)
+
+    usecols = None
+    if colunas is not None:
+        usecols = list(dict.fromkeys(list(colunas) + [coluna for coluna, _, _ in filtros or []]))
+    df = aplicar_filtros(tipar_colunas(pd.read_csv(caminho_csv, usecols=usecols)), filtros)
+    return (df if colunas is None else df[colunas]).reset_index(drop=True)
+
+def ler_tabela_em_blocos(caminho_csv, colunas=None, tamanho_bloco=50000):
+    """
+    Gera DataFrames de até 'tamanho_bloco' linhas, na ordem do arquivo, sem carregar a tabela inteira.
+    """
+    if garantir_parquet(caminho_csv):
+        arquivo = pq.ParquetFile(caminho_parquet(caminho_csv))
+        for lote in arquivo.iter_batches(batch_size=tamanho_bloco, columns=colunas):
+            yield lote.to_pandas()
+        return
+
+    for bloco in pd.read_csv(caminho_csv, usecols=colunas, chunksize=tamanho_bloco):
+        bloco = tipar_colunas(bloco)
+        yield bloco if colunas is None else bloco[colunas]
@@ -1,6 +1,7 @@
-import pandas as pd
 import os
 
+from data_access import ler_tabela
+
 csv_path = './csv/'
 
 try:
@@ -14,7 +15,7 @@ try:
             print(f"--- Visualizando as 10 primeiras linhas de: {nome_arquivo} ---\n")
             caminho_completo = os.path.join(csv_path, nome_arquivo)
             
-            df = pd.read_csv(caminho_completo)
+            df = ler_tabela(caminho_completo) # leitura via Parquet tipado (convertido na primeira vez)
             print(df.head(10))
             
             print("\n" + "="*80 + "\n")
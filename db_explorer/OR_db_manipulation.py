@@ -1,21 +1,23 @@
 #filtrar e criar uma coluna nova com base em olist_order_reviews_dataset.csv
 #usado de base no script final
 
+import os
+import sys
+
 import numpy as np
-import pandas as pd
+
+# permite importar os módulos da raiz do projeto ao executar 'python db_explorer/OR_db_manipulation.py'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_access import ler_tabela
 
 OR_db = './csv/olist_order_reviews_dataset.csv'
 
 try:
-    # Carregamento dos dados originais
+    # Carregamento dos dados originais + Filtragem
+    # o filtro é aplicado já na leitura (Parquet), sem carregar as reviews de nota 3
     print("Carregando o dataset de reviews...")
-    OR_db = pd.read_csv(OR_db)
-
-    # Filtragem
     print("Filtrando o DataFrame para remover reviews com nota 3...")
-    OR_db_filtrado = OR_db[OR_db['review_score'] != 3].copy()
-    
-    #.copy() para evitar um aviso comum do Pandas (SettingWithCopyWarning)
+    OR_db_filtrado = ler_tabela(OR_db, filtros=[('review_score', '!=', 3)])
 
     # Criação da Variável Alvo ('sentimento')
     print("Criando a nova coluna 'sentimento'...")
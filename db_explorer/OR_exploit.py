@@ -1,13 +1,20 @@
 #order reviews analysis/visualization
 
-import pandas as pd
+import os
+import sys
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# permite importar os módulos da raiz do projeto ao executar 'python db_explorer/OR_exploit.py'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_access import ler_tabela
+
 caminho_arquivo_reviews = './csv/olist_order_reviews_dataset.csv'
 
 try:
-    df_reviews = pd.read_csv(caminho_arquivo_reviews)
+    # só a coluna de notas é necessária para este gráfico
+    df_reviews = ler_tabela(caminho_arquivo_reviews, colunas=['review_score'])
 
     print("--- Análise da distribuição da coluna 'review_score' ---\n")
     
@@ -4,4 +4,5 @@ import nltk
 
 print("Baixando a lista de stopwords, aguarde...")
 nltk.download('stopwords')
+nltk.download('rslp') # stemmer de português, usado quando a limpeza reduz as palavras aos radicais
 print("Download concluído com sucesso!")
\ No newline at end of file
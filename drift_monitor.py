@@ -0,0 +1,219 @@
+# monitoramento de drift e vazão a cada classificação: quantos tokens dos textos limpos ficam fora do
+# vocabulário do TfidfVectorizer (OOV), quanto do vocabulário aparece, a distribuição das previsões e da
+# probabilidade de positivo, e a vazão de cada etapa (da instrumentação). Tudo é acumulado em contadores
+# bloco a bloco e comparado com as mesmas estatísticas calculadas pelo comparison.py no conjunto de teste
+# (reviews fora do ajuste do modelo, sem nota 3), gravadas em CAMINHO_ESTATISTICAS_TREINO. As reviews de
+# nota 3, que o treino binário não tem, ficam fora dos contadores e só são contadas à parte. Um vetorizador
+# que recebe textos limpos de outro jeito (ex.: com acentos) aparece na hora como um salto da taxa de OOV.
+#
+# uso:   python drift_monitor.py [relatorio.json]     (mostra um relatório salvo, por padrão o mais recente)
+
+import glob
+import json
+import os
+import re
+import sys
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from instrumentation import resumir
+from multiclass_head import fingerprint_vetorizador
+
+CAMINHO_ESTATISTICAS_TREINO = './to_predict/estatisticas_treino.json'
+DIRETORIO_RELATORIOS_MONITOR = os.environ.get('MONITORAMENTO_DIR', './.cache/monitoramento')
+FAIXAS_PROBABILIDADE = np.linspace(0, 1, 11) # 10 faixas de P(positivo)
+TOP_OOV = 10
+# diferenças em relação ao treino que geram alerta no relatório
+LIMITES_ALERTA = {
+    'taxa_oov': 0.05,              # mudança absoluta da fração de tokens fora do vocabulário
+    'proporcao_negativas': 0.10,   # mudança absoluta da fração prevista como negativa
+    'psi_probabilidades': 0.2,     # índice de estabilidade populacional das faixas de P(positivo)
+    'divergencia_termos': 0.1,     # divergência de Jensen-Shannon entre as frequências dos termos
+}
+
+# -------- CONTADORES ----------
+def novo_monitor(vectorizer):
+    """
+    Contadores vazios para um vetorizador já treinado. São somados a cada bloco por 'acumular'.
+    """
+    return {
+        'vetorizador': fingerprint_vetorizador(vectorizer),
+        'vocabulario': vectorizer.vocabulary_,
+        'padrao_token': re.compile(vectorizer.token_pattern),
+        'documentos': 0,
+        'neutras_ignoradas': 0,
+        'vazios': 0,
+        'tokens': 0,
+        'tokens_oov': 0,
+        'oov': Counter(),
+        'frequencia_documentos': np.zeros(len(vectorizer.vocabulary_), dtype=np.int64),
+        'previsoes': np.zeros(2, dtype=np.int64),
+        'histograma': np.zeros(len(FAIXAS_PROBABILIDADE) - 1, dtype=np.int64),
+    }
+
+def probabilidade_positiva(modelo, X):
+    # P(positivo) das linhas de X; modelos sem predict_proba ficam fora do histograma
+    if not hasattr(modelo, 'predict_proba') or not X.shape[0]:
+        return None
+    return modelo.predict_proba(X)[:, list(modelo.classes_).index(1)]
+
+def acumular(monitor, textos_limpos, X, previsoes, prob_positivo=None, notas=None):
+    """
+    Soma um bloco aos contadores: 'textos_limpos' e 'previsoes' (0/1) têm uma posição por review, X é a
+    matriz TF-IDF do bloco (linhas zeradas não contam) e 'prob_positivo' a P(positivo) das linhas com texto.
+    Com 'notas' (uma por review), as reviews de nota 3 ficam de fora, como no treino; nesse caso X e
+    'prob_positivo' devem ter uma linha por texto não vazio (como em vetorizar_com_atalho).
+    Os tokens do bloco inteiro saem de uma única busca com o token_pattern do vetorizador, e só os tokens
+    distintos são procurados no vocabulário.
+    """
+    textos_limpos = np.asarray(textos_limpos, dtype=object)
+    if notas is not None:
+        manter = np.asarray(notas) != 3
+        manter_linhas = manter[textos_limpos != '']
+        monitor['neutras_ignoradas'] += int((~manter).sum())
+        textos_limpos, previsoes, X = textos_limpos[manter], np.asarray(previsoes)[manter], X[manter_linhas]
+        prob_positivo = None if prob_positivo is None else np.asarray(prob_positivo)[manter_linhas]
+    contagem = Counter(monitor['padrao_token'].findall(' '.join(textos_limpos)))
+    vocabulario = monitor['vocabulario']
+    oov = {token: quantidade for token, quantidade in contagem.items() if token not in vocabulario}
+
+    monitor['documentos'] += len(textos_limpos)
+    monitor['vazios'] += int((textos_limpos == '').sum())
+    monitor['tokens'] += sum(contagem.values())
+    monitor['tokens_oov'] += sum(oov.values())
+    monitor['oov'].update(oov)
+    # X em CSR: cada termo aparece uma vez por linha em X.indices, então a contagem é a frequência em documentos
+    monitor['frequencia_documentos'] += np.bincount(X.indices, minlength=len(monitor['frequencia_documentos']))
+    monitor['previsoes'] += np.bincount(np.asarray(previsoes, dtype=np.int64), minlength=2)[:2]
+    if prob_positivo is not None:
+        monitor['histograma'] += np.histogram(prob_positivo, FAIXAS_PROBABILIDADE)[0]
+
+# -------- RESUMO E COMPARAÇÃO ----------
+def resumir_monitor(monitor, incluir_frequencias=False):
+    """
+    Estatísticas do que foi acumulado. As frequências de cada termo (uma por termo do vocabulário) só
+    entram quando pedidas: são guardadas no treino, mas deixariam o relatório de cada execução grande.
+    """
+    documentos, tokens = monitor['documentos'], monitor['tokens']
+    com_texto = documentos - monitor['vazios']
+    histograma = monitor['histograma']
+    resumo = {
+        'vetorizador': monitor['vetorizador'],
+        'documentos': documentos,
+        'neutras_ignoradas': monitor['neutras_ignoradas'],
+        'taxa_vazios': monitor['vazios'] / documentos if documentos else 0.0,
+        'tokens_por_documento': tokens / com_texto if com_texto else 0.0,
+        'taxa_oov': monitor['tokens_oov'] / tokens if tokens else 0.0,
+        'cobertura_vocabulario': float((monitor['frequencia_documentos'] > 0).mean()),
+        'proporcao_negativas': float(monitor['previsoes'][0] / documentos) if documentos else 0.0,
+        'faixas_probabilidade': (histograma / histograma.sum()).tolist() if histograma.sum() else None,
+        'top_oov': monitor['oov'].most_common(TOP_OOV),
+    }
+    if incluir_frequencias:
+        resumo['frequencia_documentos'] = monitor['frequencia_documentos'].tolist()
+    return resumo
+
+def _psi(esperado, observado, minimo=1e-4):
+    esperado, observado = np.clip(esperado, minimo, None), np.clip(observado, minimo, None)
+    return float(np.sum((observado - esperado) * np.log(observado / esperado)))
+
+def _jensen_shannon(p, q):
+    p, q = p / p.sum(), q / q.sum()
+    m = (p + q) / 2
+    entropia_relativa = lambda a: float(np.sum(a[a > 0] * np.log2(a[a > 0] / m[a > 0])))
+    return (entropia_relativa(p) + entropia_relativa(q)) / 2
+
+def comparar_com_treino(monitor, treino):
+    """
+    Diferenças entre o que foi classificado e as estatísticas do treino, com os alertas acima de LIMITES_ALERTA.
+    """
+    resumo = resumir_monitor(monitor)
+    if resumo['vetorizador'] != treino['vetorizador']:
+        return {'alertas': ["estatísticas de treino de outro vetorizador; rode comparison.py para atualizá-las"]}
+
+    comparacao = {metrica: resumo[metrica] - treino[metrica]
+                  for metrica in ('taxa_vazios', 'tokens_por_documento', 'taxa_oov', 'cobertura_vocabulario',
+                                  'proporcao_negativas')}
+    if resumo['faixas_probabilidade'] and treino.get('faixas_probabilidade'):
+        comparacao['psi_probabilidades'] = _psi(np.array(treino['faixas_probabilidade']),
+                                                np.array(resumo['faixas_probabilidade']))
+    if monitor['frequencia_documentos'].any():
+        comparacao['divergencia_termos'] = _jensen_shannon(np.array(treino['frequencia_documentos'], dtype=np.float64),
+                                                           monitor['frequencia_documentos'].astype(np.float64))
+
+    alertas = [f"{metrica}: {comparacao[metrica]:+.3f} (limite {limite})"
+               for metrica, limite in LIMITES_ALERTA.items() if abs(comparacao.get(metrica, 0.0)) > limite]
+    return {**comparacao, 'alertas': alertas}
+
+# -------- ARQUIVOS ----------
+def salvar_estatisticas_treino(monitor, caminho=CAMINHO_ESTATISTICAS_TREINO):
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(resumir_monitor(monitor, incluir_frequencias=True), arquivo, ensure_ascii=False)
+    print(f"Estatísticas de treino para o monitoramento salvas em '{caminho}'")
+
+def carregar_estatisticas_treino(caminho=CAMINHO_ESTATISTICAS_TREINO):
+    try:
+        with open(caminho, encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    except FileNotFoundError:
+        return None
+
+def escrever_relatorio_monitor(monitor, caminho_treino=CAMINHO_ESTATISTICAS_TREINO):
+    """
+    Imprime o resumo do monitoramento (com a comparação com o treino, se houver) e grava o relatório em JSON.
+    A vazão de cada etapa vem dos eventos da instrumentação desta execução.
+    """
+    resumo = resumir_monitor(monitor)
+    treino = carregar_estatisticas_treino(caminho_treino)
+    # no modo incremental, uma execução que só reaproveita previsões guardadas não tem o que comparar
+    comparacao = comparar_com_treino(monitor, treino) if treino and resumo['documentos'] else None
+    vazao = [{'etapa': item['etapa'], 'linhas': item['linhas_saida'] or item['linhas_entrada'], 'tempo_s': item['tempo_s'],
+              'linhas_por_s': (item['linhas_saida'] or item['linhas_entrada']) / item['tempo_s'] if item['tempo_s'] else None}
+             for item in resumir()]
+
+    print("\n--- MONITORAMENTO ---")
+    print(f"{resumo['documentos']} reviews | vazias: {resumo['taxa_vazios']:.1%} | tokens fora do vocabulário: "
+          f"{resumo['taxa_oov']:.1%} | vocabulário coberto: {resumo['cobertura_vocabulario']:.1%} | "
+          f"previstas negativas: {resumo['proporcao_negativas']:.1%}")
+    if resumo['neutras_ignoradas']:
+        print(f"{resumo['neutras_ignoradas']} reviews de nota 3 fora dos contadores (a referência do treino não tem nota 3).")
+    if not resumo['documentos']:
+        print("Nenhuma review passou pelo pipeline nesta execução; nada para comparar.")
+    elif comparacao is None:
+        print(f"Sem estatísticas de treino em '{caminho_treino}' (geradas pelo comparison.py); nada para comparar.")
+    else:
+        print("Diferença para o treino: " + ' | '.join(f"{metrica} {valor:+.3f}" for metrica, valor in comparacao.items()
+                                                    if metrica != 'alertas'))
+        for alerta in comparacao['alertas']:
+            print(f"ALERTA de drift: {alerta}")
+    for item in vazao:
+        if item['linhas'] and item['linhas_por_s']:
+            print(f"Vazão '{item['etapa']}': {item['linhas_por_s']:,.0f} linhas/s")
+
+    os.makedirs(DIRETORIO_RELATORIOS_MONITOR, exist_ok=True)
+    caminho = os.path.join(DIRETORIO_RELATORIOS_MONITOR, f"monitor_{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump({'resumo': resumo, 'comparacao_treino': comparacao, 'vazao': vazao}, arquivo, ensure_ascii=False, indent=2)
+    print(f"Relatório de monitoramento salvo em '{caminho}'")
+    return caminho
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    relatorios = sorted(glob.glob(os.path.join(DIRETORIO_RELATORIOS_MONITOR, 'monitor_*.json')))
+    caminho_relatorio = sys.argv[1] if len(sys.argv) > 1 else (relatorios[-1] if relatorios else None)
+
+    try:
+        if caminho_relatorio is None:
+            raise FileNotFoundError
+        with open(caminho_relatorio, encoding='utf-8') as arquivo:
+            relatorio = json.load(arquivo)
+        print(f"--- {caminho_relatorio} ---")
+        print(json.dumps(relatorio['resumo'], ensure_ascii=False, indent=2))
+        if relatorio['comparacao_treino']:
+            print("\nDiferença para o treino:")
+            print(json.dumps(relatorio['comparacao_treino'], ensure_ascii=False, indent=2))
+
+    except FileNotFoundError:
+        print("ERRO: nenhum relatório encontrado (rode review_classification.py com monitorar = True).")
@@ -1,10 +1,15 @@
-import pandas as pd
+import os
+import sys
+
+# permite importar os módulos da raiz do projeto ao executar 'python enhance/data_directed.py'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_access import ler_tabela
 
 # 1. Focar nos arquivos que parecem mais relevantes para o nosso objetivo
 arquivo_principal = './csv/olist_order_reviews_dataset.csv'
 
 print("--- ANÁLISE DIRECIONADA: Investigando a tabela de Reviews ---")
-df_reviews = pd.read_csv(arquivo_principal)
+df_reviews = ler_tabela(arquivo_principal)
 
 print("\n[INFO] Informações Gerais da Tabela de Reviews:")
 df_reviews.info()
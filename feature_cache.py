@@ -0,0 +1,113 @@
+# cache em disco do texto limpo e das matrizes TF-IDF de treino/teste.
+# a chave combina o conteúdo do CSV, a configuração da limpeza e os parâmetros do vetorizador,
+# então qualquer mudança em um deles gera uma entrada nova.
+
+import hashlib
+import json
+import os
+import shutil
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+DIRETORIO_CACHE = './.cache/features'
+TAMANHO_MAXIMO_CACHE = 2 * 1024 ** 3 # 2 GB
+
+# -------- CHAVE DO CACHE ----------
+def hash_arquivo(caminho_arquivo, tamanho_bloco=1024 * 1024):
+    """
+    Calcula o sha256 do conteúdo do arquivo, lendo em blocos para não carregar tudo na memória.
+    """
+    sha = hashlib.sha256()
+    with open(caminho_arquivo, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+def chave_cache(caminho_arquivo, config_limpeza, parametros_vetorizador, parametros_divisao, hash_csv=None):
+    """
+    Gera a chave do cache a partir do arquivo de entrada e de toda a configuração que afeta as features.
+    'hash_csv' evita recalcular o hash do arquivo quando várias chaves são geradas para o mesmo CSV.
+    """
+    descricao = {
+        'arquivo': hash_csv or hash_arquivo(caminho_arquivo),
+        'limpeza': config_limpeza,
+        'vetorizador': parametros_vetorizador,
+        'divisao': parametros_divisao,
+    }
+    texto = json.dumps(descricao, sort_keys=True, default=str)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()[:32]
+
+# -------- LEITURA E ESCRITA ----------
+def carregar_cache(chave, diretorio=DIRETORIO_CACHE):
+    """
+    Retorna as features salvas para a chave, ou None se não houver entrada no cache.
+    """
+    pasta = os.path.join(diretorio, chave)
+    if not os.path.isdir(pasta):
+        return None
+
+    indices_treino = np.load(os.path.join(pasta, 'indices_treino.npy'), allow_pickle=True)
+    indices_teste = np.load(os.path.join(pasta, 'indices_teste.npy'), allow_pickle=True)
+    entrada = {
+        'texto_limpo': joblib.load(os.path.join(pasta, 'texto_limpo.joblib')),
+        'X_train_tfidf': sparse.load_npz(os.path.join(pasta, 'X_train_tfidf.npz')),
+        'X_test_tfidf': sparse.load_npz(os.path.join(pasta, 'X_test_tfidf.npz')),
+        'y_train': pd.Series(np.load(os.path.join(pasta, 'y_train.npy')), index=indices_treino, name='sentimento_numerico'),
+        'y_test': pd.Series(np.load(os.path.join(pasta, 'y_test.npy')), index=indices_teste, name='sentimento_numerico'),
+        'vectorizer': joblib.load(os.path.join(pasta, 'vetorizador_tfidf.joblib')),
+    }
+    os.utime(pasta) # marca como usada recentemente, para a remoção por tamanho
+    return entrada
+
+def salvar_cache(chave, texto_limpo, X_train_tfidf, X_test_tfidf, y_train, y_test, vectorizer,
+                 diretorio=DIRETORIO_CACHE, tamanho_maximo=TAMANHO_MAXIMO_CACHE, remover_antigas=True):
+    """
+    Salva o texto limpo, as matrizes esparsas (.npz), os índices da divisão e o vetorizador.
+    A escrita é feita em uma pasta temporária e renomeada no final, para nunca deixar entradas pela metade.
+    Processos que salvam em paralelo devem passar remover_antigas=False e deixar a remoção por tamanho
+    para o processo principal, depois que todos terminarem (ver remover_entradas_antigas).
+    """
+    pasta = os.path.join(diretorio, chave)
+    pasta_temporaria = f"{pasta}.tmp{os.getpid()}"
+    os.makedirs(pasta_temporaria, exist_ok=True)
+
+    joblib.dump(texto_limpo, os.path.join(pasta_temporaria, 'texto_limpo.joblib'))
+    sparse.save_npz(os.path.join(pasta_temporaria, 'X_train_tfidf.npz'), X_train_tfidf)
+    sparse.save_npz(os.path.join(pasta_temporaria, 'X_test_tfidf.npz'), X_test_tfidf)
+    np.save(os.path.join(pasta_temporaria, 'indices_treino.npy'), y_train.index.to_numpy())
+    np.save(os.path.join(pasta_temporaria, 'indices_teste.npy'), y_test.index.to_numpy())
+    np.save(os.path.join(pasta_temporaria, 'y_train.npy'), y_train.to_numpy())
+    np.save(os.path.join(pasta_temporaria, 'y_test.npy'), y_test.to_numpy())
+    joblib.dump(vectorizer, os.path.join(pasta_temporaria, 'vetorizador_tfidf.joblib'))
+
+    if os.path.isdir(pasta):
+        shutil.rmtree(pasta)
+    os.replace(pasta_temporaria, pasta)
+    if remover_antigas:
+        remover_entradas_antigas(diretorio, tamanho_maximo)
+
+# -------- LIMPEZA DO CACHE ----------
+def tamanho_pasta(pasta):
+    return sum(entrada.stat().st_size for entrada in os.scandir(pasta) if entrada.is_file())
+
+def remover_entradas_antigas(diretorio=DIRETORIO_CACHE, tamanho_maximo=TAMANHO_MAXIMO_CACHE, preservar=()):
+    """
+    Remove as entradas usadas há mais tempo até o cache caber em 'tamanho_maximo' bytes.
+    As chaves em 'preservar' (ex.: as de todos os folds de uma execução) e a entrada mais recente nunca são removidas.
+    """
+    entradas = [entrada for entrada in os.scandir(diretorio) if entrada.is_dir() and '.tmp' not in entrada.name]
+    entradas.sort(key=lambda entrada: entrada.stat().st_mtime) # mais antigas primeiro
+    tamanhos = {entrada.path: tamanho_pasta(entrada.path) for entrada in entradas}
+    total = sum(tamanhos.values())
+
+    for entrada in entradas[:-1]: # nunca remove a entrada mais recente
+        if total <= tamanho_maximo:
+            break
+        if entrada.name in preservar:
+            continue
+        shutil.rmtree(entrada.path)
+        total -= tamanhos[entrada.path]
+        print(f"Cache: entrada antiga '{entrada.name}' removida")
@@ -0,0 +1,184 @@
+# busca de hiperparâmetros do vetorizador (max_features, ngram_range, min_df) e da Regressão Logística
+# (C, class_weight), otimizando a classe negativa com successive halving:
+#   - na primeira rodada todos os candidatos treinam com poucas reviews;
+#   - a cada rodada só o melhor 1/FATOR continua, com FATOR vezes mais reviews;
+#   - a última rodada usa o treino inteiro.
+# os candidatos que compartilham a configuração do vetorizador são avaliados juntos: o TF-IDF é ajustado uma
+# vez por configuração e rodada, e as matrizes servem para todos os classificadores do grupo.
+# os grupos são distribuídos entre os núcleos. A avaliação usa uma validação separada do treino; o conjunto
+# de teste (o mesmo do comparison.py) só é usado no final, para o melhor candidato.
+#
+# uso:   python hyperparameter_search.py [csv] [metrica: f1 | recall]
+
+import itertools
+import math
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import precision_score, recall_score, f1_score
+from sklearn.model_selection import train_test_split
+
+ESPACO_VETORIZADOR = {
+    'max_features': [5000, 20000, None],
+    'ngram_range': [(1, 1), (1, 2)],
+    'min_df': [1, 2, 5],
+}
+ESPACO_CLASSIFICADOR = {
+    'C': [0.1, 1.0, 10.0],
+    'class_weight': [None, 'balanced'],
+}
+FATOR = 3
+MINIMO_AMOSTRAS = 2000
+METRICAS = {
+    'f1': lambda y, previsoes: f1_score(y, previsoes, pos_label=0),
+    'recall': lambda y, previsoes: recall_score(y, previsoes, pos_label=0),
+}
+
+def gerar_candidatos(espaco):
+    # produto cartesiano do espaço: {'a': [1, 2], 'b': [3]} -> [{'a': 1, 'b': 3}, {'a': 2, 'b': 3}]
+    return [dict(zip(espaco, valores)) for valores in itertools.product(*espaco.values())]
+
+def descrever(parametros):
+    return ', '.join(f"{nome}={valor}" for nome, valor in parametros.items())
+
+# -------- AVALIAÇÃO (PROCESSOS DO POOL) ----------
+# textos e rótulos herdados pelos processos da busca (somente leitura)
+_dados_busca = {}
+
+def _inicializar_worker_busca(textos_treino, y_treino, textos_validacao, y_validacao, metrica):
+    _dados_busca.update(textos_treino=textos_treino, y_treino=y_treino,
+                        textos_validacao=textos_validacao, y_validacao=y_validacao, metrica=metrica)
+
+def _avaliar_grupo(parametros_vetorizador, lista_parametros_classificador, n_amostras):
+    """
+    Ajusta o TF-IDF uma única vez nas primeiras 'n_amostras' reviews de treino e avalia, na validação,
+    todos os classificadores que usam essa configuração de vetorizador.
+    """
+    textos, y = _dados_busca['textos_treino'][:n_amostras], _dados_busca['y_treino'][:n_amostras]
+    inicio = time.perf_counter()
+    vectorizer = TfidfVectorizer(**parametros_vetorizador)
+    X = vectorizer.fit_transform(textos)
+    X_validacao = vectorizer.transform(_dados_busca['textos_validacao'])
+    tempo_vetorizacao = time.perf_counter() - inicio
+
+    resultados = []
+    for parametros_classificador in lista_parametros_classificador:
+        inicio = time.perf_counter()
+        modelo = LogisticRegression(random_state=42, max_iter=1000, **parametros_classificador)
+        modelo.fit(X, y)
+        previsoes = modelo.predict(X_validacao)
+        resultados.append({
+            'vetorizador': parametros_vetorizador,
+            'classificador': parametros_classificador,
+            'n_amostras': n_amostras,
+            'pontuacao': METRICAS[_dados_busca['metrica']](_dados_busca['y_validacao'], previsoes),
+            'Recall (Negativo)': recall_score(_dados_busca['y_validacao'], previsoes, pos_label=0),
+            'F1-Score (Negativo)': f1_score(_dados_busca['y_validacao'], previsoes, pos_label=0),
+            'Tempo de Treino (s)': time.perf_counter() - inicio,
+            'Tempo de Vetorização (s)': tempo_vetorizacao,
+            'Features': X.shape[1],
+        })
+    return resultados
+
+# -------- SUCCESSIVE HALVING ----------
+def buscar_hiperparametros(textos_treino, y_treino, metrica='f1', fator=FATOR, minimo_amostras=MINIMO_AMOSTRAS,
+                           n_processos=None, espaco_vetorizador=ESPACO_VETORIZADOR, espaco_classificador=ESPACO_CLASSIFICADOR):
+    """
+    Roda o successive halving sobre o produto dos dois espaços e retorna (melhor, df_historico):
+    'melhor' é o dict do candidato vencedor e 'df_historico' tem uma linha por avaliação.
+    20% do treino vira validação (estratificado); as amostras de cada rodada são um prefixo de uma
+    permutação fixa do restante, então cada rodada contém as reviews da anterior.
+    """
+    if metrica not in METRICAS:
+        raise ValueError(f"metrica deve ser uma de {list(METRICAS)}, não '{metrica}'")
+    textos_treino, textos_validacao, y_treino, y_validacao = train_test_split(
+        np.asarray(textos_treino, dtype=object), np.asarray(y_treino), test_size=0.2, stratify=y_treino, random_state=42)
+    permutacao = np.random.RandomState(42).permutation(len(textos_treino))
+    textos_treino, y_treino = textos_treino[permutacao], y_treino[permutacao]
+
+    candidatos = [(v, c) for v in gerar_candidatos(espaco_vetorizador) for c in gerar_candidatos(espaco_classificador)]
+    n_rodadas = max(1, math.ceil(math.log(len(candidatos), fator)))
+    n_processos = n_processos or os.cpu_count() or 1
+    print(f"Busca: {len(candidatos)} candidatos, {n_rodadas} rodadas, fator {fator}, métrica '{metrica}' "
+          f"(classe negativa), {n_processos} processo(s)")
+
+    historico = []
+    with multiprocessing.Pool(n_processos, initializer=_inicializar_worker_busca,
+                              initargs=(textos_treino, y_treino, textos_validacao, y_validacao, metrica)) as pool:
+        for rodada in range(n_rodadas):
+            n_amostras = max(minimo_amostras, len(textos_treino) // fator ** (n_rodadas - 1 - rodada))
+            n_amostras = min(n_amostras, len(textos_treino))
+
+            # agrupa pelo vetorizador: um ajuste de TF-IDF por grupo, não por candidato
+            grupos = {}
+            for parametros_vetorizador, parametros_classificador in candidatos:
+                chave = tuple(sorted(parametros_vetorizador.items()))
+                grupos.setdefault(chave, (parametros_vetorizador, []))[1].append(parametros_classificador)
+
+            inicio = time.perf_counter()
+            tarefas = [(v, lista, n_amostras) for v, lista in grupos.values()]
+            resultados = [r for grupo in pool.starmap(_avaliar_grupo, tarefas) for r in grupo]
+            for resultado in resultados:
+                resultado['rodada'] = rodada + 1
+            historico.extend(resultados)
+
+            resultados.sort(key=lambda r: r['pontuacao'], reverse=True)
+            n_mantidos = 1 if rodada == n_rodadas - 1 else max(1, math.ceil(len(resultados) / fator))
+            candidatos = [(r['vetorizador'], r['classificador']) for r in resultados[:n_mantidos]]
+            print(f"Rodada {rodada + 1}: {len(resultados)} candidatos, {len(grupos)} ajustes de TF-IDF, "
+                  f"{n_amostras} reviews, {time.perf_counter() - inicio:.1f}s; melhor {metrica} = {resultados[0]['pontuacao']:.4f}")
+
+    df_historico = pd.DataFrame(historico)
+    df_historico['vetorizador'] = df_historico['vetorizador'].map(descrever)
+    df_historico['classificador'] = df_historico['classificador'].map(descrever)
+    melhor = {'vetorizador': candidatos[0][0], 'classificador': candidatos[0][1]}
+    return melhor, df_historico
+
+def avaliar_no_teste(melhor, textos_treino, y_treino, textos_teste, y_teste):
+    """
+    Treina o candidato vencedor no treino inteiro e mede a classe negativa no conjunto de teste.
+    """
+    vectorizer = TfidfVectorizer(**melhor['vetorizador'])
+    modelo = LogisticRegression(random_state=42, max_iter=1000, **melhor['classificador'])
+    modelo.fit(vectorizer.fit_transform(textos_treino), y_treino)
+    previsoes = modelo.predict(vectorizer.transform(textos_teste))
+    return {
+        "Precisão (Negativo)": precision_score(y_teste, previsoes, pos_label=0),
+        "Recall (Negativo)": recall_score(y_teste, previsoes, pos_label=0),
+        "F1-Score (Negativo)": f1_score(y_teste, previsoes, pos_label=0),
+    }
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    from comparison import carregar_e_preparar_dados, aplicar_limpeza_de_texto, PARAMETROS_DIVISAO
+
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+    metrica = sys.argv[2] if len(sys.argv) > 2 else 'f1'
+
+    try:
+        df = aplicar_limpeza_de_texto(carregar_e_preparar_dados(caminho_arquivo))
+        y = (df['sentimento'] == 'positivo').astype(int)
+        # mesma divisão treino/teste do comparison.py
+        X_treino, X_teste, y_treino, y_teste = train_test_split(df['texto_limpo'], y, stratify=y, **PARAMETROS_DIVISAO)
+
+        melhor, df_historico = buscar_hiperparametros(X_treino, y_treino, metrica)
+
+        print("\n--- MELHORES CANDIDATOS DA ÚLTIMA RODADA ---")
+        ultima = df_historico[df_historico['rodada'] == df_historico['rodada'].max()]
+        with pd.option_context('display.max_columns', None, 'display.width', 200, 'display.max_colwidth', 80):
+            print(ultima.sort_values('pontuacao', ascending=False).drop(columns='rodada'))
+
+        print(f"\nVencedor: vetorizador({descrever(melhor['vetorizador'])}), "
+              f"LogisticRegression({descrever(melhor['classificador'])})")
+        print("No conjunto de teste:", {nome: round(valor, 4) for nome, valor in avaliar_no_teste(
+            melhor, X_treino, y_treino, X_teste, y_teste).items()})
+        print("Para usar no treino, ajuste PARAMETROS_VETORIZADOR em comparison.py.")
+
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo não encontrado em '{caminho_arquivo}'")
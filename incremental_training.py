@@ -0,0 +1,148 @@
+# treino incremental (out-of-core): o CSV é lido em blocos e nenhum passo precisa do corpus inteiro na memória.
+# HashingVectorizer (sem vocabulário) + IDF calculado em streaming + classificadores com partial_fit.
+#
+# passos sobre o CSV:
+#   1. conta em quantos documentos de treino cada feature aparece (para o IDF) e a frequência das classes;
+#   2. treina os classificadores bloco a bloco com partial_fit;
+#   3. avalia no conjunto de teste, também em blocos.
+# a divisão treino/teste é feita pelo hash do review_id (20% no teste), então é a mesma em todos os passos.
+
+import sys
+import zlib
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import precision_score, recall_score, f1_score
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.preprocessing import normalize
+
+from data_access import ler_tabela_em_blocos
+from text_normalizer import normalize_many
+
+COLUNAS_NECESSARIAS = ['review_id', 'review_score', 'review_comment_message']
+N_FEATURES = 2 ** 18
+PERCENTUAL_TESTE = 20
+CLASSES = np.array([0, 1])
+
+# -------- LEITURA EM BLOCOS ----------
+def ler_blocos(caminho_arquivo, tamanho_chunk, conjunto):
+    """
+    Gera (textos limpos, rótulos) de cada bloco do CSV, apenas das linhas do conjunto pedido ('treino' ou 'teste').
+    Reviews de nota 3 são descartadas, como no treino em memória.
+    """
+    for chunk in ler_tabela_em_blocos(caminho_arquivo, COLUNAS_NECESSARIAS, tamanho_chunk):
+        chunk = chunk[chunk['review_score'] != 3]
+        no_teste = chunk['review_id'].astype(str).map(lambda review_id: zlib.crc32(str(review_id).encode()) % 100 < PERCENTUAL_TESTE)
+        chunk = chunk[no_teste if conjunto == 'teste' else ~no_teste]
+        if chunk.empty:
+            continue
+        textos = normalize_many(chunk['review_comment_message'].fillna(''))
+        rotulos = (chunk['review_score'] > 3).astype(int).to_numpy()
+        yield textos, rotulos
+
+def criar_vetorizador():
+    # sem sinal alternado e sem normalização: a normalização L2 é feita depois de aplicar o IDF
+    return HashingVectorizer(n_features=N_FEATURES, alternate_sign=False, norm=None)
+
+# -------- IDF EM STREAMING ----------
+def calcular_idf(caminho_arquivo, vectorizer, tamanho_chunk):
+    """
+    Passo 1: acumula a frequência de documentos de cada feature e a contagem de cada classe.
+    O IDF segue a fórmula do TfidfTransformer (smooth_idf=True): ln((1 + n) / (1 + df)) + 1.
+    """
+    frequencia_documentos = np.zeros(N_FEATURES, dtype=np.int64)
+    contagem_classes = np.zeros(len(CLASSES), dtype=np.int64)
+    for textos, rotulos in ler_blocos(caminho_arquivo, tamanho_chunk, 'treino'):
+        X = vectorizer.transform(textos)
+        frequencia_documentos += np.bincount(X.indices, minlength=N_FEATURES) # índices únicos por linha
+        contagem_classes += np.bincount(rotulos, minlength=len(CLASSES))
+
+    n_documentos = contagem_classes.sum()
+    idf = np.log((1 + n_documentos) / (1 + frequencia_documentos)) + 1
+    return idf, contagem_classes
+
+def transformar(vectorizer, idf, textos):
+    # TF (contagens) * IDF, normalizado por linha (L2), como no TfidfVectorizer
+    return normalize(vectorizer.transform(textos) @ sparse.diags(idf))
+
+# -------- TREINO E AVALIAÇÃO ----------
+def treinar_incremental(caminho_arquivo, tamanho_chunk=20000):
+    """
+    Treina SGD (regressão logística) e Multinomial Naive Bayes bloco a bloco e avalia no conjunto de teste.
+    Retorna um DataFrame com as métricas da classe negativa.
+    """
+    vectorizer = criar_vetorizador()
+
+    print("1. Calculando o IDF e a distribuição das classes em streaming...")
+    idf, contagem_classes = calcular_idf(caminho_arquivo, vectorizer, tamanho_chunk)
+    # equivalente a class_weight='balanced', que o partial_fit não aceita diretamente
+    pesos_classes = {classe: contagem_classes.sum() / (len(CLASSES) * contagem) for classe, contagem in zip(CLASSES, contagem_classes)}
+    print(f"Reviews de treino: {contagem_classes.sum()} (negativas: {contagem_classes[0]}, positivas: {contagem_classes[1]})")
+
+    modelos = {
+        "SGD Logístico (incremental)": SGDClassifier(loss='log_loss', random_state=42, class_weight=pesos_classes),
+        "Naive Bayes (incremental)": MultinomialNB(),
+    }
+
+    print("2. Treinando os modelos bloco a bloco...")
+    for numero, (textos, rotulos) in enumerate(ler_blocos(caminho_arquivo, tamanho_chunk, 'treino'), start=1):
+        X = transformar(vectorizer, idf, textos)
+        for modelo in modelos.values():
+            modelo.partial_fit(X, rotulos, classes=CLASSES)
+        print(f"Bloco {numero}: {X.shape[0]} reviews")
+
+    print("3. Avaliando no conjunto de teste...")
+    rotulos_teste = []
+    previsoes = {nome: [] for nome in modelos}
+    for textos, rotulos in ler_blocos(caminho_arquivo, tamanho_chunk, 'teste'):
+        X = transformar(vectorizer, idf, textos)
+        rotulos_teste.append(rotulos)
+        for nome, modelo in modelos.items():
+            previsoes[nome].append(modelo.predict(X))
+
+    y_test = np.concatenate(rotulos_teste)
+    resultados = []
+    for nome in modelos:
+        y_pred = np.concatenate(previsoes[nome])
+        resultados.append({
+            "Modelo": nome,
+            "Precisão (Negativo)": precision_score(y_test, y_pred, pos_label=0),
+            "Recall (Negativo)": recall_score(y_test, y_pred, pos_label=0),
+            "F1-Score (Negativo)": f1_score(y_test, y_pred, pos_label=0)
+        })
+    return pd.DataFrame(resultados)
+
+def avaliar_baseline_em_memoria(caminho_arquivo):
+    """
+    Referência: regressão logística balanceada treinada em memória (TfidfVectorizer + treinar_e_avaliar_modelo).
+    """
+    from comparison import preparar_features, treinar_e_avaliar_modelo
+
+    X_train, X_test, y_train, y_test, _ = preparar_features(caminho_arquivo)
+    _, previsoes = treinar_e_avaliar_modelo(X_train, y_train, X_test, y_test, class_weight='balanced')
+    return {
+        "Modelo": "Regressão Logística (em memória)",
+        "Precisão (Negativo)": precision_score(y_test, previsoes, pos_label=0),
+        "Recall (Negativo)": recall_score(y_test, previsoes, pos_label=0),
+        "F1-Score (Negativo)": f1_score(y_test, previsoes, pos_label=0)
+    }
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+    tamanho_chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    try:
+        df_resultados = treinar_incremental(caminho_arquivo, tamanho_chunk)
+        df_resultados.loc[len(df_resultados)] = avaliar_baseline_em_memoria(caminho_arquivo)
+
+        print("\n--- TREINO INCREMENTAL x EM MEMÓRIA (CLASSE NEGATIVA) ---")
+        print("(o teste incremental usa a divisão por hash do review_id; o em memória, o train_test_split)")
+        with pd.option_context('display.max_columns', None, 'display.width', 200):
+            print(df_resultados)
+
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo não encontrado em '{caminho_arquivo}'")
@@ -0,0 +1,187 @@
+# instrumentação por etapa: cada etapa do pipeline (carregar, limpar, vetorizar, treinar, classificar...)
+# roda dentro de 'with etapa(nome):' e gera um evento estruturado com linhas de entrada/saída, tempo de
+# relógio, tempo de CPU e variação da memória residente (RSS). No fim da execução um resumo por etapa é
+# impresso e gravado em JSON em DIRETORIO_RELATORIOS.
+# só mede quando um script chama ligar_instrumentacao() no seu __main__: quem apenas importa funções que
+# usam etapa() (benchmarks, outros módulos, testes) não registra eventos nem grava relatórios na saída.
+#
+# variáveis de ambiente:
+#   INSTRUMENTACAO=0                               desliga tudo (as etapas viram no-op)
+#   INSTRUMENTACAO_PERFIL=cprofile,tracemalloc     perfil por etapa: .prof do cProfile e/ou pico de memória
+#                                                  Python e maiores alocações (tracemalloc); deixa tudo mais lento
+#   INSTRUMENTACAO_EVENTOS=arquivo.jsonl           grava cada evento assim que a etapa termina
+#   INSTRUMENTACAO_DIR=pasta                       onde gravar o resumo e os perfis (padrão ./.cache/instrumentacao)
+
+import atexit
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ATIVA = os.environ.get('INSTRUMENTACAO', '1') != '0'
+PERFIS = {perfil.strip() for perfil in os.environ.get('INSTRUMENTACAO_PERFIL', '').lower().split(',') if perfil.strip()}
+CAMINHO_EVENTOS = os.environ.get('INSTRUMENTACAO_EVENTOS')
+DIRETORIO_RELATORIOS = os.environ.get('INSTRUMENTACAO_DIR', './.cache/instrumentacao')
+TOP_FUNCOES = 15
+TOP_ALOCACOES = 5
+
+_eventos = []
+_pilha = [] # etapas abertas, para registrar a etapa pai e perfilar só as de nível mais alto
+_execucao = {}
+_ligada = False
+
+def ligar_instrumentacao():
+    """
+    Liga a instrumentação neste processo (a não ser que INSTRUMENTACAO=0). Chamada no __main__ dos scripts.
+    """
+    global _ligada
+    _ligada = ATIVA
+
+def pico_memoria_mb():
+    # pico de memória residente do processo (ru_maxrss vem em KB no Linux e em bytes no macOS; só existe em Unix)
+    try:
+        import resource
+    except ImportError:
+        return float('nan')
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+def memoria_residente_mb():
+    # RSS atual do processo; fora do Linux, usa o pico (ru_maxrss) como aproximação
+    try:
+        with open('/proc/self/statm') as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return pico_memoria_mb()
+
+def _iniciar_execucao():
+    # na primeira etapa: marca o início da execução e agenda o resumo para a saída do processo
+    _execucao.update(
+        script=os.path.splitext(os.path.basename(sys.argv[0] or 'interativo'))[0],
+        inicio=datetime.now(),
+        relogio=time.perf_counter(),
+    )
+    if 'tracemalloc' in PERFIS and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    atexit.register(escrever_relatorio)
+
+# -------- ETAPAS ----------
+@contextlib.contextmanager
+def etapa(nome, linhas_entrada=None):
+    """
+    Mede o bloco como uma etapa. O dict devolvido aceita 'linhas_saida' (e outros campos extras),
+    que entram no evento:
+        with etapa('limpar', len(df)) as registro:
+            ...
+            registro['linhas_saida'] = len(df_limpo)
+    """
+    registro = {'linhas_saida': None}
+    if not _ligada:
+        yield registro
+        return
+    if not _execucao:
+        _iniciar_execucao()
+
+    nivel_superior = not _pilha
+    perfil = cProfile.Profile() if 'cprofile' in PERFIS and nivel_superior else None
+    if 'tracemalloc' in PERFIS and nivel_superior:
+        tracemalloc.reset_peak()
+        memoria_python_antes = tracemalloc.get_traced_memory()[0]
+        retrato_antes = tracemalloc.take_snapshot()
+
+    _pilha.append(nome)
+    memoria_antes = memoria_residente_mb()
+    cpu_antes = time.process_time()
+    inicio = time.perf_counter()
+    if perfil is not None:
+        perfil.enable()
+    try:
+        yield registro
+    finally:
+        if perfil is not None:
+            perfil.disable()
+        evento = {
+            'etapa': nome,
+            'pai': _pilha[-2] if len(_pilha) > 1 else None,
+            'linhas_entrada': linhas_entrada,
+            **registro,
+            'inicio_s': inicio - _execucao['relogio'],
+            'tempo_s': time.perf_counter() - inicio,
+            'cpu_s': time.process_time() - cpu_antes,
+            'rss_mb': memoria_residente_mb(),
+        }
+        evento['variacao_rss_mb'] = evento['rss_mb'] - memoria_antes
+        _pilha.pop()
+
+        if perfil is not None:
+            evento['perfil'] = _salvar_perfil(perfil, nome)
+        if 'tracemalloc' in PERFIS and nivel_superior:
+            evento['pico_python_mb'] = (tracemalloc.get_traced_memory()[1] - memoria_python_antes) / (1024 * 1024)
+            evento['maiores_alocacoes'] = [
+                str(diferenca) for diferenca in tracemalloc.take_snapshot().compare_to(retrato_antes, 'lineno')[:TOP_ALOCACOES]]
+        _registrar(evento)
+
+def _registrar(evento):
+    _eventos.append(evento)
+    if CAMINHO_EVENTOS:
+        with open(CAMINHO_EVENTOS, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(json.dumps(evento, ensure_ascii=False, default=str) + '\n')
+
+def _salvar_perfil(perfil, nome):
+    # .prof para abrir no snakeviz/pstats e as funções mais caras (tempo acumulado) no próprio relatório
+    os.makedirs(DIRETORIO_RELATORIOS, exist_ok=True)
+    arquivo_perfil = os.path.join(DIRETORIO_RELATORIOS, f"{_execucao['script']}_{_execucao['inicio']:%Y%m%d-%H%M%S}_"
+                                  f"{len(_eventos)}_{''.join(c if c.isalnum() else '_' for c in nome)}.prof")
+    perfil.dump_stats(arquivo_perfil)
+    texto = io.StringIO()
+    pstats.Stats(perfil, stream=texto).sort_stats('cumulative').print_stats(TOP_FUNCOES)
+    return {'arquivo': arquivo_perfil, 'top_funcoes': texto.getvalue().strip().splitlines()[-TOP_FUNCOES:]}
+
+# -------- RESUMO ----------
+def resumir(eventos=None):
+    """
+    Agrega os eventos por etapa (na ordem em que começaram): chamadas, tempo, CPU, linhas e maior variação de RSS.
+    """
+    resumo = {}
+    for evento in sorted(_eventos if eventos is None else eventos, key=lambda evento: evento['inicio_s']):
+        item = resumo.setdefault(evento['etapa'], {'etapa': evento['etapa'], 'pai': evento['pai'], 'chamadas': 0,
+                                                   'tempo_s': 0.0, 'cpu_s': 0.0, 'linhas_entrada': 0,
+                                                   'linhas_saida': 0, 'maior_variacao_rss_mb': 0.0})
+        item['chamadas'] += 1
+        item['tempo_s'] += evento['tempo_s']
+        item['cpu_s'] += evento['cpu_s']
+        item['linhas_entrada'] += evento['linhas_entrada'] or 0
+        item['linhas_saida'] += evento['linhas_saida'] or 0
+        item['maior_variacao_rss_mb'] = max(item['maior_variacao_rss_mb'], evento['variacao_rss_mb'])
+    return list(resumo.values())
+
+def escrever_relatorio():
+    """
+    Imprime o resumo por etapa e grava eventos + resumo em JSON. Chamado automaticamente na saída do processo.
+    """
+    if not _eventos:
+        return
+    duracao_total = time.perf_counter() - _execucao['relogio']
+    resumo = resumir()
+
+    print(f"\n--- INSTRUMENTAÇÃO: RESUMO POR ETAPA ({duracao_total:.2f}s no total) ---")
+    print(f"{'etapa':<36}{'chamadas':>9}{'tempo (s)':>11}{'% total':>9}{'CPU (s)':>10}{'linhas':>11}{'Δ RSS (MB)':>12}")
+    for item in resumo:
+        nome = ('  ' if item['pai'] else '') + item['etapa']
+        linhas = item['linhas_saida'] or item['linhas_entrada']
+        print(f"{nome[:35]:<36}{item['chamadas']:>9}{item['tempo_s']:>11.2f}{item['tempo_s'] / duracao_total:>9.0%}"
+              f"{item['cpu_s']:>10.2f}{linhas or '':>11}{item['maior_variacao_rss_mb']:>12.1f}")
+
+    os.makedirs(DIRETORIO_RELATORIOS, exist_ok=True)
+    caminho = os.path.join(DIRETORIO_RELATORIOS, f"{_execucao['script']}_{_execucao['inicio']:%Y%m%d-%H%M%S}.json")
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump({'script': _execucao['script'], 'inicio': _execucao['inicio'].isoformat(timespec='seconds'),
+                   'duracao_s': duracao_total, 'perfis': sorted(PERFIS), 'resumo': resumo, 'eventos': _eventos},
+                  arquivo, ensure_ascii=False, indent=2, default=str)
+    print(f"Relatório de instrumentação salvo em '{caminho}'")
@@ -1,10 +1,10 @@
 
 import pandas as pd
 import numpy as np
-import re
-import string
 
-from nltk.corpus import stopwords
+from text_normalizer import normalize_many, configuracao_limpeza
+import feature_cache
+from data_access import ler_tabela, COLUNAS_REVIEWS_ML
 
 # ferramenta para dividir os dados em treino e teste
 from sklearn.model_selection import train_test_split
@@ -23,72 +23,68 @@ import matplotlib.pyplot as plt
 OR_db = 'csv/olist_order_reviews_dataset.csv'
 
 try:
-    df = pd.read_csv(OR_db)
-    df_filtrado = df[df['review_score'] != 3].copy()
-    condicao = df_filtrado['review_score'] > 3
-    df_filtrado['sentimento'] = np.where(condicao, 'positivo', 'negativo')
-
-    # limpeza de Texto 
-
-    def limpar_texto(texto): #aqui tira numeros, pontuacoes e stopwords (palavras neutras sem peso)
-        texto = texto.lower()
-        # expressão regular r'\d+' encontra um ou mais dígitos (números)
-        texto = re.sub(r'\d+', '', texto)
-        # essa linha cria uma "tabela de tradução" que mapeia cada sinal de pontuação para 'nada'
-        texto = texto.translate(str.maketrans('', '', string.punctuation))
-        texto = texto.strip()
-        
-        #limpeza pt2
-        #  lista de stopwords em português
-        palavras_de_parada = set(stopwords.words('portuguese'))
-        # separação do texto em uma lista de palavras
-        lista_palavras = texto.split()
-        # reconstrução  do texto, mantendo apenas as palavras que NÃO estão na lista de stopwords
-        texto_sem_stopwords = [palavra for palavra in lista_palavras if palavra not in palavras_de_parada]
-        # voltar as palavras juntas
-        texto = ' '.join(texto_sem_stopwords)
-
-        return texto
-
-    # preencher qualquer comentário ausente com uma string vazia.
-    df_filtrado['review_comment_message'] = df_filtrado['review_comment_message'].fillna('')
-
-    # '.apply()' é um método do Pandas que passa cada item da coluna pela função especificada.
-    print("Aplicando a função de limpeza de texto. Isso pode levar alguns segundos...")
-    df_filtrado['texto_limpo'] = df_filtrado['review_comment_message'].apply(limpar_texto)
-
-    # visualização do resultado
-    print("\n--- Verificação da Limpeza de Texto ---")
-    # .head() para ver as colunas original e limpa, lado a lado.
-    print(df_filtrado[['sentimento', 'review_comment_message', 'texto_limpo']].head())
-
-
-    # mapeando a variável alvo 'sentimento' para números (y)
-    # modelos ML trabalham com números, então 'positivo' -> 1 e 'negativo' -> 0.
-    df_filtrado['sentimento_numerico'] = df_filtrado['sentimento'].map({'positivo': 1, 'negativo': 0})
-
-    # definindo nossas variáveis X (features) e y (alvo)
-    # X são os dados que o modelo usará para aprender (o texto limpo). - que contem apenas palavras significativas
-    # y é o que o modelo tentará prever (o sentimento 0 ou 1).
-    X = df_filtrado['texto_limpo']
-    y = df_filtrado['sentimento_numerico']
-
-    # divisão dos dados em conjuntos de treino e teste
-    # O modelo treina com 80% dos dados e depois validamos sua performance nos 20% que ele nunca viu.
-    # random_state=42 garante que a divisão seja sempre a mesma, para resultados consistentes.
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-    # 'stratify=y' garante que a proporção de positivos/negativos seja a mesma no treino e no teste.
-
-    # vetorização do texto com TF-IDF
-    # Isso transforma o texto limpo em uma matriz de números que o modelo entende.
-    # max_features=5000 foca apenas nas 5000 palavras mais importantes, otimizando a performance.
-    vectorizer = TfidfVectorizer(max_features=5000)
-
-    # AQUI APRENDEMOS O VOCABULÁRIO E TRANSFORMAMOS OS DADOS DE TREINO
-    X_train_tfidf = vectorizer.fit_transform(X_train)
-
-    # AQUI APENAS TRANSFORMAMOS OS DADOS DE TESTE, USANDO O MESMO VOCABULÁRIO APRENDIDO ANTES
-    X_test_tfidf = vectorizer.transform(X_test)
+    # cache em disco: se o CSV, a limpeza e o vetorizador não mudaram, reaproveita as features já calculadas
+    chave = feature_cache.chave_cache(OR_db, configuracao_limpeza(remover_acento=False),
+                                      TfidfVectorizer(max_features=5000).get_params(),
+                                      {'test_size': 0.2, 'random_state': 42})
+    entrada_cache = feature_cache.carregar_cache(chave)
+
+    if entrada_cache is not None:
+        print(f"Features carregadas do cache ({chave}), pulando limpeza e vetorização.")
+        X_train_tfidf, X_test_tfidf = entrada_cache['X_train_tfidf'], entrada_cache['X_test_tfidf']
+        y_train, y_test = entrada_cache['y_train'], entrada_cache['y_test']
+        vectorizer = entrada_cache['vectorizer']
+    else:
+        # só as colunas usadas pelo modelo, com o filtro de nota 3 aplicado já na leitura (Parquet)
+        df_filtrado = ler_tabela(OR_db, colunas=COLUNAS_REVIEWS_ML, filtros=[('review_score', '!=', 3)])
+        condicao = df_filtrado['review_score'] > 3
+        df_filtrado['sentimento'] = np.where(condicao, 'positivo', 'negativo')
+
+        # limpeza de Texto 
+        # tira numeros, pontuacoes e stopwords (palavras neutras sem peso) com o normalizador compartilhado.
+        # este script não remove acentos, por isso remover_acento=False.
+
+        # preencher qualquer comentário ausente com uma string vazia.
+        df_filtrado['review_comment_message'] = df_filtrado['review_comment_message'].fillna('')
+
+        # 'normalize_many' limpa a coluna inteira de uma vez, limpando cada texto distinto uma única vez.
+        print("Aplicando a função de limpeza de texto. Isso pode levar alguns segundos...")
+        df_filtrado['texto_limpo'] = normalize_many(df_filtrado['review_comment_message'], remover_acento=False)
+
+        # visualização do resultado
+        print("\n--- Verificação da Limpeza de Texto ---")
+        # .head() para ver as colunas original e limpa, lado a lado.
+        print(df_filtrado[['sentimento', 'review_comment_message', 'texto_limpo']].head())
+
+
+        # mapeando a variável alvo 'sentimento' para números (y)
+        # modelos ML trabalham com números, então 'positivo' -> 1 e 'negativo' -> 0.
+        df_filtrado['sentimento_numerico'] = df_filtrado['sentimento'].map({'positivo': 1, 'negativo': 0})
+
+        # definindo nossas variáveis X (features) e y (alvo)
+        # X são os dados que o modelo usará para aprender (o texto limpo). - que contem apenas palavras significativas
+        # y é o que o modelo tentará prever (o sentimento 0 ou 1).
+        X = df_filtrado['texto_limpo']
+        y = df_filtrado['sentimento_numerico']
+
+        # divisão dos dados em conjuntos de treino e teste
+        # O modelo treina com 80% dos dados e depois validamos sua performance nos 20% que ele nunca viu.
+        # random_state=42 garante que a divisão seja sempre a mesma, para resultados consistentes.
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+        # 'stratify=y' garante que a proporção de positivos/negativos seja a mesma no treino e no teste.
+
+        # vetorização do texto com TF-IDF
+        # Isso transforma o texto limpo em uma matriz de números que o modelo entende.
+        # max_features=5000 foca apenas nas 5000 palavras mais importantes, otimizando a performance.
+        vectorizer = TfidfVectorizer(max_features=5000)
+
+        # AQUI APRENDEMOS O VOCABULÁRIO E TRANSFORMAMOS OS DADOS DE TREINO
+        X_train_tfidf = vectorizer.fit_transform(X_train)
+
+        # AQUI APENAS TRANSFORMAMOS OS DADOS DE TESTE, USANDO O MESMO VOCABULÁRIO APRENDIDO ANTES
+        X_test_tfidf = vectorizer.transform(X_test)
+
+        feature_cache.salvar_cache(chave, df_filtrado['texto_limpo'], X_train_tfidf, X_test_tfidf, y_train, y_test, vectorizer)
 
     # verificação
     print("\n--- PREPARAÇÃO FINAL CONCLUÍDA ---")
@@ -0,0 +1,134 @@
+# cabeça multiclasse (negativo / neutro / positivo) que cobre as reviews de nota 3, descartadas pelo modelo binário.
+# ela usa o mesmo vetorizador do pipeline binário. No treino, reaproveita a matriz TF-IDF do treino binário
+# (comparison.py) e só limpa e vetoriza as reviews de nota 3; na classificação (review_classification.py) o texto
+# é limpo e vetorizado uma única vez e as duas cabeças são aplicadas sobre a mesma matriz. O artefato guarda a
+# impressão digital do vetorizador e é recusado se o pipeline binário for treinado de novo com outro vocabulário.
+#
+# uso:   python multiclass_head.py [csv]     (treina a cabeça a partir do pipeline salvo em ./to_predict/)
+
+import hashlib
+import sys
+import time
+
+import joblib
+import numpy as np
+from scipy import sparse
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import classification_report, recall_score
+from sklearn.model_selection import train_test_split
+
+from data_access import ler_tabela, COLUNAS_REVIEWS_ML
+
+CAMINHO_CABECA_MULTICLASSE = './to_predict/modelo_multiclasse.joblib'
+VERSAO_CABECA = 1
+MAPA_CLASSES = {0: 'negativo', 1: 'neutro', 2: 'positivo'}
+
+def classes_por_nota(notas):
+    # 1-2 negativo, 3 neutro, 4-5 positivo
+    return np.digitize(np.asarray(notas), [3, 4])
+
+def fingerprint_vetorizador(vectorizer):
+    """
+    Impressão digital do vetorizador já treinado (vocabulário e IDF): a cabeça só vale para essas colunas.
+    """
+    sha = hashlib.sha256()
+    for termo in vectorizer.get_feature_names_out():
+        sha.update(termo.encode('utf-8') + b'\0')
+    sha.update(np.ascontiguousarray(vectorizer.idf_).tobytes())
+    return sha.hexdigest()
+
+# -------- TREINO ----------
+def vetorizar_neutras(caminho_arquivo, pipeline):
+    """
+    Limpa e vetoriza, com o pipeline binário, só as reviews de nota 3 (as únicas que o treino binário não viu).
+    """
+    df = ler_tabela(caminho_arquivo, colunas=COLUNAS_REVIEWS_ML, filtros=[('review_score', '==', 3)])
+    return pipeline[:-1].transform(df['review_comment_message'].fillna(''))
+
+def matrizes_do_treino_binario(caminho_arquivo, pipeline, parametros_divisao):
+    """
+    Refaz a divisão treino/teste do comparison.py (mesmas linhas, na mesma ordem, com os mesmos parâmetros)
+    e vetoriza cada lado com o pipeline salvo. Usado quando a cabeça é treinada fora do comparison.py.
+    """
+    from comparison import carregar_e_preparar_dados
+
+    df = carregar_e_preparar_dados(caminho_arquivo)
+    y = (df['sentimento'] == 'positivo').astype(int)
+    textos_treino, textos_teste, y_train, y_test = train_test_split(df['review_comment_message'].fillna(''), y,
+                                                                    stratify=y, **parametros_divisao)
+    return pipeline[:-1].transform(textos_treino), pipeline[:-1].transform(textos_teste), y_train, y_test
+
+def treinar_cabeca_multiclasse(X_train, y_train, X_test, y_test, X_neutras, modelo_binario, parametros_divisao=None):
+    """
+    Treina a cabeça multiclasse sobre a matriz do treino binário (X_train/X_test e rótulos 0/1 do comparison.py)
+    acrescida das reviews de nota 3 (X_neutras, de vetorizar_neutras), divididas com os mesmos parâmetros.
+    Nenhuma review é limpa ou vetorizada duas vezes, e o teste das duas cabeças fica fora do treino de ambas:
+    a binária é avaliada em X_test e a multiclasse em X_test mais o teste das neutras.
+    """
+    parametros_divisao = parametros_divisao or {'test_size': 0.2, 'random_state': 42}
+    neutras_treino, neutras_teste = train_test_split(X_neutras, **parametros_divisao)
+    # rótulos binários 0/1 -> classes 0 (negativo) / 2 (positivo); as neutras são a classe 1
+    X_train_todas = sparse.vstack([X_train, neutras_treino], format='csr')
+    y_train_todas = np.concatenate([np.asarray(y_train) * 2, np.ones(neutras_treino.shape[0], dtype=np.int64)])
+    X_test_todas = sparse.vstack([X_test, neutras_teste], format='csr')
+    y_test_todas = np.concatenate([np.asarray(y_test) * 2, np.ones(neutras_teste.shape[0], dtype=np.int64)])
+
+    modelo = LogisticRegression(random_state=42, class_weight='balanced', max_iter=1000)
+    modelo.fit(X_train_todas, y_train_todas)
+    print("\n--- CABEÇA MULTICLASSE (teste, todas as notas) ---")
+    print(classification_report(y_test_todas, modelo.predict(X_test_todas), labels=list(MAPA_CLASSES),
+                                target_names=list(MAPA_CLASSES.values())))
+
+    # a cabeça binária, nas mesmas linhas de teste (sem nota 3), fora do treino das duas
+    print(f"Cabeça binária nas mesmas reviews de teste (sem nota 3): recall negativo = "
+          f"{recall_score(y_test, modelo_binario.predict(X_test), pos_label=0):.4f}")
+
+    inicio = time.perf_counter()
+    modelo_binario.predict(X_test_todas)
+    tempo_binaria = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    modelo_binario.predict(X_test_todas)
+    modelo.predict(X_test_todas)
+    tempo_duas = time.perf_counter() - inicio
+    print(f"Aplicar as cabeças sobre a matriz pronta ({X_test_todas.shape[0]} reviews): só binária {tempo_binaria * 1000:.1f} ms, "
+          f"binária + multiclasse {tempo_duas * 1000:.1f} ms")
+    return modelo
+
+# -------- SALVAR E CARREGAR ----------
+def salvar_cabeca_multiclasse(modelo, vectorizer, caminho=CAMINHO_CABECA_MULTICLASSE):
+    artefato = {
+        'versao': VERSAO_CABECA,
+        'vetorizador': fingerprint_vetorizador(vectorizer),
+        'classes': MAPA_CLASSES,
+        'modelo': modelo,
+    }
+    joblib.dump(artefato, caminho)
+    print(f"Cabeça multiclasse salva em '{caminho}'")
+
+def carregar_cabeca_multiclasse(pipeline, caminho=CAMINHO_CABECA_MULTICLASSE):
+    """
+    Carrega a cabeça multiclasse, recusando-a se foi treinada para outro vetorizador que não o do pipeline.
+    """
+    artefato = joblib.load(caminho)
+    if not isinstance(artefato, dict) or artefato.get('versao') != VERSAO_CABECA:
+        raise ValueError(f"Artefato '{caminho}' não é uma cabeça multiclasse na versão {VERSAO_CABECA}; treine novamente.")
+    if artefato['vetorizador'] != fingerprint_vetorizador(pipeline.named_steps['tfidf']):
+        raise ValueError(f"A cabeça multiclasse '{caminho}' foi treinada com outro vetorizador; "
+                         f"rode 'python multiclass_head.py' de novo.")
+    return artefato['modelo']
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    from review_classification import carregar_modelo
+
+    caminho_arquivo = sys.argv[1] if len(sys.argv) > 1 else 'csv/olist_order_reviews_dataset.csv'
+    try:
+        from comparison import PARAMETROS_DIVISAO
+
+        pipeline, _ = carregar_modelo()
+        X_train, X_test, y_train, y_test = matrizes_do_treino_binario(caminho_arquivo, pipeline, PARAMETROS_DIVISAO)
+        modelo = treinar_cabeca_multiclasse(X_train, y_train, X_test, y_test, vetorizar_neutras(caminho_arquivo, pipeline),
+                                            pipeline.named_steps['modelo'], PARAMETROS_DIVISAO)
+        salvar_cabeca_multiclasse(modelo, pipeline.named_steps['tfidf'])
+    except FileNotFoundError:
+        print(f"ERRO: Certifique-se que o pipeline está em ./to_predict/ e o CSV em '{caminho_arquivo}'")
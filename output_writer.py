@@ -0,0 +1,108 @@
+# gravação da saída da classificação em blocos: CSV (opcionalmente comprimido com gzip ou zstd) ou Parquet.
+# o arquivo fica aberto durante toda a execução e cada bloco classificado é anexado a ele, com a compressão
+# feita em fluxo: a memória fica limitada ao bloco e o arquivo final é o mesmo que seria gravado de uma vez.
+# zstd requer o pacote 'zstandard' e Parquet requer o 'pyarrow' (os dois são opcionais).
+
+import contextlib
+import gzip
+import io
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FORMATOS_SAIDA = {'csv': '.csv', 'csv.gz': '.csv.gz', 'csv.zst': '.csv.zst', 'parquet': '.parquet'}
+# níveis baixos já encolhem bastante o CSV e custam uma fração do tempo dos níveis máximos
+NIVEL_GZIP = 3
+NIVEL_ZSTD = 3
+COMPRESSAO_PARQUET = 'zstd'
+
+def caminho_saida(nome_base, formato='csv'):
+    # 'final_reviews' + 'csv.gz' -> 'final_reviews.csv.gz'
+    if formato not in FORMATOS_SAIDA:
+        raise ValueError(f"formato de saída deve ser um de {list(FORMATOS_SAIDA)}, não '{formato}'")
+    return nome_base + FORMATOS_SAIDA[formato]
+
+def formato_do_caminho(caminho):
+    """
+    Formato de saída deduzido da extensão do arquivo ('.csv.gz' -> 'csv.gz').
+    """
+    for formato, extensao in sorted(FORMATOS_SAIDA.items(), key=lambda item: -len(item[1])):
+        if caminho.endswith(extensao):
+            return formato
+    raise ValueError(f"extensão de '{caminho}' não corresponde a nenhum formato de saída ({list(FORMATOS_SAIDA.values())})")
+
+# -------- ESCRITA ----------
+def _abrir_texto(caminho, formato):
+    # arquivo de texto para o CSV; gzip e zstd comprimem em fluxo conforme os blocos chegam
+    if formato == 'csv':
+        return open(caminho, 'w', encoding='utf-8', newline='')
+    if formato == 'csv.gz':
+        return gzip.open(caminho, 'wt', compresslevel=NIVEL_GZIP, encoding='utf-8', newline='')
+    if zstandard is None:
+        raise ValueError("o formato 'csv.zst' requer o pacote 'zstandard' (pip install zstandard)")
+    compressor = zstandard.ZstdCompressor(level=NIVEL_ZSTD).stream_writer(open(caminho, 'wb'))
+    return io.TextIOWrapper(compressor, encoding='utf-8', newline='')
+
+@contextlib.contextmanager
+def abrir_escritor(caminho, formato=None):
+    """
+    Abre o arquivo de saída e devolve uma função escrever(df) que anexa um bloco de linhas:
+        with abrir_escritor('final_reviews.csv.gz') as escrever:
+            for bloco in blocos:
+                escrever(bloco)
+    O formato vem da extensão do caminho quando não é informado. No CSV só o primeiro bloco grava o cabeçalho;
+    no Parquet cada bloco vira um row group, com o esquema do primeiro bloco.
+    """
+    formato = formato or formato_do_caminho(caminho)
+    if formato == 'parquet':
+        if pq is None:
+            raise ValueError("o formato 'parquet' requer o pacote 'pyarrow'")
+        escritor = None
+
+        def escrever(df):
+            nonlocal escritor
+            # os blocos seguintes são convertidos para o esquema do primeiro (ex.: ids 'category' com
+            # números de categorias diferentes em cada bloco)
+            tabela = pa.Table.from_pandas(df, schema=escritor.schema if escritor else None, preserve_index=False)
+            if escritor is None:
+                escritor = pq.ParquetWriter(caminho, tabela.schema, compression=COMPRESSAO_PARQUET)
+            escritor.write_table(tabela)
+        try:
+            yield escrever
+        finally:
+            if escritor is not None:
+                escritor.close()
+        return
+
+    with _abrir_texto(caminho, formato) as arquivo:
+        primeiro_bloco = True
+
+        def escrever(df):
+            nonlocal primeiro_bloco
+            df.to_csv(arquivo, index=False, header=primeiro_bloco)
+            primeiro_bloco = False
+        yield escrever
+
+# -------- LEITURA ----------
+def ler_saida_em_blocos(caminho, colunas=None, tamanho_bloco=50000):
+    """
+    Lê de volta, em blocos, um arquivo gravado por abrir_escritor (qualquer um dos formatos).
+    """
+    if formato_do_caminho(caminho) == 'parquet':
+        if pq is None:
+            raise ValueError("o formato 'parquet' requer o pacote 'pyarrow'")
+        for lote in pq.ParquetFile(caminho).iter_batches(batch_size=tamanho_bloco, columns=colunas):
+            yield lote.to_pandas()
+        return
+    # o pandas deduz a compressão (gzip/zstd) pela extensão
+    yield from pd.read_csv(caminho, usecols=colunas, dtype=str, keep_default_na=False, chunksize=tamanho_bloco)
@@ -0,0 +1,65 @@
+# armazenamento persistente (SQLite) das previsões já feitas, para a reclassificação incremental.
+# cada previsão fica guardada por review_id junto com o hash do comentário; uma review só é
+# reclassificada se for nova ou se o comentário mudou. Trocar o modelo apaga todas as previsões.
+# as explicações das reviews negativas (termos_negativos) também podem ficar guardadas; NULL = não calculada.
+
+import hashlib
+import sqlite3
+
+import numpy as np
+
+CAMINHO_BANCO = './to_predict/previsoes.sqlite'
+
+def hash_mensagens(mensagens):
+    """
+    Hash curto (blake2b, 16 caracteres hex) de cada comentário; ausentes contam como texto vazio.
+    """
+    return [hashlib.blake2b(('' if mensagem is None or mensagem != mensagem else str(mensagem)).encode('utf-8'),
+                            digest_size=8).hexdigest() for mensagem in mensagens]
+
+def abrir_banco(identificador_modelo, caminho=CAMINHO_BANCO):
+    """
+    Abre (ou cria) o banco de previsões. Se ele foi preenchido por outro modelo, as previsões são descartadas.
+    """
+    conexao = sqlite3.connect(caminho)
+    conexao.execute("CREATE TABLE IF NOT EXISTS metadados (chave TEXT PRIMARY KEY, valor TEXT)")
+    conexao.execute("CREATE TABLE IF NOT EXISTS previsoes ("
+                    "review_id TEXT PRIMARY KEY, hash_mensagem TEXT NOT NULL, sentimento_previsto TEXT NOT NULL, "
+                    "termos_negativos TEXT)")
+    if 'termos_negativos' not in {coluna[1] for coluna in conexao.execute("PRAGMA table_info(previsoes)")}:
+        conexao.execute("ALTER TABLE previsoes ADD COLUMN termos_negativos TEXT") # banco criado antes das explicações
+    conexao.execute("CREATE TEMP TABLE consulta (posicao INTEGER PRIMARY KEY, review_id TEXT, hash_mensagem TEXT)")
+
+    linha = conexao.execute("SELECT valor FROM metadados WHERE chave = 'modelo'").fetchone()
+    if linha is None or linha[0] != identificador_modelo:
+        if linha is not None:
+            print(f"Modelo mudou ({linha[0][:12]} -> {identificador_modelo[:12]}); descartando previsões antigas.")
+        conexao.execute("DELETE FROM previsoes")
+        conexao.execute("INSERT OR REPLACE INTO metadados VALUES ('modelo', ?)", (identificador_modelo,))
+        conexao.commit()
+    return conexao
+
+def buscar_previsoes(conexao, review_ids, hashes, com_explicacoes=False):
+    """
+    Retorna um array com a previsão guardada de cada review, ou None quando ela é nova ou o comentário mudou.
+    Com com_explicacoes=True, retorna (previsoes, explicacoes); negativas guardadas sem explicação contam
+    como não encontradas, para serem classificadas (e explicadas) de novo.
+    """
+    conexao.execute("DELETE FROM consulta")
+    conexao.executemany("INSERT INTO consulta VALUES (?, ?, ?)", zip(range(len(hashes)), map(str, review_ids), hashes))
+    previsoes = np.full(len(hashes), None, dtype=object)
+    explicacoes = np.full(len(hashes), '', dtype=object)
+    filtro = " WHERE p.sentimento_previsto != 'negativo' OR p.termos_negativos IS NOT NULL" if com_explicacoes else ""
+    for posicao, sentimento, termos in conexao.execute(
+            "SELECT c.posicao, p.sentimento_previsto, p.termos_negativos FROM consulta c "
+            "JOIN previsoes p ON p.review_id = c.review_id AND p.hash_mensagem = c.hash_mensagem" + filtro):
+        previsoes[posicao] = sentimento
+        explicacoes[posicao] = termos or ''
+    return (previsoes, explicacoes) if com_explicacoes else previsoes
+
+def salvar_previsoes(conexao, review_ids, hashes, sentimentos, explicacoes=None):
+    # sem 'explicacoes', as explicações ficam NULL (não calculadas)
+    explicacoes = [None] * len(hashes) if explicacoes is None else explicacoes
+    conexao.executemany("INSERT OR REPLACE INTO previsoes VALUES (?, ?, ?, ?)",
+                        zip(map(str, review_ids), hashes, sentimentos, explicacoes))
+    conexao.commit()
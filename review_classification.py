@@ -1,78 +1,299 @@
 # carrega o modelo treinado e classifica todas as reviews de um arquivo.
 
-import pandas as pd
+import time
+
 import numpy as np
-import re
-import string
-from nltk.corpus import stopwords
+import pandas as pd
 import joblib
 
-# Função de Limpeza de Texto
-# (mesma função do script de treino para garantir consistência)
-def aplicar_limpeza_de_texto(df):
+from data_access import ler_tabela, ler_tabela_em_blocos, COLUNAS_REVIEWS_ML
+from feature_cache import hash_arquivo
+from instrumentation import etapa, ligar_instrumentacao
+from review_explainer import criar_explicador, explicar, formatar_explicacao
+from drift_monitor import acumular, escrever_relatorio_monitor, novo_monitor, probabilidade_positiva
+from output_writer import abrir_escritor, caminho_saida
+from sentiment_rollup import agregar_arquivo
+from prediction_store import CAMINHO_BANCO, abrir_banco, buscar_previsoes, hash_mensagens, salvar_previsoes
+from multiclass_head import MAPA_CLASSES, carregar_cabeca_multiclasse, classes_por_nota
+from sentiment_pipeline import (CAMINHO_PIPELINE, carregar_pipeline, criar_pipeline, vetorizar_com_atalho,
+                                prever_cabeca, prever_proba_cabeca, aplicar_fallback_vazio)
+
+COLUNAS_SAIDA = ['review_id', 'order_id', 'review_score', 'review_comment_message', 'sentimento_previsto']
+COLUNA_EXPLICACAO = 'termos_negativos'
+COLUNA_MULTICLASSE = 'classe_prevista'
+COLUNAS_PROBABILIDADE = ['prob_negativo', 'prob_positivo']
+ROTULOS_SENTIMENTO = ['negativo', 'positivo'] # posição = classe prevista (0 = negativo, 1 = positivo)
+CAMINHO_MODELO = './to_predict/modelo_sentimento.joblib'
+CAMINHO_VETORIZADOR = './to_predict/vetorizador_tfidf.joblib'
+
+def carregar_modelo():
     """
-    Aplica a função de limpeza de texto na coluna de comentários.
+    Carrega o pipeline único (limpeza + vetorizador + modelo). Se ele ainda não existir, monta o pipeline
+    a partir do par joblib antigo, com a mesma limpeza do treino (comparison.py remove acentos).
+    Retorna (pipeline, identificador), onde o identificador é o sha256 do(s) arquivo(s) do modelo:
+    muda sempre que os pesos mudam, e não só a configuração.
     """
-    print("Aplicando a limpeza de texto...")
-    
-    def limpar_texto(texto):
-        texto = str(texto).lower()
-        texto = re.sub(r'\d+', '', texto)
-        # (Opcional: adicione a remoção de acentos aqui se desejar)
-        texto = texto.translate(str.maketrans('', '', string.punctuation))
-        texto = texto.strip()
-        palavras_de_parada = set(stopwords.words('portuguese'))
-        lista_palavras = texto.split()
-        texto_sem_stopwords = [palavra for palavra in lista_palavras if palavra not in palavras_de_parada]
-        texto = ' '.join(texto_sem_stopwords)
-        return texto
+    try:
+        pipeline, fingerprint = carregar_pipeline()
+        print(f"Pipeline carregado (fingerprint {fingerprint[:12]}).")
+        identificador = hash_arquivo(CAMINHO_PIPELINE)
+    except FileNotFoundError:
+        print(f"'{CAMINHO_PIPELINE}' não encontrado; usando 'modelo_sentimento.joblib' e 'vetorizador_tfidf.joblib'.")
+        modelo = joblib.load(CAMINHO_MODELO)
+        vectorizer = joblib.load(CAMINHO_VETORIZADOR)
+        pipeline = criar_pipeline(modelo, vectorizer)
+        identificador = hash_arquivo(CAMINHO_MODELO) + hash_arquivo(CAMINHO_VETORIZADOR)
+    return pipeline, identificador
 
-    df['review_comment_message'] = df['review_comment_message'].fillna('')
-    df['texto_limpo'] = df['review_comment_message'].apply(limpar_texto)
+def colunas_saida(explicador=None, modelo_multiclasse=None, incluir_probabilidades=False):
+    colunas = list(COLUNAS_SAIDA)
+    if incluir_probabilidades:
+        colunas.extend(COLUNAS_PROBABILIDADE)
+    if modelo_multiclasse is not None:
+        colunas.append(COLUNA_MULTICLASSE)
+    if explicador is not None:
+        colunas.append(COLUNA_EXPLICACAO)
+    return colunas
+
+def adicionar_explicacoes(df, explicador, X, vazios, previsoes):
+    """
+    Preenche a coluna 'termos_negativos' das reviews classificadas como negativas (e com texto após a limpeza)
+    com os termos que mais puxaram a decisão para negativo. As demais ficam com ''.
+    X e 'vazios' são os de vetorizar_com_atalho: as explicações saem das linhas TF-IDF já calculadas.
+    """
+    negativas = (np.asarray(previsoes) == 0) & ~vazios
+    explicacoes = np.full(len(df), '', dtype=object)
+    if negativas.any():
+        explicacoes[negativas] = [formatar_explicacao(explicacao)
+                                  for explicacao in explicar(explicador, X[negativas[~vazios]])]
+    df[COLUNA_EXPLICACAO] = explicacoes
     return df
 
+def classificar_reviews(df, pipeline, verbose=True, fallback_vazio='constante', explicador=None, modelo_multiclasse=None,
+                        incluir_probabilidades=False, monitor=None):
+    """
+    Limpa, vetoriza e classifica as reviews de um DataFrame, devolvendo só as colunas de saída.
+    A limpeza é a etapa 'limpeza' do pipeline, a mesma usada no treino. Comentários vazios (antes ou
+    depois da limpeza) não passam pelo vetorizador nem pelo modelo: recebem a previsão constante do
+    modelo para texto vazio, ou a derivada da nota com fallback_vazio='nota'.
+    Com um 'explicador' (review_explainer.criar_explicador), adiciona a coluna 'termos_negativos'.
+    Com um 'modelo_multiclasse' (multiclass_head), adiciona 'classe_prevista' (negativo/neutro/positivo),
+    aplicado sobre a mesma matriz TF-IDF da cabeça binária: o texto é limpo e vetorizado uma vez só.
+    Com incluir_probabilidades=True, adiciona 'prob_negativo' e 'prob_positivo' (predict_proba do modelo;
+    vazias nas reviews cujo sentimento veio da nota). Os rótulos saem como colunas categóricas.
+    Com um 'monitor' (drift_monitor.novo_monitor), soma o bloco aos contadores de OOV, cobertura e previsões.
+    """
+    df['review_comment_message'] = df['review_comment_message'].fillna('')
+
+    # Faz as previsões usando o pipeline carregado
+    if verbose:
+        print("Limpando, vetorizando e classificando reviews...")
+    with etapa('classificar', len(df)) as registro:
+        vectorizer = pipeline.named_steps['tfidf']
+        X, vazios, limpos = vetorizar_com_atalho(pipeline, df['review_comment_message'], devolver_limpos=True)
+        previsoes_finais = prever_cabeca(pipeline.named_steps['modelo'], vectorizer, X, vazios)
+        previsoes_finais = aplicar_fallback_vazio(previsoes_finais, vazios, df['review_score'], fallback_vazio)
+        if modelo_multiclasse is not None:
+            classes = prever_cabeca(modelo_multiclasse, vectorizer, X, vazios)
+            if fallback_vazio == 'nota':
+                classes[vazios] = classes_por_nota(df['review_score'])[vazios]
+        if incluir_probabilidades:
+            probabilidades = prever_proba_cabeca(pipeline.named_steps['modelo'], vectorizer, X, vazios).astype(np.float32)
+            if fallback_vazio == 'nota':
+                probabilidades[vazios & (df['review_score'].to_numpy() != 3)] = np.nan
+        registro.update(linhas_saida=len(previsoes_finais), vazios=int(vazios.sum()))
+    if monitor is not None:
+        with etapa('monitorar', len(df)):
+            acumular(monitor, limpos, X, previsoes_finais, probabilidade_positiva(pipeline.named_steps['modelo'], X),
+                     notas=df['review_score'].to_numpy())
+    if verbose:
+        print(f"{int(vazios.sum())} de {len(df)} reviews ({vazios.mean():.0%}) sem texto após a limpeza: "
+              f"classificadas sem vetorizar.")
+
+    # Prepara a tabela de resultado: a classe prevista já é a posição do rótulo, então os rótulos
+    # são colunas categóricas montadas direto dos códigos, sem mapear linha a linha
+    df['sentimento_previsto'] = pd.Categorical.from_codes(previsoes_finais, categories=ROTULOS_SENTIMENTO)
+    if incluir_probabilidades:
+        df[COLUNAS_PROBABILIDADE] = probabilidades
+    if modelo_multiclasse is not None:
+        df[COLUNA_MULTICLASSE] = pd.Categorical.from_codes(classes, categories=list(MAPA_CLASSES.values()))
+    if explicador is not None:
+        with etapa('explicar', len(df)):
+            adicionar_explicacoes(df, explicador, X, vazios, previsoes_finais)
+
+    return df[colunas_saida(explicador, modelo_multiclasse, incluir_probabilidades)]
+
+def classificar_em_streaming(caminho_entrada, caminho_saida, pipeline, tamanho_chunk=50000, explicador=None,
+                             modelo_multiclasse=None, incluir_probabilidades=False, monitor=None):
+    """
+    Classifica o CSV em blocos de 'tamanho_chunk' linhas, anexando cada bloco ao arquivo de saída
+    (CSV, CSV comprimido ou Parquet, pela extensão de 'caminho_saida'; ver output_writer.py).
+    A memória fica limitada ao tamanho do bloco e o arquivo final é igual ao da classificação completa.
+    Retorna as primeiras linhas do resultado, para visualização.
+    """
+    print(f"Classificando em streaming, blocos de {tamanho_chunk} linhas...")
+    visualizacao = None
+    total_linhas = 0
+    inicio_total = time.perf_counter()
+
+    with abrir_escritor(caminho_saida) as escrever:
+        for numero, chunk in enumerate(ler_tabela_em_blocos(caminho_entrada, COLUNAS_REVIEWS_ML, tamanho_chunk), start=1):
+            inicio = time.perf_counter()
+            df_resultado = classificar_reviews(chunk, pipeline, verbose=False, explicador=explicador,
+                                               modelo_multiclasse=modelo_multiclasse,
+                                               incluir_probabilidades=incluir_probabilidades, monitor=monitor)
+            with etapa('gravar', len(df_resultado)):
+                escrever(df_resultado)
+            duracao = time.perf_counter() - inicio
+
+            total_linhas += len(df_resultado)
+            print(f"Bloco {numero}: {len(df_resultado)} linhas em {duracao:.2f}s ({len(df_resultado) / duracao:,.0f} linhas/s)")
+            if visualizacao is None:
+                visualizacao = df_resultado.head()
+
+    duracao_total = time.perf_counter() - inicio_total
+    print(f"Total: {total_linhas} linhas em {duracao_total:.2f}s ({total_linhas / duracao_total:,.0f} linhas/s)")
+    return visualizacao
+
+def classificar_incremental(caminho_entrada, caminho_saida, pipeline, identificador_modelo,
+                            tamanho_chunk=50000, caminho_banco=CAMINHO_BANCO, explicador=None, monitor=None):
+    """
+    Igual ao modo streaming, mas reaproveita as previsões guardadas em 'caminho_banco': só passam pelo
+    pipeline as reviews novas ou com comentário alterado (chave: review_id + hash do comentário).
+    Se o modelo mudou desde a última execução, o banco é esvaziado e tudo é reclassificado.
+    O arquivo de saída é sempre completo e igual ao da classificação completa.
+    As explicações (se pedidas) também ficam no banco: só as reviews classificadas nesta execução são explicadas.
+    O 'monitor' (se houver) só acumula as reviews que passaram pelo pipeline nesta execução.
+    """
+    print(f"Classificando de forma incremental, blocos de {tamanho_chunk} linhas (banco '{caminho_banco}')...")
+    conexao = abrir_banco(identificador_modelo, caminho_banco)
+    visualizacao = None
+    total_linhas = total_classificadas = 0
+    inicio_total = time.perf_counter()
+
+    try:
+        with abrir_escritor(caminho_saida) as escrever:
+            for numero, chunk in enumerate(ler_tabela_em_blocos(caminho_entrada, COLUNAS_REVIEWS_ML, tamanho_chunk), start=1):
+                with etapa('consultar previsões guardadas', len(chunk)) as registro:
+                    hashes = hash_mensagens(chunk['review_comment_message'])
+                    if explicador is None:
+                        sentimentos = buscar_previsoes(conexao, chunk['review_id'], hashes)
+                    else:
+                        sentimentos, explicacoes = buscar_previsoes(conexao, chunk['review_id'], hashes, com_explicacoes=True)
+                    registro['linhas_saida'] = int(np.not_equal(sentimentos, None).sum())
+
+                # só o delta passa pelo pipeline; as previsões novas já vão para o banco
+                novas = np.equal(sentimentos, None)
+                if novas.any():
+                    df_novas = classificar_reviews(chunk[novas].copy(), pipeline, verbose=False, explicador=explicador,
+                                                   monitor=monitor)
+                    sentimentos[novas] = df_novas['sentimento_previsto'].to_numpy()
+                    if explicador is not None:
+                        explicacoes[novas] = df_novas[COLUNA_EXPLICACAO].to_numpy()
+                    with etapa('guardar previsões', int(novas.sum())):
+                        salvar_previsoes(conexao, df_novas['review_id'], np.array(hashes)[novas], sentimentos[novas],
+                                         explicacoes[novas] if explicador is not None else None)
+
+                chunk['review_comment_message'] = chunk['review_comment_message'].fillna('')
+                chunk['sentimento_previsto'] = pd.Categorical(sentimentos, categories=ROTULOS_SENTIMENTO)
+                if explicador is not None:
+                    chunk[COLUNA_EXPLICACAO] = explicacoes
+                df_resultado = chunk[colunas_saida(explicador)]
+                with etapa('gravar', len(df_resultado)):
+                    escrever(df_resultado)
+
+                total_linhas += len(df_resultado)
+                total_classificadas += int(novas.sum())
+                print(f"Bloco {numero}: {len(df_resultado)} linhas, {int(novas.sum())} classificadas, "
+                      f"{len(df_resultado) - int(novas.sum())} reaproveitadas")
+                if visualizacao is None:
+                    visualizacao = df_resultado.head()
+    finally:
+        conexao.close()
+
+    duracao_total = time.perf_counter() - inicio_total
+    print(f"Total: {total_linhas} linhas em {duracao_total:.2f}s; {total_classificadas} classificadas "
+          f"e {total_linhas - total_classificadas} reaproveitadas do banco")
+    return visualizacao
+
 # --- Bloco de Execução Principal ---
 if __name__ == "__main__":
+    ligar_instrumentacao()
+    # 'completo' classifica o arquivo inteiro de uma vez; 'streaming' classifica em blocos de 'tamanho_chunk'
+    # linhas; 'incremental' também usa blocos, mas só classifica as reviews novas ou alteradas desde a última execução
+    modo = 'streaming'
+    tamanho_chunk = 50000
+    # True adiciona a coluna 'termos_negativos': as palavras que mais pesaram em cada review negativa
+    explicar_negativas = False
+    # True adiciona a coluna 'classe_prevista' (negativo/neutro/positivo) com a cabeça multiclasse
+    # (modos 'completo' e 'streaming'; gere a cabeça com 'python multiclass_head.py')
+    classificar_neutras = False
+    # True atualiza as taxas de reviews negativas por categoria e por vendedor (sentiment_rollup.py) com a saída;
+    # só as reviews novas ou com previsão alterada mexem nos agregados
+    agregar_categorias_e_vendedores = False
+    # formato do arquivo de saída: 'csv', 'csv.gz', 'csv.zst' (requer zstandard) ou 'parquet' (requer pyarrow)
+    formato_saida = 'csv'
+    # True adiciona 'prob_negativo' e 'prob_positivo' (predict_proba do modelo; modos 'completo' e 'streaming')
+    incluir_probabilidades = False
+    # True acumula OOV, cobertura do vocabulário e distribuição das previsões e compara com o treino (drift_monitor.py)
+    monitorar = True
+
     try:
-        # Carrega modelo e vetorizador salvos
+        # Carrega o pipeline salvo (limpeza + vetorizador + modelo)
         print("Carregando modelo e vetorizador pré-treinados...")
-        modelo = joblib.load('./to_predict/modelo_sentimento.joblib')
-        vectorizer = joblib.load('./to_predict/vetorizador_tfidf.joblib')
+        with etapa('carregar modelo'):
+            pipeline, identificador_modelo = carregar_modelo()
+        explicador = None
+        if explicar_negativas:
+            explicador = criar_explicador(pipeline.named_steps['modelo'], pipeline.named_steps['tfidf'])
+        monitor = novo_monitor(pipeline.named_steps['tfidf']) if monitorar else None
+        modelo_multiclasse = None
+        if classificar_neutras:
+            if modo == 'incremental':
+                raise ValueError("a cabeça multiclasse não é suportada no modo 'incremental'; use 'completo' ou 'streaming'.")
+            modelo_multiclasse = carregar_cabeca_multiclasse(pipeline)
+        if incluir_probabilidades and modo == 'incremental':
+            raise ValueError("as probabilidades não ficam no banco do modo 'incremental'; use 'completo' ou 'streaming'.")
 
-        # Carrega o dataset original completo que vai ser classificado
         caminho_arquivo_original = 'csv/olist_order_reviews_dataset.csv'
-        df_original = pd.read_csv(caminho_arquivo_original)
-        
-        # Aplica a limpeza de texto
-        df_classificar = aplicar_limpeza_de_texto(df_original.copy())
-        
-        # Vetoriza os textos usando o vetorizador carregado
-        print("Vetorizando textos...")
-        textos_vetorizados = vectorizer.transform(df_classificar['texto_limpo'])
-
-        # Faz as previsões usando o modelo carregado
-        print("Classificando reviews...")
-        previsoes_finais = modelo.predict(textos_vetorizados)
-        
-        # Prepara a tabela de resultado
-        mapa_sentimento = {0: 'negativo', 1: 'positivo'}
-        df_classificar['sentimento_previsto'] = np.vectorize(mapa_sentimento.get)(previsoes_finais)
-        
-        df_resultado_final = df_classificar[[
-            'review_id', 'order_id', 'review_score', 
-            'review_comment_message', 'sentimento_previsto'
-        ]]
-        
-        # Salva o resultado final em um arquivo CSV
-        nome_arquivo_saida = 'final_reviews.csv'
-        df_resultado_final.to_csv(nome_arquivo_saida, index=False)
-        
+        nome_arquivo_saida = caminho_saida('final_reviews', formato_saida)
+
+        if modo == 'incremental':
+            df_visualizacao = classificar_incremental(caminho_arquivo_original, nome_arquivo_saida,
+                                                      pipeline, identificador_modelo, tamanho_chunk,
+                                                      explicador=explicador, monitor=monitor)
+        elif modo == 'streaming':
+            df_visualizacao = classificar_em_streaming(caminho_arquivo_original, nome_arquivo_saida,
+                                                       pipeline, tamanho_chunk, explicador, modelo_multiclasse,
+                                                       incluir_probabilidades, monitor)
+        else:
+            # Carrega o dataset original completo que vai ser classificado
+            with etapa('carregar') as registro:
+                df_original = ler_tabela(caminho_arquivo_original, colunas=COLUNAS_REVIEWS_ML)
+                registro['linhas_saida'] = len(df_original)
+            df_resultado_final = classificar_reviews(df_original, pipeline, explicador=explicador,
+                                                     modelo_multiclasse=modelo_multiclasse,
+                                                     incluir_probabilidades=incluir_probabilidades, monitor=monitor)
+
+            # Salva o resultado final, em blocos, no formato escolhido
+            with etapa('gravar', len(df_resultado_final)), abrir_escritor(nome_arquivo_saida) as escrever:
+                for inicio in range(0, len(df_resultado_final), tamanho_chunk):
+                    escrever(df_resultado_final.iloc[inicio:inicio + tamanho_chunk])
+            df_visualizacao = df_resultado_final.head()
+
         print(f"\nProcesso concluído! Tabela final salva como '{nome_arquivo_saida}'")
+        if agregar_categorias_e_vendedores:
+            agregar_arquivo(nome_arquivo_saida, tamanho_chunk)
+        if monitor is not None:
+            escrever_relatorio_monitor(monitor)
         print("\nVisualização do resultado:")
-        print(df_resultado_final.head())
+        print(df_visualizacao)
 
     except FileNotFoundError:
         print("ERRO: Certifique-se que os arquivos 'modelo_sentimento.joblib',")
         print("'vetorizador_tfidf.joblib' e 'olist_order_reviews_dataset.csv' estão na mesma pasta.")
+    except ValueError as e:
+        # artefato recusado pelo carregador (versão ou limpeza diferentes das do treino)
+        print(f"ERRO: {e}")
     except Exception as e:
-        print(f"Ocorreu um erro inesperado: {e}")
\ No newline at end of file
+        print(f"Ocorreu um erro inesperado: {e}")
@@ -0,0 +1,77 @@
+# explicação por review: quais palavras mais pesaram na previsão de cada review.
+# num modelo linear sobre TF-IDF, a contribuição de um termo é o seu valor na linha TF-IDF vezes o coeficiente.
+# a explicação parte da matriz TF-IDF que a classificação já calculou (sem limpar nem tokenizar de novo):
+# é só multiplicar os valores da matriz esparsa pelos coeficientes e escolher os maiores de cada linha.
+
+import sys
+
+import numpy as np
+
+TOP_TERMOS = 5
+
+# -------- TABELA TERMO -> PESO ----------
+def criar_explicador(modelo, vectorizer, top_termos=TOP_TERMOS):
+    """
+    Guarda os termos do vocabulário e os coeficientes do modelo, na ordem das colunas do TF-IDF.
+    O modelo precisa ser linear (coef_ com uma linha, coeficientes a favor da classe 1 = positivo).
+    """
+    return {
+        'termos': vectorizer.get_feature_names_out(),
+        'coef': np.asarray(modelo.coef_[0], dtype=np.float64),
+        'intercepto': float(modelo.intercept_[0]),
+        'top_termos': top_termos,
+    }
+
+def contribuicoes(explicador, X):
+    """
+    Matriz esparsa (CSR) com a contribuição de cada termo de cada linha TF-IDF de X para a função de decisão:
+    a soma de uma linha mais o intercepto é o decision_function do modelo. Positivo puxa para 'positivo'.
+    """
+    X = X.tocsr(copy=True)
+    X.data = X.data * explicador['coef'][X.indices]
+    return X
+
+# -------- EXPLICAÇÃO EM LOTE ----------
+def explicar(explicador, X, sentido=-1):
+    """
+    Para cada linha TF-IDF de X, retorna a lista [(termo, contribuição), ...] dos até 'top_termos' termos que mais
+    empurraram a decisão no 'sentido' pedido (-1 = para negativo, 1 = para positivo), do maior para o menor.
+    'sentido' também pode ser um array com um valor por linha (ex.: o sinal da previsão de cada review).
+    """
+    X = contribuicoes(explicador, X)
+    linhas = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+    favor = X.data * np.broadcast_to(sentido, X.shape[0])[linhas]
+
+    # um único lexsort sobre os termos presentes no lote: agrupa por linha e ordena pela contribuição
+    mantidos = np.flatnonzero(favor > 0)
+    ordem = mantidos[np.lexsort((-favor[mantidos], linhas[mantidos]))]
+    linhas_ordenadas = linhas[ordem]
+    inicio_linha = np.searchsorted(linhas_ordenadas, linhas_ordenadas, side='left')
+    ordem = ordem[np.arange(len(ordem)) - inicio_linha < explicador['top_termos']]
+
+    explicacoes = [[] for _ in range(X.shape[0])]
+    termos = explicador['termos']
+    for linha, indice, valor in zip(linhas[ordem], X.indices[ordem], X.data[ordem]):
+        explicacoes[linha].append((termos[indice], float(valor)))
+    return explicacoes
+
+def formatar_explicacao(explicacao):
+    # [('ruim', -1.23), ('atraso', -0.8)] -> 'ruim (-1.23); atraso (-0.80)'
+    return '; '.join(f"{termo} ({valor:.2f})" for termo, valor in explicacao)
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    # explica os comentários passados na linha de comando com o pipeline salvo
+    from review_classification import carregar_modelo
+
+    try:
+        pipeline, _ = carregar_modelo()
+        comentarios = sys.argv[1:] or ["Produto veio com defeito e a entrega atrasou, péssimo atendimento"]
+        explicador = criar_explicador(pipeline.named_steps['modelo'], pipeline.named_steps['tfidf'])
+        X = pipeline[:-1].transform(comentarios) # limpeza + TF-IDF
+        previsoes = pipeline.named_steps['modelo'].predict(X)
+        for comentario, previsao, explicacao in zip(comentarios, previsoes, explicar(explicador, X, np.where(previsoes == 1, 1, -1))):
+            print(f"\n'{comentario}' -> {'positivo' if previsao == 1 else 'negativo'}")
+            print(f"  {formatar_explicacao(explicacao) or '(nenhum termo do vocabulário)'}")
+    except FileNotFoundError:
+        print("ERRO: Certifique-se que 'modelo_sentimento.joblib' e 'vetorizador_tfidf.joblib' estão em ./to_predict/")
@@ -0,0 +1,194 @@
+# serviço HTTP/JSON para classificar reviews assim que são enviadas.
+# o pipeline de ./to_predict/ (limpeza + vetorizador + modelo) é carregado uma única vez, e as requisições que
+# chegam ao mesmo tempo são agrupadas (micro-lotes) em uma única chamada de predict_proba.
+#
+# uso:   python scoring_service.py [porta]
+#   POST /classificar   {"texto": "..."}  ou  {"textos": ["...", "..."]}
+#   GET  /metricas      latência p50/p99, vazão e tamanho médio dos lotes
+
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from review_classification import carregar_modelo
+
+JANELA_LOTE = 0.005 # segundos que o primeiro texto de um lote espera por outros
+TAMANHO_MAXIMO_LOTE = 256
+AMOSTRAS_LATENCIA = 10000 # latências guardadas para o cálculo dos percentis
+MAPA_SENTIMENTO = {0: 'negativo', 1: 'positivo'}
+
+# -------- ESTADO DO SERVIÇO ----------
+def criar_estado(pipeline):
+    return {
+        'pipeline': pipeline,
+        'fila': asyncio.Queue(),
+        'latencias': deque(maxlen=AMOSTRAS_LATENCIA),
+        'inicio': time.perf_counter(),
+        'requisicoes': 0,
+        'textos': 0,
+        'lotes': 0,
+    }
+
+def metricas(estado):
+    """
+    Resume os contadores do serviço: percentis de latência (ms), vazão e tamanho médio dos lotes.
+    """
+    latencias = np.array(estado['latencias']) * 1000
+    tempo_ativo = time.perf_counter() - estado['inicio']
+    return {
+        'requisicoes': estado['requisicoes'],
+        'textos_classificados': estado['textos'],
+        'lotes': estado['lotes'],
+        'tamanho_medio_lote': estado['textos'] / estado['lotes'] if estado['lotes'] else 0.0,
+        'latencia_p50_ms': float(np.percentile(latencias, 50)) if len(latencias) else None,
+        'latencia_p99_ms': float(np.percentile(latencias, 99)) if len(latencias) else None,
+        'requisicoes_por_segundo': estado['requisicoes'] / tempo_ativo,
+        'tempo_ativo_s': tempo_ativo,
+    }
+
+# -------- MICRO-LOTES ----------
+def classificar_lote(pipeline, textos):
+    # uma única chamada de limpeza + transform + predict_proba para o lote inteiro
+    probabilidades = pipeline.predict_proba(textos)
+    indice_positivo = list(pipeline.classes_).index(1)
+    return probabilidades[:, indice_positivo]
+
+async def processar_lotes(estado):
+    """
+    Tarefa de fundo: junta os textos pendentes por até JANELA_LOTE segundos (ou TAMANHO_MAXIMO_LOTE textos)
+    e classifica o lote em uma thread, sem travar o loop de eventos.
+    """
+    fila = estado['fila']
+    loop = asyncio.get_running_loop()
+    while True:
+        pendentes = [await fila.get()]
+        # um erro em um lote (ou ao juntá-lo) só falha as requisições do lote; a tarefa continua atendendo as próximas
+        try:
+            limite = loop.time() + JANELA_LOTE
+            while len(pendentes) < TAMANHO_MAXIMO_LOTE:
+                restante = limite - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    pendentes.append(await asyncio.wait_for(fila.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+
+            textos = [texto for texto, _ in pendentes]
+            probabilidades = await loop.run_in_executor(None, classificar_lote, estado['pipeline'], textos)
+            estado['lotes'] += 1
+            estado['textos'] += len(textos)
+            for (_, futuro), probabilidade in zip(pendentes, probabilidades):
+                if not futuro.done(): # cancelado se o cliente desconectou
+                    futuro.set_result(float(probabilidade))
+        except Exception as erro:
+            print(f"Erro ao classificar um lote de {len(pendentes)} texto(s): {erro!r}")
+            for _, futuro in pendentes:
+                if not futuro.done():
+                    futuro.set_exception(erro)
+
+async def classificar_textos(estado, textos):
+    loop = asyncio.get_running_loop()
+    futuros = [loop.create_future() for _ in textos]
+    for texto, futuro in zip(textos, futuros):
+        estado['fila'].put_nowait((texto, futuro))
+    probabilidades = await asyncio.gather(*futuros)
+    return [{'sentimento': MAPA_SENTIMENTO[int(p > 0.5)], 'probabilidade_positivo': p} for p in probabilidades]
+
+# -------- HTTP ----------
+async def ler_requisicao(reader):
+    # lê uma requisição HTTP/1.1 simples (linha inicial, cabeçalhos e corpo com Content-Length)
+    linha = await reader.readline()
+    if not linha:
+        return None
+    metodo, caminho, _ = linha.decode('latin-1').split(' ', 2)
+    cabecalhos = {}
+    while True:
+        linha = await reader.readline()
+        if linha in (b'\r\n', b'\n', b''):
+            break
+        nome, valor = linha.decode('latin-1').split(':', 1)
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    corpo = await reader.readexactly(int(cabecalhos.get('content-length', 0)))
+    return metodo, caminho, cabecalhos, corpo
+
+def montar_resposta(status, conteudo):
+    corpo = json.dumps(conteudo, ensure_ascii=False).encode('utf-8')
+    return (f"HTTP/1.1 {status}\r\nContent-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corpo)}\r\n\r\n").encode('latin-1') + corpo
+
+async def responder(estado, metodo, caminho, corpo):
+    if metodo == 'GET' and caminho == '/metricas':
+        return montar_resposta('200 OK', metricas(estado))
+    if metodo != 'POST' or caminho != '/classificar':
+        return montar_resposta('404 Not Found', {'erro': 'use POST /classificar ou GET /metricas'})
+
+    inicio = time.perf_counter()
+    try:
+        dados = json.loads(corpo or b'{}')
+        textos = dados['textos'] if 'textos' in dados else [dados['texto']]
+    except (ValueError, KeyError, TypeError):
+        textos = None
+    # só texto (ou null, tratado como comentário vazio); uma string em 'textos' não vira uma lista de caracteres
+    if not isinstance(textos, list) or not all(texto is None or isinstance(texto, str) for texto in textos):
+        return montar_resposta('400 Bad Request', {'erro': 'envie {"texto": "..."} ou {"textos": ["...", ...]}'})
+    textos = ['' if texto is None else texto for texto in textos]
+
+    try:
+        resultados = await classificar_textos(estado, textos)
+    except Exception as erro: # o lote falhou (ver processar_lotes)
+        return montar_resposta('500 Internal Server Error', {'erro': f"falha ao classificar: {erro}"})
+    estado['requisicoes'] += 1
+    estado['latencias'].append(time.perf_counter() - inicio)
+    return montar_resposta('200 OK', {'resultados': resultados} if 'textos' in dados else resultados[0])
+
+async def atender_conexao(estado, reader, writer):
+    # conexões keep-alive: atende requisições até o cliente fechar
+    try:
+        while True:
+            requisicao = await ler_requisicao(reader)
+            if requisicao is None:
+                break
+            metodo, caminho, cabecalhos, corpo = requisicao
+            writer.write(await responder(estado, metodo, caminho, corpo))
+            await writer.drain()
+            if cabecalhos.get('connection', '').lower() == 'close':
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def iniciar_servico(pipeline, host='127.0.0.1', porta=8000):
+    """
+    Sobe o servidor e a tarefa de micro-lotes; retorna (servidor, estado, tarefa_lotes).
+    """
+    estado = criar_estado(pipeline)
+    tarefa_lotes = asyncio.create_task(processar_lotes(estado))
+    servidor = await asyncio.start_server(lambda r, w: atender_conexao(estado, r, w), host, porta)
+    return servidor, estado, tarefa_lotes
+
+async def main(porta):
+    print("Carregando modelo e vetorizador pré-treinados...")
+    pipeline, _ = carregar_modelo()
+
+    servidor, _, _ = await iniciar_servico(pipeline, porta=porta)
+    print(f"Serviço ouvindo em http://127.0.0.1:{porta} (POST /classificar, GET /metricas)")
+    async with servidor:
+        await servidor.serve_forever()
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    porta = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    try:
+        asyncio.run(main(porta))
+    except FileNotFoundError:
+        print("ERRO: Certifique-se que 'modelo_sentimento.joblib' e 'vetorizador_tfidf.joblib' estão em ./to_predict/")
+    except ValueError as erro:
+        print(f"ERRO: {erro}")
+    except KeyboardInterrupt:
+        print("\nServiço encerrado.")
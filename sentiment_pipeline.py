@@ -0,0 +1,149 @@
+# artefato único de inferência: limpeza + TfidfVectorizer + classificador em um Pipeline do sklearn,
+# salvo com versão e uma impressão digital (fingerprint) da configuração.
+# o treino e a classificação usam exatamente a mesma limpeza, e o carregamento recusa artefatos
+# cuja limpeza não bate com a do código atual.
+
+import hashlib
+import json
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
+
+from text_normalizer import normalize_many, configuracao_limpeza
+
+CAMINHO_PIPELINE = './to_predict/pipeline_sentimento.joblib'
+VERSAO_ARTEFATO = 1
+
+# -------- MONTAGEM DO PIPELINE ----------
+def preparar_textos(textos, remover_acento=True, stemizar=False):
+    """
+    Etapa de limpeza do pipeline: comentários ausentes viram '' e o restante passa pelo normalizador.
+    """
+    return normalize_many(['' if pd.isna(texto) else texto for texto in textos], remover_acento, stemizar=stemizar)
+
+def criar_pipeline(modelo, vectorizer, remover_acento=True, stemizar=False):
+    """
+    Junta a limpeza, o vetorizador e o modelo (já treinados) em um único Pipeline.
+    """
+    return Pipeline([
+        ('limpeza', FunctionTransformer(preparar_textos, kw_args={'remover_acento': remover_acento, 'stemizar': stemizar})),
+        ('tfidf', vectorizer),
+        ('modelo', modelo),
+    ])
+
+def fingerprint_pipeline(pipeline):
+    """
+    Impressão digital da configuração do pipeline: limpeza (versão, opções e stopwords atuais),
+    parâmetros do vetorizador e tipo do modelo.
+    """
+    kw_args = pipeline.named_steps['limpeza'].kw_args
+    descricao = {
+        'limpeza': configuracao_limpeza(kw_args['remover_acento'], kw_args.get('stemizar', False)),
+        'vetorizador': pipeline.named_steps['tfidf'].get_params(),
+        'modelo': type(pipeline.named_steps['modelo']).__name__,
+    }
+    texto = json.dumps(descricao, sort_keys=True, default=str)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+# -------- PREVISÃO COM ATALHO PARA COMENTÁRIOS VAZIOS ----------
+def vetorizar_com_atalho(pipeline, textos, devolver_limpos=False):
+    """
+    Limpa os textos e vetoriza só os que continuam com conteúdo depois da limpeza (ausentes e só espaços
+    nem passam pela limpeza). Retorna (X, vazios): X tem uma linha por texto não vazio, na ordem original,
+    e 'vazios' marca os textos que ficaram de fora. Com devolver_limpos=True, retorna também os textos limpos.
+    """
+    textos = np.array(['' if pd.isna(texto) else str(texto) for texto in textos], dtype=object)
+    limpos = np.full(len(textos), '', dtype=object)
+
+    com_conteudo = np.fromiter((bool(texto.strip()) for texto in textos), dtype=bool, count=len(textos))
+    if com_conteudo.any():
+        limpos[com_conteudo] = pipeline.named_steps['limpeza'].transform(textos[com_conteudo]).to_numpy()
+    vazios = limpos == ''
+    X = pipeline.named_steps['tfidf'].transform(limpos[~vazios])
+    return (X, vazios, limpos) if devolver_limpos else (X, vazios)
+
+def prever_cabeca(modelo, vectorizer, X, vazios):
+    """
+    Previsões de um modelo sobre a matriz de vetorizar_com_atalho. Texto vazio vira uma linha TF-IDF
+    zerada, que o modelo sempre classifica pelo intercepto: os vazios recebem essa previsão constante.
+    """
+    previsoes = np.full(len(vazios), modelo.predict(vectorizer.transform(['']))[0])
+    if X.shape[0]:
+        previsoes[~vazios] = modelo.predict(X)
+    return previsoes
+
+def prever_proba_cabeca(modelo, vectorizer, X, vazios):
+    """
+    Como prever_cabeca, mas com as probabilidades de cada classe (colunas na ordem de modelo.classes_).
+    """
+    if not hasattr(modelo, 'predict_proba'):
+        raise ValueError(f"O modelo {type(modelo).__name__} não tem predict_proba; não é possível gravar probabilidades.")
+    probabilidades = np.tile(modelo.predict_proba(vectorizer.transform(['']))[0], (len(vazios), 1))
+    if X.shape[0]:
+        probabilidades[~vazios] = modelo.predict_proba(X)
+    return probabilidades
+
+def prever_com_atalho(pipeline, textos, notas=None, fallback_vazio='constante'):
+    """
+    Igual a pipeline.predict(textos), mas só vetoriza e classifica os textos que continuam com conteúdo
+    depois da limpeza; os vazios (ausentes, só espaços ou só stopwords/pontuação) recebem a previsão
+    constante do modelo para texto vazio. Com fallback_vazio='nota', usam a nota da review ('notas'):
+    > 3 positivo, < 3 negativo (nota 3 fica com a previsão constante).
+    Retorna (previsoes, vazios), onde 'vazios' marca as linhas que pegaram o atalho.
+    """
+    X, vazios = vetorizar_com_atalho(pipeline, textos)
+    previsoes = prever_cabeca(pipeline.named_steps['modelo'], pipeline.named_steps['tfidf'], X, vazios)
+    return aplicar_fallback_vazio(previsoes, vazios, notas, fallback_vazio), vazios
+
+def aplicar_fallback_vazio(previsoes, vazios, notas, fallback_vazio):
+    # 'constante' mantém a previsão para texto vazio; 'nota' usa a nota nos vazios (> 3 positivo, < 3 negativo)
+    if fallback_vazio == 'nota':
+        notas = np.asarray(notas)
+        previsoes[vazios & (notas > 3)] = 1
+        previsoes[vazios & (notas < 3)] = 0
+    elif fallback_vazio != 'constante':
+        raise ValueError(f"fallback_vazio deve ser 'constante' ou 'nota', não '{fallback_vazio}'")
+    return previsoes
+
+# -------- SALVAR E CARREGAR ----------
+def salvar_pipeline(pipeline, caminho=CAMINHO_PIPELINE):
+    artefato = {
+        'versao': VERSAO_ARTEFATO,
+        'fingerprint': fingerprint_pipeline(pipeline),
+        'pipeline': pipeline,
+    }
+    joblib.dump(artefato, caminho)
+    print(f"Pipeline salvo em '{caminho}' (fingerprint {artefato['fingerprint'][:12]})")
+
+def carregar_pipeline(caminho=CAMINHO_PIPELINE):
+    """
+    Carrega o pipeline salvo, recusando artefatos de outra versão ou cuja configuração de limpeza
+    não corresponde à do código atual (o que faria o modelo receber textos diferentes dos do treino).
+    """
+    artefato = joblib.load(caminho)
+    if not isinstance(artefato, dict) or artefato.get('versao') != VERSAO_ARTEFATO:
+        raise ValueError(f"Artefato '{caminho}' não é um pipeline na versão {VERSAO_ARTEFATO}; treine novamente com comparison.py.")
+
+    fingerprint_atual = fingerprint_pipeline(artefato['pipeline'])
+    if fingerprint_atual != artefato['fingerprint']:
+        raise ValueError(f"O artefato '{caminho}' foi treinado com outra configuração de limpeza "
+                         f"(fingerprint {artefato['fingerprint'][:12]} != {fingerprint_atual[:12]}); treine novamente.")
+    return artefato['pipeline'], artefato['fingerprint']
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    # converte o par joblib atual (treinado pelo comparison.py, com remoção de acentos) para o pipeline único
+    # importa pelo nome do módulo para que o pickle referencie 'sentiment_pipeline.preparar_textos', e não '__main__'
+    from sentiment_pipeline import criar_pipeline, salvar_pipeline
+
+    caminho_saida = sys.argv[1] if len(sys.argv) > 1 else CAMINHO_PIPELINE
+    try:
+        modelo = joblib.load('./to_predict/modelo_sentimento.joblib')
+        vectorizer = joblib.load('./to_predict/vetorizador_tfidf.joblib')
+        salvar_pipeline(criar_pipeline(modelo, vectorizer), caminho_saida)
+    except FileNotFoundError:
+        print("ERRO: Certifique-se que 'modelo_sentimento.joblib' e 'vetorizador_tfidf.joblib' estão em ./to_predict/")
@@ -0,0 +1,225 @@
+# agregação das previsões de sentimento por categoria de produto e por vendedor (taxa de reviews negativas).
+# o caminho review -> pedido -> itens do pedido -> produto (categoria) / vendedor é resolvido por índices
+# pré-montados: cada pedido vira um código inteiro e os pares distintos (pedido, categoria) e (pedido, vendedor)
+# ficam ordenados por pedido, com o deslocamento de cada pedido (como as linhas de uma matriz CSR).
+# juntar um lote de previsões é uma busca no índice de pedidos e um np.repeat, e a contagem é uma única
+# passada de np.bincount por tabela, sem merges entre DataFrames.
+# o estado salvo guarda a contribuição de cada review: lotes novos (ou reclassificados) só somam a diferença.
+#
+# uso:   python sentiment_rollup.py [final_reviews.csv]
+# requer csv/olist_order_items_dataset.csv (itens dos pedidos da Olist), além de produtos, vendedores e tradução.
+
+import hashlib
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from data_access import ler_tabela
+from feature_cache import hash_arquivo
+from instrumentation import etapa, ligar_instrumentacao
+from output_writer import ler_saida_em_blocos
+
+CAMINHO_ITENS = './csv/olist_order_items_dataset.csv'
+CAMINHO_PRODUTOS = './csv/olist_products_dataset.csv'
+CAMINHO_VENDEDORES = './csv/olist_sellers_dataset.csv'
+CAMINHO_TRADUCAO = './csv/product_category_name_translation.csv'
+CAMINHO_ESTADO = './to_predict/agregados_sentimento.joblib'
+CAMINHO_AGREGADO_CATEGORIAS = 'agregado_categorias.csv'
+CAMINHO_AGREGADO_VENDEDORES = 'agregado_vendedores.csv'
+COLUNAS_PREVISOES = ['review_id', 'order_id', 'sentimento_previsto']
+VERSAO_AGREGADOS = 1
+SEM_CATEGORIA = 'sem_categoria'
+
+def fingerprint_tabelas(caminhos=(CAMINHO_ITENS, CAMINHO_PRODUTOS, CAMINHO_VENDEDORES, CAMINHO_TRADUCAO)):
+    # os índices valem enquanto as tabelas de itens, produtos, vendedores e tradução não mudarem
+    return hashlib.sha256(''.join(hash_arquivo(caminho) for caminho in caminhos).encode('utf-8')).hexdigest()
+
+# -------- ÍNDICES ----------
+def _indice_por_pedido(codigos_pedido, codigos_destino, n_destinos, n_pedidos):
+    """
+    Pares distintos (pedido, destino), ordenados por pedido. Retorna (inicio, destinos): os destinos do
+    pedido p são destinos[inicio[p]:inicio[p + 1]]. Códigos de destino negativos (sem cadastro) ficam de fora.
+    """
+    validos = codigos_destino >= 0
+    pares = np.unique(codigos_pedido[validos].astype(np.int64) * n_destinos + codigos_destino[validos])
+    pedidos, destinos = np.divmod(pares, n_destinos)
+    return np.searchsorted(pedidos, np.arange(n_pedidos + 1)), destinos.astype(np.int32)
+
+def montar_indices(fingerprint=None):
+    """
+    Lê itens, produtos, vendedores e a tradução das categorias uma vez e monta os índices por pedido.
+    """
+    itens = ler_tabela(CAMINHO_ITENS, colunas=['order_id', 'product_id', 'seller_id'])
+    produtos = ler_tabela(CAMINHO_PRODUTOS, colunas=['product_id', 'product_category_name'])
+    vendedores = ler_tabela(CAMINHO_VENDEDORES, colunas=['seller_id', 'seller_city', 'seller_state'])
+    traducao = ler_tabela(CAMINHO_TRADUCAO)
+
+    codigos_pedido, pedidos = pd.factorize(itens['order_id'].astype(str))
+    # produto -> categoria e vendedor -> linha do cadastro por busca em índice (-1 quando não há cadastro)
+    categorias = pd.Categorical(produtos['product_category_name'].astype(object).fillna(SEM_CATEGORIA))
+    posicao_produto = pd.Index(produtos['product_id'].astype(str)).get_indexer(itens['product_id'].astype(str))
+    codigos_categoria = np.where(posicao_produto >= 0, categorias.codes[posicao_produto], -1)
+    codigos_vendedor = pd.Index(vendedores['seller_id'].astype(str)).get_indexer(itens['seller_id'].astype(str))
+
+    traducoes = traducao.set_index('product_category_name')['product_category_name_english']
+    tabela_categorias = pd.DataFrame({'categoria': categorias.categories.astype(str)})
+    tabela_categorias['categoria_ingles'] = tabela_categorias['categoria'].map(traducoes).fillna(tabela_categorias['categoria'])
+    tabela_vendedores = vendedores.astype({'seller_id': str}).reset_index(drop=True)
+
+    return {
+        'fingerprint': fingerprint or fingerprint_tabelas(),
+        'pedidos': pd.Index(pedidos),
+        'categorias': tabela_categorias,
+        'vendedores': tabela_vendedores,
+        'categoria': _indice_por_pedido(codigos_pedido, codigos_categoria, len(tabela_categorias), len(pedidos)),
+        'vendedor': _indice_por_pedido(codigos_pedido, codigos_vendedor, len(tabela_vendedores), len(pedidos)),
+    }
+
+# -------- CONTAGEM ----------
+def _contar(indice, n_destinos, posicoes, negativas):
+    """
+    Conta reviews e negativas por destino (categoria ou vendedor) para as reviews dos pedidos em 'posicoes'.
+    Cada review entra uma vez em cada destino distinto do seu pedido. Retorna um array (n_destinos, 2):
+    [não negativas, negativas].
+    """
+    inicio, destinos = indice
+    validas = posicoes >= 0 # pedidos sem itens cadastrados ficam de fora
+    posicoes, negativas = posicoes[validas], negativas[validas]
+    quantidades = inicio[posicoes + 1] - inicio[posicoes]
+    linhas = np.repeat(np.arange(len(posicoes)), quantidades)
+    deslocamentos = np.arange(len(linhas)) - np.repeat(np.cumsum(quantidades) - quantidades, quantidades)
+    destinos_linhas = destinos[np.repeat(inicio[posicoes], quantidades) + deslocamentos]
+    # uma única passada: a chave destino * 2 + negativa conta as reviews e as negativas de uma vez
+    contagem = np.bincount(destinos_linhas.astype(np.int64) * 2 + negativas[linhas], minlength=2 * n_destinos)
+    return contagem.reshape(n_destinos, 2)
+
+def _aplicar(estado, order_ids, negativas, sinal):
+    indices = estado['indices']
+    posicoes = indices['pedidos'].get_indexer(np.asarray(order_ids, dtype=object))
+    negativas = np.asarray(negativas, dtype=np.int64)
+    estado['contagem_categorias'] += sinal * _contar(indices['categoria'], len(indices['categorias']), posicoes, negativas)
+    estado['contagem_vendedores'] += sinal * _contar(indices['vendedor'], len(indices['vendedores']), posicoes, negativas)
+
+def novo_estado(indices):
+    return {
+        'versao': VERSAO_AGREGADOS,
+        'indices': indices,
+        'contagem_categorias': np.zeros((len(indices['categorias']), 2), dtype=np.int64),
+        'contagem_vendedores': np.zeros((len(indices['vendedores']), 2), dtype=np.int64),
+        # contribuição de cada review já contada, indexada por (review_id, order_id)
+        'contribuicoes': pd.Series([], dtype=np.int8, name='negativa',
+                                   index=pd.MultiIndex.from_arrays([[], []], names=['review_id', 'order_id'])),
+    }
+
+def atualizar_agregados(estado, previsoes):
+    """
+    Soma ao estado um lote de previsões (review_id, order_id, sentimento_previsto). Reviews já contadas só
+    mexem nos agregados se a previsão mudou: a contribuição antiga é subtraída e a nova, somada.
+    Retorna quantas reviews do lote alteraram os agregados.
+    """
+    chaves = pd.MultiIndex.from_arrays([previsoes['review_id'].astype(str), previsoes['order_id'].astype(str)],
+                                       names=['review_id', 'order_id'])
+    lote = pd.Series((previsoes['sentimento_previsto'] == 'negativo').to_numpy(np.int8), index=chaves, name='negativa')
+    lote = lote[~lote.index.duplicated(keep='last')]
+
+    contribuicoes = estado['contribuicoes']
+    anteriores = contribuicoes.reindex(lote.index) # NaN nas reviews ainda não contadas
+    conhecidas = anteriores.notna().to_numpy()
+    mudaram = ~(conhecidas & (anteriores.to_numpy() == lote.to_numpy()))
+    if not mudaram.any():
+        return 0
+
+    antigas = anteriores[conhecidas & mudaram]
+    _aplicar(estado, antigas.index.get_level_values('order_id'), antigas.to_numpy(np.int64), -1)
+    novas = lote[mudaram]
+    _aplicar(estado, novas.index.get_level_values('order_id'), novas.to_numpy(np.int64), 1)
+    estado['contribuicoes'] = pd.concat([contribuicoes.drop(antigas.index), novas])
+    return int(mudaram.sum())
+
+# -------- ESTADO E TABELAS ----------
+def carregar_estado(caminho=CAMINHO_ESTADO):
+    """
+    Carrega os agregados salvos. Se as tabelas de itens/produtos/vendedores mudaram, monta índices novos
+    e reconta as contribuições guardadas com eles (sem precisar das previsões de novo).
+    """
+    fingerprint = fingerprint_tabelas()
+    try:
+        estado = joblib.load(caminho)
+    except FileNotFoundError:
+        estado = None
+    if not isinstance(estado, dict) or estado.get('versao') != VERSAO_AGREGADOS:
+        print("Montando os índices de pedidos, categorias e vendedores...")
+        return novo_estado(montar_indices(fingerprint))
+    if estado['indices']['fingerprint'] == fingerprint:
+        return estado
+
+    print("Tabelas de itens, produtos ou vendedores mudaram; montando os índices e recontando as reviews...")
+    novo = novo_estado(montar_indices(fingerprint))
+    contribuicoes = estado['contribuicoes']
+    _aplicar(novo, contribuicoes.index.get_level_values('order_id'), contribuicoes.to_numpy(np.int64), 1)
+    novo['contribuicoes'] = contribuicoes
+    return novo
+
+def salvar_estado(estado, caminho=CAMINHO_ESTADO):
+    joblib.dump(estado, caminho)
+
+def _tabela(cadastro, contagem, minimo_reviews):
+    tabela = cadastro.assign(reviews=contagem.sum(axis=1).astype(np.int32), negativas=contagem[:, 1].astype(np.int32))
+    tabela = tabela[tabela['reviews'] >= minimo_reviews]
+    tabela = tabela.assign(taxa_negativas=(tabela['negativas'] / tabela['reviews']).astype(np.float32))
+    return tabela.sort_values(['taxa_negativas', 'reviews'], ascending=False, ignore_index=True)
+
+def tabela_categorias(estado, minimo_reviews=1):
+    """
+    Reviews, negativas e taxa de negativas por categoria de produto (com o nome em inglês).
+    """
+    return _tabela(estado['indices']['categorias'], estado['contagem_categorias'], minimo_reviews)
+
+def tabela_vendedores(estado, minimo_reviews=1):
+    """
+    Reviews, negativas e taxa de negativas por vendedor (com cidade e estado).
+    """
+    return _tabela(estado['indices']['vendedores'], estado['contagem_vendedores'], minimo_reviews)
+
+def agregar_arquivo(caminho_previsoes, tamanho_bloco=50000, caminho_estado=CAMINHO_ESTADO):
+    """
+    Atualiza os agregados com as previsões de 'caminho_previsoes' (saída do review_classification.py, em
+    qualquer formato do output_writer.py), lidas em blocos, e grava as tabelas por categoria e por vendedor.
+    Só as reviews novas ou com previsão alterada desde a última execução mudam as contagens. Reviews que
+    saíram do arquivo não são descontadas: para recomeçar do zero, apague o arquivo de estado.
+    """
+    with etapa('carregar agregados'):
+        estado = carregar_estado(caminho_estado)
+    alteradas = 0
+    for bloco in ler_saida_em_blocos(caminho_previsoes, COLUNAS_PREVISOES, tamanho_bloco):
+        with etapa('agregar', len(bloco)) as registro:
+            registro['linhas_saida'] = atualizar_agregados(estado, bloco)
+        alteradas += registro['linhas_saida']
+
+    with etapa('gravar agregados'):
+        salvar_estado(estado, caminho_estado)
+        tabela_categorias(estado).to_csv(CAMINHO_AGREGADO_CATEGORIAS, index=False)
+        tabela_vendedores(estado).to_csv(CAMINHO_AGREGADO_VENDEDORES, index=False)
+    print(f"{alteradas} reviews novas ou alteradas entraram nos agregados "
+          f"({len(estado['contribuicoes'])} reviews no total).")
+    print(f"Agregados salvos em '{CAMINHO_AGREGADO_CATEGORIAS}' e '{CAMINHO_AGREGADO_VENDEDORES}'")
+    return estado
+
+# -------- EXECUÇÃO PRINCIPAL ------------------
+if __name__ == "__main__":
+    ligar_instrumentacao()
+    caminho_previsoes = sys.argv[1] if len(sys.argv) > 1 else 'final_reviews.csv'
+
+    try:
+        estado = agregar_arquivo(caminho_previsoes)
+        with pd.option_context('display.max_columns', None, 'display.width', 200):
+            print("\n--- CATEGORIAS COM MAIOR TAXA DE NEGATIVAS (mínimo de 30 reviews) ---")
+            print(tabela_categorias(estado, minimo_reviews=30).head(10))
+            print("\n--- VENDEDORES COM MAIOR TAXA DE NEGATIVAS (mínimo de 30 reviews) ---")
+            print(tabela_vendedores(estado, minimo_reviews=30).head(10))
+
+    except FileNotFoundError as erro:
+        print(f"ERRO: arquivo não encontrado ('{erro.filename}'). Gere '{caminho_previsoes}' com review_classification.py "
+              f"e coloque os CSVs da Olist (inclusive olist_order_items_dataset.csv) em ./csv/")
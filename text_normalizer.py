@@ -0,0 +1,129 @@
+# normalizador de texto compartilhado pelos scripts de treino e de classificação.
+# tudo que é caro (regex, tabela de tradução, stopwords) é construído uma única vez.
+# pandas e NLTK (este leva segundos para importar) só são importados quando usados, para que o
+# classificador compacto (compact_model.py) possa limpar textos carregando apenas numpy.
+
+import functools
+import os
+import re
+import string
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+# -------- OBJETOS PRÉ-COMPILADOS ----------
+PADRAO_DIGITOS = re.compile(r'\d+')
+TABELA_PONTUACAO = str.maketrans('', '', string.punctuation)
+
+# incrementar quando a lógica de limpeza mudar, para invalidar caches e artefatos antigos
+VERSAO_LIMPEZA = 1
+
+# radicais (stemming) guardados por palavra: o vocabulário das reviews se repete muito, então cada palavra
+# distinta passa pelo RSLP uma única vez; o limite evita que textos com muito lixo façam o cache crescer sem fim
+TAMANHO_CACHE_RADICAIS = 200000
+
+_cache_stopwords = {}
+_cache_stemizador = {}
+
+def carregar_stopwords(idioma='portuguese'):
+    """
+    Retorna o conjunto de stopwords do idioma, lendo o corpus da NLTK só na primeira chamada.
+    """
+    if idioma not in _cache_stopwords:
+        from nltk.corpus import stopwords
+        _cache_stopwords[idioma] = frozenset(stopwords.words(idioma))
+    return _cache_stopwords[idioma]
+
+def configuracao_limpeza(remover_acento=True, stemizar=False):
+    """
+    Descreve a limpeza aplicada (versão, opções e stopwords usadas), para compor chaves de cache.
+    """
+    configuracao = {
+        'versao': VERSAO_LIMPEZA,
+        'remover_acento': remover_acento,
+        'stopwords': sorted(carregar_stopwords()),
+    }
+    if stemizar: # só aparece quando ligado, para não invalidar os caches e artefatos da limpeza sem radicais
+        configuracao['stemizar'] = 'RSLP'
+    return configuracao
+
+# -------- RADICAIS (STEMMING) ----------
+@functools.lru_cache(maxsize=TAMANHO_CACHE_RADICAIS)
+def radical(palavra):
+    """
+    Radical de uma palavra em português (stemmer RSLP da NLTK), calculado uma única vez por palavra distinta.
+    """
+    if 'rslp' not in _cache_stemizador:
+        from nltk.stem import RSLPStemmer
+        _cache_stemizador['rslp'] = RSLPStemmer()
+    return _cache_stemizador['rslp'].stem(palavra)
+
+def estatisticas_radicais():
+    """
+    Acertos, faltas e taxa de acerto do cache de radicais neste processo.
+    """
+    info = radical.cache_info()
+    chamadas = info.hits + info.misses
+    return {'acertos': info.hits, 'faltas': info.misses, 'palavras_em_cache': info.currsize,
+            'taxa_acerto': info.hits / chamadas if chamadas else 0.0}
+
+# --------  LIMPEZA DE TEXTO --------------------
+def remover_acentos(texto):
+    # 'rápida' em 'rapida'
+    if texto.isascii(): # texto ASCII não tem acento, evita o normalize
+        return texto
+    return ''.join(c for c in unicodedata.normalize('NFD', texto) if unicodedata.category(c) != 'Mn')
+
+def limpar_texto(texto, remover_acento=True, palavras_de_parada=None, stemizar=False):
+    """
+    Limpa um único texto: minúsculas, sem números, sem pontuação, sem stopwords, (opcional) reduzido aos
+    radicais e (opcional) sem acentos. Os radicais vêm antes da remoção de acentos, pois as regras do RSLP
+    dependem deles.
+    """
+    if palavras_de_parada is None:
+        palavras_de_parada = carregar_stopwords()
+    texto = PADRAO_DIGITOS.sub('', str(texto).lower())
+    texto = texto.translate(TABELA_PONTUACAO)
+    if stemizar:
+        texto = ' '.join([radical(palavra) for palavra in texto.split() if palavra not in palavras_de_parada])
+    else:
+        texto = ' '.join([palavra for palavra in texto.split() if palavra not in palavras_de_parada])
+    if remover_acento:
+        texto = remover_acentos(texto)
+    return texto
+
+def _normalizar_lista(valores, remover_acento=True, stemizar=False):
+    # limpa uma lista de textos, reaproveitando o resultado de textos repetidos
+    palavras_de_parada = carregar_stopwords()
+    unicos = {texto: limpar_texto(texto, remover_acento, palavras_de_parada, stemizar) for texto in dict.fromkeys(valores)}
+    return [unicos[texto] for texto in valores]
+
+def normalize_many(textos, remover_acento=True, n_workers=1, tamanho_chunk=20000, limiar_paralelo=100000, stemizar=False):
+    """
+    Limpa uma coleção de textos de uma vez e devolve uma Series (mantendo o índice de entrada).
+    Textos repetidos (ex.: 'bom', 'otimo') são limpos uma única vez e, com stemizar=True, cada palavra
+    distinta é reduzida ao radical uma única vez (cache em 'radical', um por processo).
+
+    Com n_workers > 1 (ou None para usar todos os núcleos) os textos são divididos em chunks de
+    'tamanho_chunk' e limpos em um pool de processos, cada um carregando as stopwords uma vez.
+    Abaixo de 'limiar_paralelo' textos a limpeza continua serial, pois subir o pool custa mais do que economiza.
+    """
+    import pandas as pd
+
+    if isinstance(textos, pd.Series):
+        indice = textos.index
+        valores = textos.tolist()
+    else:
+        valores = list(textos)
+        indice = None
+
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers <= 1 or len(valores) < limiar_paralelo:
+        limpos = _normalizar_lista(valores, remover_acento, stemizar)
+    else:
+        chunks = [valores[i:i + tamanho_chunk] for i in range(0, len(valores), tamanho_chunk)]
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(chunks)), initializer=carregar_stopwords) as pool:
+            # pool.map devolve os resultados na mesma ordem dos chunks
+            resultados = pool.map(_normalizar_lista, chunks, [remover_acento] * len(chunks), [stemizar] * len(chunks))
+            limpos = [texto for chunk in resultados for texto in chunk]
+
+    return pd.Series(limpos, index=indice, dtype=object)